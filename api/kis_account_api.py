@@ -1,7 +1,6 @@
 """
 KIS API 계좌 조회 관련 함수 (공식 문서 기반)
 """
-import time
 import pandas as pd
 from datetime import datetime
 from typing import Optional, Dict, List
@@ -134,8 +133,7 @@ def get_inquire_balance_lst(tr_cont: str = "", FK100: str = "", NK100: str = "",
         logger.debug("주식잔고조회 완료")
         return dataframe
     elif tr_cont in ("F", "M"):  # 다음 페이지 존재
-        logger.debug("다음 페이지 조회 중...")
-        time.sleep(0.1)
+        logger.debug("다음 페이지 조회 중...")  # 호출 간격은 kis_auth 토큰 버킷이 관리
         return get_inquire_balance_lst("N", FK100, NK100, dataframe)
 
     return dataframe
@@ -219,8 +217,7 @@ def get_inquire_balance_rlz_pl_lst(tr_cont: str = "", FK100: str = "", NK100: st
         logger.debug("실현손익조회 완료")
         return dataframe
     elif tr_cont in ("F", "M"):  # 다음 페이지 존재
-        logger.debug("다음 페이지 조회 중...")
-        time.sleep(0.1)
+        logger.debug("다음 페이지 조회 중...")  # 호출 간격은 kis_auth 토큰 버킷이 관리
         return get_inquire_balance_rlz_pl_lst("N", FK100, NK100, dataframe)
 
     return dataframe
@@ -276,8 +273,7 @@ def get_inquire_period_profit_lst(inqr_strt_dt: Optional[str] = None, inqr_end_d
         logger.debug("기간별손익조회 완료")
         return dataframe
     elif tr_cont in ("F", "M"):  # 다음 페이지 존재
-        logger.debug("다음 페이지 조회 중...")
-        time.sleep(0.1)
+        logger.debug("다음 페이지 조회 중...")  # 호출 간격은 kis_auth 토큰 버킷이 관리
         return get_inquire_period_profit_lst(inqr_strt_dt, inqr_end_dt, "N", FK100, NK100, dataframe)
 
     return dataframe
@@ -4,22 +4,212 @@ KIS API Manager - 모든 KIS API 모듈들을 통합 관리하는 메인 API 매
 한국투자증권 KIS API의 모든 기능을 통합하여 관리하고,
 스레들이 쉽게 사용할 수 있는 고수준 인터페이스를 제공합니다.
 """
+import os
 import time
+import logging
+import pickle
+import random
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, cast
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields as dataclass_fields
+from pathlib import Path
+import aiohttp
+import numpy as np
 import pandas as pd
+import requests
 
 from . import kis_auth
 from . import kis_account_api
 from . import kis_market_api
 from . import kis_order_api
 from utils.logger import setup_logger
-from utils.korean_time import now_kst
+from utils.korean_time import now_kst, is_before_market_open, parse_yyyymmdd
+from utils.async_utils import run_sync
+from utils.ttl_cache import TTLCache
+from config.market_hours import MarketHours
 
+logger = setup_logger(__name__)
 
-@dataclass
+
+# 여러 종목 현재가 동시 조회 시 최대 동시 요청 수
+MAX_CONCURRENT_PRICE_REQUESTS = 15
+
+# 블로킹 KIS 호출용 공유 스레드 풀 크기 (kis_auth 세션 커넥션 풀보다 작게 유지)
+KIS_IO_MAX_WORKERS = 8
+
+# 미체결(정정취소 가능) 주문 목록 캐시 유지 시간(초)
+_PENDING_ORDERS_TTL = 2.0
+_TRADABLE_AMOUNT_TTL = 30.0  # 매수가능수량 캐시 유지 시간(초)
+
+# health_check 네트워크 확인 결과 유지 시간(초)
+_HEALTHCHECK_TTL = 60.0
+
+# 재시도 대상 예외 (그 외 예외는 즉시 전달)
+_RETRIABLE_EXCEPTIONS = (requests.Timeout, requests.ConnectionError, kis_auth.RetriableAPIError)
+
+# 일봉/주봉/월봉 응답의 숫자 컬럼 (get_ohlcv_data에서 한 번에 숫자형 변환)
+_OHLCV_NUMERIC_COLS = [
+    'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'stck_clpr',
+    'acml_vol', 'acml_tr_pbmn', 'prdy_vrss', 'prtt_rate'
+]
+
+# 계좌 요약(output2) / 현재가(output) 응답에서 사용하는 숫자 컬럼
+_BALANCE_COLS = ['nass_amt', 'nxdy_excc_amt', 'scts_evlu_amt', 'tot_evlu_amt']
+_BALANCE_QUICK_COLS = _BALANCE_COLS + ['dnca_tot_amt', 'prvs_rcdl_excc_amt']
+_PRICE_COLS = ['stck_prpr', 'prdy_vrss', 'prdy_ctrt', 'acml_vol']
+
+
+# OHLCV 디스크 캐시 (종목/기간별 1파일, 증분 갱신)
+OHLCV_CACHE_DIR = Path("cache/ohlcv")
+# 증분 조회 시 마지막 봉 이전으로 되돌아가 재조회할 일수 (주봉/월봉은 진행 중인 봉 전체 갱신)
+_OHLCV_REFETCH_DAYS = {'D': 0, 'W': 7, 'M': 31}
+
+
+def _ohlcv_cache_path(stock_code: str, period: str) -> Path:
+    """OHLCV 캐시 파일 경로"""
+    return OHLCV_CACHE_DIR / period / f"{stock_code}.pkl"
+
+
+def _load_ohlcv_cache(stock_code: str, period: str) -> Optional[Dict[str, Any]]:
+    """OHLCV 캐시 로드 ({'data', 'covered_from', 'saved_at'}), 없거나 손상 시 None"""
+    cache_file = _ohlcv_cache_path(stock_code, period)
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.debug(f"OHLCV 캐시 로드 실패 {stock_code}: {e}")
+        return None
+
+
+def _save_ohlcv_cache(stock_code: str, period: str, df: pd.DataFrame,
+                      covered_from: str, saved_at: datetime) -> None:
+    """OHLCV 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+    cache_file = _ohlcv_cache_path(stock_code, period)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'data': df, 'covered_from': covered_from, 'saved_at': saved_at},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug(f"OHLCV 캐시 저장 실패 {stock_code}: {e}")
+
+
+def _last_market_close(now: datetime) -> datetime:
+    """가장 최근 장 마감 시각 (주말 제외, 공휴일은 고려하지 않음)"""
+    close_time = MarketHours.get_market_hours('KRX', now)['market_close']
+    candidate = now.replace(hour=close_time.hour, minute=close_time.minute, second=0, microsecond=0)
+    if now < candidate:
+        candidate -= timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate -= timedelta(days=1)
+    return candidate
+
+
+def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV 응답 정제 (날짜 파싱, 정렬, 숫자 컬럼 변환)"""
+    # API 응답으로 새로 만든 DataFrame이므로 복사 없이 직접 변환
+    df['stck_bsop_date'] = pd.to_datetime(df['stck_bsop_date'], format='%Y%m%d', cache=True)
+    df.sort_values('stck_bsop_date', inplace=True, ignore_index=True)
+    
+    # 숫자 컬럼 일괄 변환 (거래대금 등 큰 값의 정밀도를 위해 float64 유지)
+    num_cols = [col for col in _OHLCV_NUMERIC_COLS if col in df.columns]
+    if num_cols:
+        df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce')
+    return df
+
+
+def _first_row_values(df: pd.DataFrame, cols: List[str]) -> List[float]:
+    """첫 행에서 지정 컬럼을 한 번에 숫자로 변환 (없거나 변환 불가한 값은 0)"""
+    values = pd.to_numeric(df.iloc[0].reindex(cols), errors='coerce').fillna(0).astype(float)
+    return values.tolist()
+
+
+def _record_values(record: Dict[str, Any], cols: List[str]) -> List[float]:
+    """응답 레코드(dict)에서 지정 필드를 숫자로 변환 (없거나 변환 불가한 값은 0)"""
+    values = []
+    for col in cols:
+        try:
+            value = float(record.get(col))
+        except (TypeError, ValueError):
+            value = 0.0
+        values.append(value if value == value else 0.0)  # NaN -> 0
+    return values
+
+
+# 체결 내역에서 빈 값으로 취급하는 문자열
+_EMPTY_SENTINELS = frozenset({'', '-', 'None', 'nan'})
+
+# 체결 내역 수량 필드 (KIS API 응답 시점에 따라 다른 필드명 사용 - API 문서 기준 우선순위 순)
+_CCLD_FIELDS = ('tot_ccld_qty', 'ccld_qty', 'cnc_cfrm_qty')
+_ORD_FIELDS = ('ord_qty', 'ord_qty_org')
+
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+
+def _to_int_qty(value: Any) -> int:
+    """수량 문자열을 정수로 변환 (정수 문자열은 float 변환 생략, 변환 불가 시 0)"""
+    s = str(value).translate(_STRIP_COMMAS).strip()
+    if s.isdigit() or (s[:1] == '-' and s[1:].isdigit()):
+        return int(s)
+    if not s:
+        return 0
+    try:
+        return int(float(s))
+    except (ValueError, OverflowError):
+        logger.warning("⚠️ 수량 변환 실패 (0으로 처리): %r", value)
+        return 0
+
+
+def _coalesce_qty_raw(df: pd.DataFrame, fields: Tuple[str, ...]) -> pd.Series:
+    """행마다 fields 순서대로 처음으로 비어 있지 않은 수량 문자열 선택 (없으면 NaN)"""
+    raw = pd.Series(pd.NA, index=df.index, dtype="string")
+    for field in fields:
+        if field not in df.columns:
+            continue
+        col = df[field].astype("string").str.strip()
+        raw = raw.fillna(col.where(~col.isin(_EMPTY_SENTINELS)))
+    return raw
+
+
+def _parse_qty(raw: pd.Series) -> np.ndarray:
+    """수량 문자열을 쉼표 제거 후 int64 배열로 한 번에 변환 (변환 불가 값은 0)"""
+    qty = pd.to_numeric(raw.str.replace(',', '', regex=False), errors='coerce')
+    invalid = qty.isna() & raw.notna()
+    if invalid.any():
+        logger.warning("⚠️ 체결량 변환 실패 %d건 (0으로 처리): %s", int(invalid.sum()), raw[invalid].tolist())
+    return qty.fillna(0).to_numpy(dtype=np.int64)
+
+
+def _qty_array(df: pd.DataFrame, fields: Tuple[str, ...]) -> np.ndarray:
+    """수량 컬럼을 한 번에 정수 배열로 변환 (행마다 fields 중 처음으로 비어 있지 않은 값 사용)"""
+    return _parse_qty(_coalesce_qty_raw(df, fields))
+
+
+def _fill_qty_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """체결량/주문수량 컬럼을 이어 붙여 to_numeric 한 번으로 변환 후 다시 분리"""
+    n = len(df)
+    raw = pd.concat([_coalesce_qty_raw(df, _CCLD_FIELDS), _coalesce_qty_raw(df, _ORD_FIELDS)],
+                    ignore_index=True)
+    nums = _parse_qty(raw)
+    return nums[:n], nums[n:]
+
+
+def _aggregate_fill_qty(ccld: np.ndarray, ord_: np.ndarray) -> Tuple[int, int]:
+    """체결량 합계와 마지막 유효(>0) 주문수량 계산 (int64 배열 대상, 문자열 변환은 호출 전에 완료)"""
+    total = int(ccld.sum())
+    valid = np.flatnonzero(ord_ > 0)
+    last_ord = int(ord_[valid[-1]]) if valid.size else 0
+    return total, last_ord
+
+
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """주문 결과 정보"""
     success: bool
@@ -29,7 +219,7 @@ class OrderResult:
     data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StockPrice:
     """주식 가격 정보"""
     stock_code: str
@@ -40,7 +230,7 @@ class StockPrice:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccountInfo:
     """계좌 정보"""
     account_balance: float
@@ -50,23 +240,134 @@ class AccountInfo:
     positions: List[Dict[str, Any]]
 
 
+@dataclass(slots=True, frozen=True)
+class OrderStatus:
+    """
+    주문 상태 조회 결과
+
+    주요 필드는 속성으로 접근하고, raw에는 KIS 응답 원본 레코드를 보관합니다.
+    기존 dict 기반 호출부 호환을 위해 status['tot_ccld_qty'], status.get(...)도 지원합니다.
+    """
+    odno: str
+    tot_ccld_qty: int = 0        # 총체결수량
+    rmn_qty: int = 0             # 잔여수량
+    ord_qty: int = 0             # 주문수량
+    cncl_yn: str = 'N'           # 취소여부
+    ord_dvsn: str = '00'         # 주문구분
+    sll_buy_dvsn_cd: str = '01'  # 매도매수구분
+    pdno: str = ''               # 종목코드
+    ord_unpr: str = '0'          # 주문단가
+    actual_unfilled: bool = False    # 체결 내역은 있으나 실제 미체결
+    status_unknown: bool = False     # 미체결/체결 내역 모두 없음 (취소 추정)
+    alternative_check: bool = False  # 체결 내역 처리 실패 후 대체 확인
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_record(cls, odno: str, record: Dict[str, Any], **values: Any) -> "OrderStatus":
+        """KIS 응답 레코드에서 주문 속성을 가져오고 values로 상태 필드 지정"""
+        return cls(
+            odno=odno,
+            ord_dvsn=record.get('ord_dvsn', '00'),
+            sll_buy_dvsn_cd=record.get('sll_buy_dvsn_cd', '01'),
+            pdno=record.get('pdno', ''),
+            ord_unpr=record.get('ord_unpr', '0'),
+            raw=record,
+            **values
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _ORDER_STATUS_FIELDS:
+            return getattr(self, key)
+        return self.raw.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _ORDER_STATUS_FIELDS:
+            return getattr(self, key)
+        return self.raw[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in _ORDER_STATUS_FIELDS or key in self.raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원본 레코드에 상태 필드를 덮어쓴 dict"""
+        data = dict(self.raw)
+        for name in _ORDER_STATUS_FIELD_NAMES:
+            data[name] = getattr(self, name)
+        return data
+
+    def to_kis_dict(self) -> Dict[str, Any]:
+        """KIS 응답 형식(수량은 문자열)의 dict"""
+        data = self.to_dict()
+        for name in _ORDER_STATUS_QTY_FIELDS:
+            data[name] = str(data[name])
+        return data
+
+
+_ORDER_STATUS_FIELD_NAMES = tuple(f.name for f in dataclass_fields(OrderStatus) if f.name != 'raw')
+_ORDER_STATUS_FIELDS = frozenset(_ORDER_STATUS_FIELD_NAMES)
+_ORDER_STATUS_QTY_FIELDS = ('tot_ccld_qty', 'rmn_qty', 'ord_qty')
+
+
+def _build_account_info(balance_obj: pd.DataFrame, holdings: Optional[List[Dict[str, Any]]]) -> AccountInfo:
+    """계좌 요약 + 보유 종목으로 AccountInfo 생성"""
+    # 데이터 파싱 (순자산, 매수가능금액, 보유주식평가액, 총평가액)
+    nass_amt, nxdy_excc_amt, scts_evlu_amt, tot_evlu_amt = _first_row_values(balance_obj, _BALANCE_COLS)
+    
+    return AccountInfo(
+        account_balance=nass_amt,  # 순자산
+        available_amount=nxdy_excc_amt,  # 매수가능금액
+        stock_value=scts_evlu_amt,  # 보유주식평가액
+        total_value=tot_evlu_amt,  # 총평가액
+        positions=cast(List[Dict[str, Any]], holdings or [])  # 이미 List[Dict] 형태
+    )
+
+
+def _parse_tradable_qty(result: Optional[pd.DataFrame]) -> Optional[int]:
+    """매수가능조회 응답에서 주문가능수량 추출"""
+    if result is None or result.empty:
+        return None
+    return int(result.iloc[0].get('ord_psbl_qty', 0))
+
+
 class KISAPIManager:
     """KIS API Manager - 모든 KIS API 기능을 통합 관리"""
     
+    # 주문조직번호 후보 필드 (우선순위 순)
+    _ORGNO_FIELDS = ('krx_fwdg_ord_orgno', 'ord_orgno', 'ord_gno_brno', 'orgn_odno')
+    
     def __init__(self):
         self.logger = setup_logger(__name__)
         self.is_initialized = False
         self.is_authenticated = False
         self.last_auth_time = None
+        self._token_expires_at = 0.0  # time.monotonic() 기준 토큰 만료 시각
+        self._auth_lock = threading.Lock()
         
         # API 호출 통계
         self.call_count = 0
         self.error_count = 0
-        self.last_call_time = time.time()
+        self._stats_cache_key: Optional[Tuple] = None      # 통계 캐시 키 (값이 바뀔 때만 재계산)
+        self._stats_cache_val: Dict[str, Any] = {}
+        
+        # health_check 결과 캐시 (monotonic 기준 확인 시각)
+        self._last_healthcheck_ts = 0.0
+        self._last_healthcheck_ok = False
         
         # 실패 재시도 설정
         self.max_retries = 3
-        self.retry_delay = 1.0
+        self.retry_backoff_base = 0.25  # 지수 백오프 기준(초)
+        self.retry_backoff_cap = 8.0    # 백오프 최대(초)
+        
+        # 미체결 주문 인덱스 캐시 (odno -> 주문 dict, monotonic 기준 만료 시각)
+        self._pending_orders_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending_orders_expires_at = 0.0
+        self._orgno_field: Optional[str] = None  # 마지막으로 사용된 주문조직번호 필드
+        
+        # 매수가능수량 캐시 ((종목코드, 10원 단위 가격) -> 수량)
+        self._tradable_amount_cache = TTLCache(maxsize=1024, ttl=_TRADABLE_AMOUNT_TTL)
+        
+        # 블로킹 API 호출 공유 스레드 풀 (HTTP 대기 중에는 GIL이 해제되므로 병렬 처리 가능)
+        self._executor = ThreadPoolExecutor(max_workers=KIS_IO_MAX_WORKERS, thread_name_prefix='kis-io')
         
     def initialize(self) -> bool:
         """API 매니저 초기화"""
@@ -96,6 +397,7 @@ class KISAPIManager:
             if kis_auth.auth():
                 self.is_authenticated = True
                 self.last_auth_time = now_kst()
+                self._token_expires_at = kis_auth.get_token_expires_at()
                 self.logger.info("✅ KIS 인증 성공")
                 return True
             else:
@@ -127,69 +429,90 @@ class KISAPIManager:
             self.logger.error(f"❌ KIS 설정 검증 오류: {e}")
             return False
     
+    def _is_token_valid(self) -> bool:
+        """캐시된 토큰 유효 여부 (만료 skew 이전까지만 유효)"""
+        return (self.is_authenticated and
+                time.monotonic() < self._token_expires_at - kis_auth.TOKEN_REFRESH_SKEW_SECONDS)
+
     def _ensure_authenticated(self) -> bool:
         """인증 상태 확인 및 재인증"""
-        if not self.is_authenticated:
-            return self._initialize_auth()
+        if self._is_token_valid():
+            return True
         
-        # 토큰 만료 확인 (1시간마다 재인증)
-        if self.last_auth_time and (now_kst() - self.last_auth_time).total_seconds() > 3600:
-            self.logger.info("토큰 만료 예정, 재인증 시도...")
+        # 동시 호출 시 토큰 발급이 한 번만 일어나도록 잠금 후 재확인
+        with self._auth_lock:
+            if self._is_token_valid():
+                return True
+            
+            if self.is_authenticated:
+                self.logger.info("토큰 만료 예정, 재인증 시도...")
             return self._initialize_auth()
-        
-        return True
     
-    def _call_api_with_retry(self, api_func, *args, **kwargs) -> Any:
-        """API 호출 with 재시도 로직"""
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """재시도 대기 시간 (지수 백오프 + full jitter, Retry-After 우선)"""
+        delay = random.uniform(0, min(self.retry_backoff_cap, self.retry_backoff_base * (2 ** attempt)))
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+    
+    def _call_api_with_retry(self, api_func, *args, retryable: bool = True, **kwargs) -> Any:
+        """
+        API 호출 with 재시도 로직
+        
+        Args:
+            retryable: False면 재시도하지 않음 (주문/취소 등 멱등하지 않은 호출)
+        
+        일시적 오류(타임아웃, 연결 오류, HTTP 429/5xx)와 응답 없음(None)만 재시도하며,
+        그 외 예외는 즉시 전달합니다.
+        """
         self.call_count += 1
+        attempts = self.max_retries if retryable else 1
         
-        for attempt in range(self.max_retries):
+        for attempt in range(attempts):
+            retry_after = None
             try:
                 # 인증 상태 확인
                 if not self._ensure_authenticated():
                     raise Exception("인증 실패")
                 
-                # 🆕 kis_auth의 _url_fetch가 이미 속도 제한을 처리하므로
-                # kis_api_manager의 _rate_limit()은 제거 (중복 제한 방지)
-                # 단, kis_auth를 거치지 않는 직접 호출의 경우에만 필요
-                # self._rate_limit()  # 주석 처리: kis_auth에서 이미 처리됨
+                # 속도 제한은 kis_auth의 공유 토큰 버킷에서 처리 (동기/비동기 공통)
                 
                 # 실제 API 호출
-                result = api_func(*args, **kwargs)
+                if retryable:
+                    with kis_auth.raise_retriable_errors():
+                        result = api_func(*args, **kwargs)
+                else:
+                    result = api_func(*args, **kwargs)
                 
                 # 성공 시 결과 반환
                 if result is not None:
                     return result
                 
-                # 결과가 None인 경우 재시도
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
+            except _RETRIABLE_EXCEPTIONS as e:
+                self.error_count += 1
+                self.logger.error(f"API 호출 실패 (시도 {attempt + 1}/{attempts}): {e}")
                 
-                return None
+                if attempt >= attempts - 1:
+                    raise
+                retry_after = getattr(e, 'retry_after', None)
                 
             except Exception as e:
                 self.error_count += 1
-                self.logger.error(f"API 호출 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
-                
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                
-                raise e
+                self.logger.error(f"API 호출 실패 (재시도 불가): {e}")
+                raise
+            
+            # 결과가 None이거나 일시적 오류인 경우 재시도
+            if attempt < attempts - 1:
+                time.sleep(self._backoff_delay(attempt, retry_after))
         
         return None
     
-    def _rate_limit(self):
-        """API 호출 속도 제한"""
-        current_time = time.time()
-        time_diff = current_time - self.last_call_time
-        
-        # 최소 간격 (60ms) 보장
-        if time_diff < 0.06:
-            time.sleep(0.06 - time_diff)
-        
-        self.last_call_time = time.time()
+    async def _call_api_async(self, api_func, *args, **kwargs) -> Any:
+        """블로킹 API 호출(HTTP + DataFrame 파싱)을 워커 스레드에서 실행하여 이벤트 루프 차단 방지"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: self._call_api_with_retry(api_func, *args, **kwargs)
+        )
     
     # ===========================================
     # 계좌 조회 API
@@ -205,21 +528,24 @@ class KISAPIManager:
             
             # 보유 종목 리스트 조회 (이제 List[Dict] 반환)
             holdings = self._call_api_with_retry(kis_market_api.get_existing_holdings)
-            if holdings is None:
-                holdings = []
             
-            # 데이터 파싱
-            balance_data = balance_obj.iloc[0] if not balance_obj.empty else {}
+            return _build_account_info(balance_obj, holdings)
             
-            account_info = AccountInfo(
-                account_balance=float(balance_data.get('nass_amt', 0)),  # 순자산
-                available_amount=float(balance_data.get('nxdy_excc_amt', 0)),  # 매수가능금액
-                stock_value=float(balance_data.get('scts_evlu_amt', 0)),  # 보유주식평가액
-                total_value=float(balance_data.get('tot_evlu_amt', 0)),  # 총평가액
-                positions=cast(List[Dict[str, Any]], holdings)  # 이미 List[Dict] 형태
+        except Exception as e:
+            self.logger.error(f"계좌 잔고 조회 실패: {e}")
+            return None
+    
+    async def get_account_balance_async(self) -> Optional[AccountInfo]:
+        """계좌 잔고 조회 (비동기 - 요약/보유종목을 워커 스레드에서 동시에 조회)"""
+        try:
+            balance_obj, holdings = await asyncio.gather(
+                self._call_api_async(kis_account_api.get_inquire_balance_obj),
+                self._call_api_async(kis_market_api.get_existing_holdings)
             )
+            if balance_obj is None or balance_obj.empty:
+                return None
             
-            return account_info
+            return _build_account_info(balance_obj, holdings)
             
         except Exception as e:
             self.logger.error(f"계좌 잔고 조회 실패: {e}")
@@ -234,24 +560,22 @@ class KISAPIManager:
                 return None
             
             # 데이터 파싱
-            balance_data = balance_obj.iloc[0] if not balance_obj.empty else {}
+            (nass_amt, nxdy_excc_amt, scts_evlu_amt, tot_evlu_amt,
+             dnca_tot_amt, prvs_rcdl_excc_amt) = _first_row_values(balance_obj, _BALANCE_QUICK_COLS)
             
             # 가용금액 계산: 예수금총금액 + 익일정산금액 + 가수도정산금액
-            dnca_tot_amt = float(balance_data.get('dnca_tot_amt', 0))  # 예수금총금액
-            nxdy_excc_amt = float(balance_data.get('nxdy_excc_amt', 0))  # 익일정산금액
-            prvs_rcdl_excc_amt = float(balance_data.get('prvs_rcdl_excc_amt', 0))  # 가수도정산금액
-            
             available_amount = nxdy_excc_amt
             
             account_info = AccountInfo(
-                account_balance=float(balance_data.get('nass_amt', 0)),  # 순자산
+                account_balance=nass_amt,  # 순자산
                 available_amount=available_amount,  # 매수가능금액 (3개 합계)
-                stock_value=float(balance_data.get('scts_evlu_amt', 0)),  # 보유주식평가액
-                total_value=float(balance_data.get('tot_evlu_amt', 0)),  # 총평가액
+                stock_value=scts_evlu_amt,  # 보유주식평가액
+                total_value=tot_evlu_amt,  # 총평가액
                 positions=[]  # 보유 종목 정보는 제외 (빠른 조회용)
             )
             
-            self.logger.debug(f"💰 계좌 잔고 빠른 조회: 예수금 {dnca_tot_amt:,.0f}원 + 익일정산 {nxdy_excc_amt:,.0f}원 + 가수도정산 {prvs_rcdl_excc_amt:,.0f}원 = 가용금액 {available_amount:,.0f}원")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"💰 계좌 잔고 빠른 조회: 예수금 {dnca_tot_amt:,.0f}원 + 익일정산 {nxdy_excc_amt:,.0f}원 + 가수도정산 {prvs_rcdl_excc_amt:,.0f}원 = 가용금액 {available_amount:,.0f}원")
             
             return account_info
             
@@ -259,21 +583,60 @@ class KISAPIManager:
             self.logger.error(f"계좌 잔고 빠른 조회 실패: {e}")
             return None
     
+    @staticmethod
+    def _tradable_amount_key(stock_code: str, price: float) -> tuple:
+        return (stock_code, int(price) // 10 * 10)
+    
+    def invalidate_tradable_amount_cache(self, stock_code: Optional[str] = None) -> None:
+        """매수가능수량 캐시 무효화 (주문/체결로 가용 현금이 바뀐 경우)"""
+        if stock_code is None:
+            self._tradable_amount_cache.invalidate()
+        else:
+            self._tradable_amount_cache.invalidate(lambda key: key[0] == stock_code)
+    
+    def invalidate_account_balance_cache(self) -> None:
+        """계좌 요약(보유 종목) 캐시 무효화 (체결로 잔고가 바뀐 경우)"""
+        kis_market_api.invalidate_account_balance_cache()
+    
     def get_tradable_amount(self, stock_code: str, price: float) -> Optional[int]:
-        """매수 가능 수량 조회"""
+        """매수 가능 수량 조회 (30초 캐시)"""
+        key = self._tradable_amount_key(stock_code, price)
+        cached = self._tradable_amount_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             result = self._call_api_with_retry(
                 kis_account_api.get_inquire_psbl_order,
                 stock_code, int(price)
             )
             
-            if result is None or result.empty:
-                return None
+            qty = _parse_tradable_qty(result)
+            if qty is not None:
+                self._tradable_amount_cache.set(key, qty)
+            return qty
             
-            data = result.iloc[0]
-            max_qty = int(data.get('ord_psbl_qty', 0))
+        except Exception as e:
+            self.logger.error(f"매수가능수량 조회 실패 {stock_code}: {e}")
+            return None
+    
+    async def get_tradable_amount_async(self, stock_code: str, price: float) -> Optional[int]:
+        """매수 가능 수량 조회 (비동기, 30초 캐시)"""
+        key = self._tradable_amount_key(stock_code, price)
+        cached = self._tradable_amount_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = await self._call_api_async(
+                kis_account_api.get_inquire_psbl_order,
+                stock_code, int(price)
+            )
             
-            return max_qty
+            qty = _parse_tradable_qty(result)
+            if qty is not None:
+                self._tradable_amount_cache.set(key, qty)
+            return qty
             
         except Exception as e:
             self.logger.error(f"매수가능수량 조회 실패 {stock_code}: {e}")
@@ -289,20 +652,20 @@ class KISAPIManager:
         try:
             result = self._call_api_with_retry(
                 kis_market_api.get_inquire_price,
-                "J", stock_code
+                "J", stock_code, as_dataframe=False
             )
             
-            if result is None or result.empty:
+            if not result:
                 return None
             
-            data = result.iloc[0]
+            stck_prpr, prdy_vrss, prdy_ctrt, acml_vol = _record_values(result, _PRICE_COLS)
             
             stock_price = StockPrice(
                 stock_code=stock_code,
-                current_price=float(data.get('stck_prpr', 0)),
-                change_amount=float(data.get('prdy_vrss', 0)),
-                change_rate=float(data.get('prdy_ctrt', 0)),
-                volume=int(data.get('acml_vol', 0)),
+                current_price=stck_prpr,
+                change_amount=prdy_vrss,
+                change_rate=prdy_ctrt,
+                volume=int(acml_vol),
                 timestamp=now_kst()
             )
             
@@ -312,71 +675,204 @@ class KISAPIManager:
             self.logger.error(f"현재가 조회 실패 {stock_code}: {e}")
             return None
     
+    async def get_current_price_async(self, session: aiohttp.ClientSession, stock_code: str,
+                                      semaphore: asyncio.Semaphore) -> Optional[StockPrice]:
+        """현재가 조회 (비동기)"""
+        async with semaphore:
+            result = await kis_market_api.get_inquire_price_async(session, "J", stock_code,
+                                                                  as_dataframe=False)
+
+        if not result:
+            return None
+
+        stck_prpr, prdy_vrss, prdy_ctrt, acml_vol = _record_values(result, _PRICE_COLS)
+
+        return StockPrice(
+            stock_code=stock_code,
+            current_price=stck_prpr,
+            change_amount=prdy_vrss,
+            change_rate=prdy_ctrt,
+            volume=int(acml_vol),
+            timestamp=now_kst()
+        )
+
+    async def _get_multi_prices_async(self, session: aiohttp.ClientSession, stock_codes: List[str],
+                                      semaphore: asyncio.Semaphore) -> Dict[str, StockPrice]:
+        """멀티종목 시세조회 1회분(최대 30종목) 조회 (비동기)"""
+        async with semaphore:
+            result = await kis_market_api.get_multi_price_async(session, stock_codes)
+
+        prices: Dict[str, StockPrice] = {}
+        if result is None or result.empty:
+            return prices
+
+        timestamp = now_kst()
+        for row in result.to_dict('records'):
+            stock_code = str(row.get('inter_shrn_iscd', '')).strip()
+            if not stock_code:
+                continue
+            prices[stock_code] = StockPrice(
+                stock_code=stock_code,
+                current_price=float(row.get('inter2_prpr') or 0),
+                change_amount=float(row.get('inter2_prdy_vrss') or 0),
+                change_rate=float(row.get('prdy_ctrt') or 0),
+                volume=int(row.get('acml_vol') or 0),
+                timestamp=timestamp
+            )
+        return prices
+
+    async def get_current_prices_async(self, stock_codes: List[str]) -> Dict[str, StockPrice]:
+        """
+        여러 종목 현재가 동시 조회
+
+        멀티종목 시세조회(30종목 단위)로 묶어 조회하고, 응답에서 누락된 종목만
+        단건 현재가 조회로 보완합니다. (호출 간격은 kis_auth 속도 제한에서 관리)
+        """
+        prices: Dict[str, StockPrice] = {}
+        if not stock_codes:
+            return prices
+
+        if not self._ensure_authenticated():
+            self.logger.error("인증 실패 - 현재가 일괄 조회 중단")
+            return prices
+
+        stock_codes = list(dict.fromkeys(stock_codes))
+        chunk_size = kis_market_api.MULTI_PRICE_MAX_CODES
+        chunks = [stock_codes[i:i + chunk_size] for i in range(0, len(stock_codes), chunk_size)]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRICE_REQUESTS)
+
+        async with kis_auth.create_async_session() as session:
+            results = await asyncio.gather(
+                *[self._get_multi_prices_async(session, chunk, semaphore) for chunk in chunks],
+                return_exceptions=True
+            )
+            for chunk, result in zip(chunks, results):
+                self.call_count += 1
+                if isinstance(result, BaseException):
+                    self.error_count += 1
+                    self.logger.error(f"멀티종목 시세조회 실패 ({len(chunk)}종목): {result}")
+                else:
+                    prices.update(result)
+
+            # 멀티 조회에서 빠진 종목은 단건 조회로 보완
+            missing = [code for code in stock_codes if code not in prices]
+            if missing:
+                self.logger.debug("멀티종목 시세 누락 %d종목 단건 조회", len(missing))
+                single_results = await asyncio.gather(
+                    *[self.get_current_price_async(session, code, semaphore) for code in missing],
+                    return_exceptions=True
+                )
+                for stock_code, result in zip(missing, single_results):
+                    self.call_count += 1
+                    if isinstance(result, BaseException):
+                        self.error_count += 1
+                        self.logger.error(f"현재가 조회 실패 {stock_code}: {result}")
+                    elif result:
+                        prices[stock_code] = result
+
+        return prices
+
     def get_current_prices(self, stock_codes: List[str]) -> Dict[str, StockPrice]:
         """여러 종목 현재가 조회"""
-        prices = {}
-        
-        for stock_code in stock_codes:
-            price = self.get_current_price(stock_code)
-            if price:
-                prices[stock_code] = price
-            
-            # API 호출 간격 조절
-            time.sleep(0.1)
-        
-        return prices
+        return run_sync(self.get_current_prices_async(stock_codes))
     
-    def get_ohlcv_data(self, stock_code: str, period: str = "D", days: int = 30) -> Optional[pd.DataFrame]:
+    def get_ohlcv_data(self, stock_code: str, period: str = "D", days: int = 30,
+                       force_refresh: bool = False) -> Optional[pd.DataFrame]:
         """
-        OHLCV 데이터 조회 (연속조회 지원)
+        OHLCV 데이터 조회 (연속조회 지원, 디스크 캐시 사용)
         
         Args:
             stock_code: 종목코드
             period: 기간 구분 (D:일봉, W:주봉, M:월봉)
             days: 조회 일수 (캘린더 기준)
                   - 250 거래일 필요 시 약 360 캘린더 일 필요
+            force_refresh: True면 캐시를 무시하고 전체 구간을 다시 조회
+        
+        캐시(cache/ohlcv/{period}/{code}.pkl)가 요청 구간을 포함하면 마지막 봉 이후의
+        증분만 조회하여 병합하고, 장 마감 이후 저장된 캐시는 네트워크 호출 없이 반환합니다.
         """
         try:
-            end_date = now_kst().strftime("%Y%m%d")
-            start_date = (now_kst() - timedelta(days=days)).strftime("%Y%m%d")
-            
-            # 캘린더 기준 days를 거래일로 환산 (약 70%)
-            estimated_trading_days = int(days * 0.7)
-            
-            # 100건 이상 필요 시 연속조회 사용
-            if estimated_trading_days > 100:
-                # 연속조회 함수 사용
-                # 요청된 거래일 수에 여유분(50) 추가하여 조회
-                target_count = estimated_trading_days + 50
-                result = kis_market_api.get_inquire_daily_itemchartprice_extended(
-                    div_code="J",
-                    itm_no=stock_code,
-                    inqr_strt_dt=start_date,
-                    inqr_end_dt=end_date,
-                    period_code=period,
-                    max_count=target_count  # 300건 제한 제거 (필요한 만큼 조회)
-                )
+            now = now_kst()
+            end_date = now.strftime("%Y%m%d")
+            start_date = (now - timedelta(days=days)).strftime("%Y%m%d")
+            
+            cache = None if force_refresh else _load_ohlcv_cache(stock_code, period)
+            cached_df = None
+            if cache is not None and cache['covered_from'] <= start_date and not cache['data'].empty:
+                cached_df = cache['data']
+            
+            if cached_df is not None and cache['saved_at'] >= _last_market_close(now):
+                # 마지막 장 마감 이후 저장된 캐시 → 새 봉이 없으므로 그대로 사용
+                df = cached_df
             else:
-                # 기존 단일 조회
-                result = self._call_api_with_retry(
-                    kis_market_api.get_inquire_daily_itemchartprice,
-                    "2", "J", stock_code, start_date, end_date, period
-                )
-            
-            if result is None or result.empty:
-                return None
-            
-            # 데이터 정제
-            df = result.copy()
-            df['stck_bsop_date'] = pd.to_datetime(df['stck_bsop_date'])
-            df = df.sort_values('stck_bsop_date')
+                fetch_start = start_date
+                if cached_df is not None:
+                    # 마지막 봉(장중 미완성 가능)부터 다시 조회 - 주봉/월봉은 해당 기간 시작일부터
+                    last_bar = cached_df['stck_bsop_date'].max() - timedelta(days=_OHLCV_REFETCH_DAYS.get(period, 0))
+                    fetch_start = max(start_date, last_bar.strftime("%Y%m%d"))
+                
+                fetched = self._fetch_ohlcv(stock_code, period, fetch_start, end_date)
+                if fetched is None or fetched.empty:
+                    if cached_df is None:
+                        return None
+                    df = cached_df
+                else:
+                    fetched = _normalize_ohlcv(fetched)
+                    if cached_df is not None:
+                        # 재조회 구간은 새 데이터로 교체
+                        kept = cached_df[cached_df['stck_bsop_date'] < pd.Timestamp(fetch_start)]
+                        df = pd.concat([kept, fetched], ignore_index=True)
+                        df.drop_duplicates(subset='stck_bsop_date', keep='last', inplace=True)
+                        df.sort_values('stck_bsop_date', inplace=True, ignore_index=True)
+                    else:
+                        df = fetched
+                
+                covered_from = cache['covered_from'] if cached_df is not None else start_date
+                _save_ohlcv_cache(stock_code, period, df, covered_from, now)
             
-            return df
+            # 요청 구간만 반환
+            df = df[df['stck_bsop_date'] >= pd.Timestamp(start_date)].reset_index(drop=True)
+            return df if not df.empty else None
             
         except Exception as e:
             self.logger.error(f"OHLCV 데이터 조회 실패 {stock_code}: {e}")
             return None
     
+    async def get_ohlcv_data_async(self, stock_code: str, period: str = "D", days: int = 30,
+                                   force_refresh: bool = False) -> Optional[pd.DataFrame]:
+        """OHLCV 데이터 조회 (비동기 - 캐시 I/O, API 호출, DataFrame 정제를 워커 스레드에서 수행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.get_ohlcv_data, stock_code, period, days, force_refresh
+        )
+    
+    def _fetch_ohlcv(self, stock_code: str, period: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """기간별 시세 API 조회 (100건 초과 예상 시 연속조회)"""
+        days = (parse_yyyymmdd(end_date) - parse_yyyymmdd(start_date)).days
+        
+        # 캘린더 기준 days를 거래일로 환산 (약 70%)
+        estimated_trading_days = int(days * 0.7)
+        
+        # 100건 이상 필요 시 연속조회 사용
+        if estimated_trading_days > 100:
+            # 연속조회 함수 사용
+            # 요청된 거래일 수에 여유분(50) 추가하여 조회
+            target_count = estimated_trading_days + 50
+            return kis_market_api.get_inquire_daily_itemchartprice_extended(
+                div_code="J",
+                itm_no=stock_code,
+                inqr_strt_dt=start_date,
+                inqr_end_dt=end_date,
+                period_code=period,
+                max_count=target_count  # 300건 제한 제거 (필요한 만큼 조회)
+            )
+        
+        # 기존 단일 조회
+        return self._call_api_with_retry(
+            kis_market_api.get_inquire_daily_itemchartprice,
+            "2", "J", stock_code, start_date, end_date, period
+        )
+    
     def get_index_data(self, index_code: str = "0001") -> Optional[Dict[str, Any]]:
         """지수 데이터 조회"""
         try:
@@ -405,35 +901,71 @@ class KISAPIManager:
     # 주문 관련 API
     # ===========================================
     
+    def _pending_orders_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        정정취소 가능 주문을 주문번호(odno) 기준 dict로 반환 (짧은 TTL 캐시)
+        
+        cancel_order/get_order_status가 연달아 호출될 때 목록을 한 번만 조회하도록
+        _PENDING_ORDERS_TTL 동안 재사용합니다. API 호출 실패 시 None 반환.
+        """
+        now = time.monotonic()
+        if self._pending_orders_cache is not None and now < self._pending_orders_expires_at:
+            return self._pending_orders_cache
+        
+        pending_orders = self._call_api_with_retry(kis_order_api.get_inquire_psbl_rvsecncl_lst)
+        if pending_orders is None:
+            return None
+        
+        if pending_orders.empty or 'odno' not in pending_orders.columns:
+            index: Dict[str, Dict[str, Any]] = {}
+        else:
+            index = dict(zip(pending_orders['odno'], pending_orders.to_dict('records')))
+        
+        self._pending_orders_cache = index
+        self._pending_orders_expires_at = time.monotonic() + _PENDING_ORDERS_TTL
+        return index
+    
+    def _invalidate_pending_orders(self) -> None:
+        """미체결 주문 인덱스 캐시 무효화 (주문/취소 성공 시)"""
+        self._pending_orders_cache = None
+        self._pending_orders_expires_at = 0.0
+    
+    def _on_order_state_changed(self) -> None:
+        """주문 접수/취소 성공 시 관련 캐시 무효화"""
+        self._invalidate_pending_orders()
+        self.invalidate_tradable_amount_cache()
+        kis_market_api.invalidate_account_balance_cache()
+    
     def place_buy_order(self, stock_code: str, quantity: int, price: int, order_type: str = "00") -> OrderResult:
         """매수 주문"""
         try:
             result = self._call_api_with_retry(
                 kis_order_api.get_order_cash,
-                "buy", stock_code, quantity, price, "", order_type
+                "buy", stock_code, quantity, price, "", order_type,
+                as_dataframe=False, retryable=False
             )
             
-            if result is None or result.empty:
+            if not result:
                 return OrderResult(
                     success=False,
                     message="주문 실패 - 응답 없음"
                 )
             
-            data = result.iloc[0]
-            order_id = data.get('ODNO', '')
+            order_id = result.get('ODNO', '')
             
             if order_id:
+                self._on_order_state_changed()
                 return OrderResult(
                     success=True,
                     order_id=order_id,
                     message="매수 주문 성공",
-                    data=data.to_dict()
+                    data=result
                 )
             else:
                 return OrderResult(
                     success=False,
                     message="주문 실패 - 주문번호 없음",
-                    data=data.to_dict()
+                    data=result
                 )
                 
         except Exception as e:
@@ -448,30 +980,31 @@ class KISAPIManager:
         try:
             result = self._call_api_with_retry(
                 kis_order_api.get_order_cash,
-                "sell", stock_code, quantity, price, "", order_type
+                "sell", stock_code, quantity, price, "", order_type,
+                as_dataframe=False, retryable=False
             )
             
-            if result is None or result.empty:
+            if not result:
                 return OrderResult(
                     success=False,
                     message="주문 실패 - 응답 없음"
                 )
             
-            data = result.iloc[0]
-            order_id = data.get('ODNO', '')
+            order_id = result.get('ODNO', '')
             
             if order_id:
+                self._on_order_state_changed()
                 return OrderResult(
                     success=True,
                     order_id=order_id,
                     message="매도 주문 성공",
-                    data=data.to_dict()
+                    data=result
                 )
             else:
                 return OrderResult(
                     success=False,
                     message="주문 실패 - 주문번호 없음",
-                    data=data.to_dict()
+                    data=result
                 )
                 
         except Exception as e:
@@ -484,8 +1017,6 @@ class KISAPIManager:
     def cancel_order(self, order_id: str, stock_code: str, order_type: str = "00") -> OrderResult:
         """주문 취소 (향상된 디버깅)"""
         try:
-            from utils.korean_time import is_before_market_open, now_kst
-            
             current_time = now_kst()
             self.logger.info(f"🔍 주문 취소 시도: {order_id} (종목: {stock_code}) 시간: {current_time.strftime('%H:%M:%S')}")
             
@@ -498,10 +1029,8 @@ class KISAPIManager:
                 )
             
             # 1단계: 취소 가능한 주문 목록 조회
-            self.logger.debug(f"🔍 1단계: 취소 가능한 주문 목록 조회 중...")
-            pending_orders = self._call_api_with_retry(
-                kis_order_api.get_inquire_psbl_rvsecncl_lst
-            )
+            self.logger.debug("🔍 1단계: 취소 가능한 주문 목록 조회 중...")
+            pending_orders = self._pending_orders_index()
             
             if pending_orders is None:
                 self.logger.error(f"❌ API 호출 실패: 취소 가능한 주문 목록 조회")
@@ -510,7 +1039,7 @@ class KISAPIManager:
                     message="취소 가능한 주문 목록 조회 API 호출 실패"
                 )
             
-            if pending_orders.empty:
+            if not pending_orders:
                 self.logger.warning(f"⚠️ 취소 가능한 주문 목록이 비어있음")
                 
                 # 🔥 추가 확인: 혹시 이미 체결되었는지 확인
@@ -542,17 +1071,19 @@ class KISAPIManager:
             
             # 🔍 취소 가능한 주문 목록 상세 로깅
             self.logger.info(f"📋 취소 가능한 주문 {len(pending_orders)}건 조회됨")
-            for idx, order in pending_orders.iterrows():
-                self.logger.debug(f"  - 주문ID: {order.get('odno', 'N/A')}, "
-                                f"종목: {order.get('pdno', 'N/A')}, "
-                                f"수량: {order.get('ord_qty', 'N/A')}, "
-                                f"잔여: {order.get('rmn_qty', 'N/A')}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📋 취소 가능 주문 목록:\n%s", "\n".join(
+                    "  - 주문ID: %s, 종목: %s, 수량: %s, 잔여: %s" % (
+                        order.get('odno', 'N/A'), order.get('pdno', 'N/A'),
+                        order.get('ord_qty', 'N/A'), order.get('rmn_qty', 'N/A'))
+                    for order in pending_orders.values()
+                ))
             
             # 2단계: 해당 주문 찾기
-            self.logger.debug(f"🔍 2단계: 대상 주문 {order_id} 검색 중...")
-            target_order = pending_orders[pending_orders['odno'] == order_id]
+            self.logger.debug("🔍 2단계: 대상 주문 %s 검색 중...", order_id)
+            order_data = pending_orders.get(order_id)
             
-            if target_order.empty:
+            if order_data is None:
                 self.logger.warning(f"⚠️ 취소 대상 주문을 목록에서 찾을 수 없음: {order_id}")
                 
                 # 🔥 추가 확인: 혹시 이미 체결되었는지 확인
@@ -580,36 +1111,39 @@ class KISAPIManager:
                     message=f"취소 대상 주문을 찾을 수 없음: {order_id} (총 {len(pending_orders)}건 주문 중)"
                 )
             
-            order_data = target_order.iloc[0]
             self.logger.info(f"✅ 취소 대상 주문 발견: {order_id}")
-            self.logger.debug(f"📋 주문 상세: 종목={order_data.get('pdno', 'N/A')}, "
-                            f"수량={order_data.get('ord_qty', 'N/A')}, "
-                            f"잔여={order_data.get('rmn_qty', 'N/A')}")
+            self.logger.debug("📋 주문 상세: 종목=%s, 수량=%s, 잔여=%s",
+                              order_data.get('pdno', 'N/A'),
+                              order_data.get('ord_qty', 'N/A'),
+                              order_data.get('rmn_qty', 'N/A'))
             
             # 3단계: 주문 취소 실행
-            self.logger.debug(f"🔍 3단계: 주문 취소 API 호출 중...")
+            self.logger.debug("🔍 3단계: 주문 취소 API 호출 중...")
             
             # KIS API 필드명 매핑 - 다양한 가능성 고려
             ord_orgno = ""
             orgn_odno = order_data.get('odno', '')  # 주문번호
             
-            # 주문조직번호 필드 찾기 (우선순위 순)
-            possible_orgno_fields = ['krx_fwdg_ord_orgno', 'ord_orgno', 'ord_gno_brno', 'orgn_odno']
-            for field in possible_orgno_fields:
-                if field in order_data and order_data[field]:
-                    ord_orgno = order_data[field]
-                    self.logger.debug(f"📋 주문조직번호 필드 사용: {field} = {ord_orgno}")
-                    break
+            # 주문조직번호 필드 찾기 - 직전에 성공한 필드를 먼저 사용 (환경별로 고정)
+            if self._orgno_field:
+                ord_orgno = order_data.get(self._orgno_field, '')
+            if not ord_orgno:
+                for field in self._ORGNO_FIELDS:
+                    ord_orgno = order_data.get(field, '')
+                    if ord_orgno:
+                        self._orgno_field = field
+                        self.logger.debug("📋 주문조직번호 필드 사용: %s = %s", field, ord_orgno)
+                        break
             
             if not ord_orgno:
                 self.logger.error(f"❌ 주문조직번호를 찾을 수 없음: {order_id}")
-                self.logger.debug(f"📋 사용 가능한 필드: {list(order_data.keys())}")
+                self.logger.debug("📋 사용 가능한 필드: %s", list(order_data.keys()))
                 return OrderResult(
                     success=False,
                     message="주문조직번호를 찾을 수 없어 취소할 수 없습니다"
                 )
             
-            self.logger.debug(f"📋 취소 API 파라미터: ord_orgno={ord_orgno}, orgn_odno={orgn_odno}")
+            self.logger.debug("📋 취소 API 파라미터: ord_orgno=%s, orgn_odno=%s", ord_orgno, orgn_odno)
             
             result = self._call_api_with_retry(
                 kis_order_api.get_order_rvsecncl,
@@ -619,7 +1153,9 @@ class KISAPIManager:
                 "02",                     # 취소구분
                 0,                        # 수량 (취소시 0)
                 0,                        # 가격 (취소시 0)
-                "Y"                       # 전량취소
+                "Y",                      # 전량취소
+                as_dataframe=False,
+                retryable=False
             )
             
             if result is None:
@@ -629,7 +1165,7 @@ class KISAPIManager:
                     message="주문 취소 API 호출 실패"
                 )
             
-            if result.empty:
+            if not result:
                 self.logger.error(f"❌ 주문 취소 API 응답 없음: {order_id}")
                 return OrderResult(
                     success=False,
@@ -637,20 +1173,21 @@ class KISAPIManager:
                 )
             
             # 🔥 취소 결과 상세 확인
-            cancel_result = result.iloc[0]
+            cancel_result = result
             rt_cd = cancel_result.get('rt_cd', '')
             msg1 = cancel_result.get('msg1', '')
             
             self.logger.info(f"📋 취소 API 응답: rt_cd={rt_cd}, msg1={msg1}")
-            self.logger.debug(f"📋 전체 응답 데이터: {cancel_result.to_dict()}")
+            self.logger.debug("📋 전체 응답 데이터: %s", cancel_result)
             
             if rt_cd == '0':  # 성공
                 self.logger.info(f"✅ 주문 취소 성공: {order_id}")
+                self._on_order_state_changed()
                 return OrderResult(
                     success=True,
                     order_id=order_id,
                     message="주문 취소 성공",
-                    data=cancel_result.to_dict()
+                    data=cancel_result
                 )
             else:
                 self.logger.error(f"❌ 주문 취소 실패: {order_id} - {msg1} (코드: {rt_cd})")
@@ -658,7 +1195,7 @@ class KISAPIManager:
                     success=False,
                     message=f"주문 취소 실패: {msg1}",
                     error_code=rt_cd,
-                    data=cancel_result.to_dict()
+                    data=cancel_result
                 )
             
         except Exception as e:
@@ -668,61 +1205,212 @@ class KISAPIManager:
                 message=f"주문 취소 오류: {e}"
             )
     
-    def get_order_status(self, order_id: str) -> Optional[Dict[str, Any]]:
-        """주문 상태 조회 - 미체결 주문 조회 + 체결 내역 조회 조합 (개선된 버전)"""
+    def _pending_only_status(self, order_id: str,
+                             pending_order_data: Optional[Dict[str, Any]]) -> Optional[OrderStatus]:
+        """미체결 목록만으로 판정 가능한 주문 상태 (잔여수량 == 주문수량이면 체결 내역 조회 불필요)"""
+        if pending_order_data is None:
+            return None
+        
+        self.logger.debug("📋 미체결 주문에서 발견: %s", order_id)
+        total_order_qty = _to_int_qty(pending_order_data.get('ord_qty', 0))
+        remaining_qty = _to_int_qty(pending_order_data.get('rmn_qty', 0))
+        
+        if total_order_qty > 0 and remaining_qty == total_order_qty:
+            self.logger.debug("📊 미체결 상태: %s - 주문량: %s (잔여: %s)",
+                              order_id, total_order_qty, remaining_qty)
+            return OrderStatus.from_record(
+                order_id, pending_order_data,
+                tot_ccld_qty=0,
+                rmn_qty=remaining_qty,
+                ord_qty=total_order_qty
+            )
+        return None
+    
+    def _fetch_daily_fills(self) -> Optional[pd.DataFrame]:
+        """당일 체결 내역 조회 (실패 시 None)"""
+        # 🆕 체결 내역 조회 시 더 안전한 API 호출 - 당일만 조회
         try:
-            self.logger.debug(f"🔍 주문 상태 조회 시작: {order_id}")
-            
-            # 1. 미체결 주문 조회 (정정취소 가능 주문)
-            pending_orders = self._call_api_with_retry(
-                kis_order_api.get_inquire_psbl_rvsecncl_lst
+            today = datetime.today().strftime("%Y%m%d")
+
+            daily_results = self._call_api_with_retry(
+                kis_order_api.get_inquire_daily_ccld_lst,
+                "01",  # 3개월 이내
+                today,  # 시작일: 오늘
+                today   # 종료일: 오늘
             )
-            
-            # 2. 미체결 주문 목록에서 해당 주문 찾기
-            is_pending = False
-            pending_order_data = None
-            
-            if pending_orders is not None and not pending_orders.empty:
-                target_pending = pending_orders[pending_orders['odno'] == order_id]
-                if not target_pending.empty:
-                    is_pending = True
-                    pending_order_data = target_pending.iloc[0].to_dict()
-                    self.logger.debug(f"📋 미체결 주문에서 발견: {order_id}")
-            
-            # 3. 체결 내역 조회 (완전 체결 확인 및 상세 정보용)
-            # 🆕 체결 내역 조회 시 더 안전한 API 호출 - 당일만 조회
-            daily_results = None
+
+            # 🔧 API 응답 검증
+            '''
+            if daily_results is not None:
+                if daily_results.empty:
+                    self.logger.debug(f"📊 체결 내역 조회 결과: 빈 데이터프레임 (당일)")
+                else:
+                    self.logger.debug(f"📊 체결 내역 조회 결과: {len(daily_results)}건 (당일)")
+                    # 응답 데이터 구조 검증 - 올바른 필드명 사용
+                    required_fields = ['odno', 'tot_ccld_qty', 'ord_qty']
+                    missing_fields = [field for field in required_fields if field not in daily_results.columns]
+                    if missing_fields:
+                        self.logger.warning(f"⚠️ 체결 내역 응답에서 누락된 필드: {missing_fields}")
+                        self.logger.debug(f"📋 실제 필드 목록: {list(daily_results.columns)}")
+            else:
+                self.logger.warning(f"⚠️ 체결 내역 조회 API 호출 실패")
+            '''
+
+            return daily_results
+
+        except Exception as api_error:
+            self.logger.error(f"❌ 체결 내역 조회 중 오류: {api_error}")
+            return None
+    
+    def _resolve_order_status(self, order_id: str, pending_order_data: Optional[Dict[str, Any]],
+                              all_filled_records: Optional[pd.DataFrame]) -> Optional[OrderStatus]:
+        """미체결 주문 데이터와 해당 주문의 당일 체결 레코드로 주문 상태 결정 (추가 API 호출 없음)"""
+        # 5. 주문 상태 결정 및 데이터 생성
+        if pending_order_data:
+            # 🔄 미체결 주문이 존재 = 부분 체결 또는 미체결
+            # 🔧 개선: 안전한 수량 계산
             try:
-                from datetime import datetime
-                today = datetime.today().strftime("%Y%m%d")
-                
-                daily_results = self._call_api_with_retry(
-                    kis_order_api.get_inquire_daily_ccld_lst,
-                    "01",  # 3개월 이내
-                    today,  # 시작일: 오늘
-                    today   # 종료일: 오늘
+                total_order_qty = _to_int_qty(pending_order_data.get('ord_qty', 0))       # 원주문수량
+                remaining_qty = _to_int_qty(pending_order_data.get('rmn_qty', 0))         # 잔여수량  
+
+                # 🚨 핵심 수정: 미체결 주문의 체결량은 실제 체결 내역에서만 가져와야 함
+                # API의 미체결 주문 조회에서는 rmn_qty만 신뢰할 수 있음
+                filled_qty = 0  # 기본값: 미체결
+
+                # 당일 체결 내역에서 해당 주문의 실제 체결량 확인
+                if all_filled_records is not None and not all_filled_records.empty:
+                    # 당일 체결 내역이 있으면 실제 체결량 계산 (변환 불가 값은 0)
+                    filled_qty = int(_qty_array(all_filled_records, ('tot_ccld_qty',)).sum())
+                    self.logger.debug("📊 당일 체결 내역에서 체결량 확인: %s - %s주", order_id, filled_qty)
+
+                # 🔧 검증: 체결량 + 잔여량 = 주문량이어야 함
+                expected_filled = max(0, total_order_qty - remaining_qty)
+                if filled_qty != expected_filled:
+                    self.logger.warning(f"⚠️ 체결량 불일치 감지: {order_id} - "
+                                      f"체결내역: {filled_qty}주, 계산값: {expected_filled}주")
+                    # 🚨 핵심 수정: 실제 체결 내역만 신뢰 (계산값 사용 금지)
+                    # 실제 체결 내역이 없으면 무조건 체결량 0
+                    self.logger.info(f"📊 실제 체결 내역 기준: {filled_qty}주 (계산값 {expected_filled}주는 무시)")
+                    # filled_qty는 그대로 유지 (실제 체결 내역 기준)
+
+            except (ValueError, TypeError) as e:
+                self.logger.error(f"❌ 미체결 주문 수량 파싱 오류: {order_id} - {e}")
+                return None
+
+            # 🔧 개선: 데이터 검증
+            if total_order_qty <= 0:
+                self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {order_id} - {total_order_qty}")
+                return None
+
+            order_data = OrderStatus.from_record(
+                order_id, pending_order_data,
+                tot_ccld_qty=filled_qty,
+                rmn_qty=remaining_qty,
+                ord_qty=total_order_qty
+            )
+
+            if filled_qty > 0:
+                self.logger.info(f"🔄 부분 체결 상태: {order_id} - 체결: {filled_qty}/{total_order_qty} (잔여: {remaining_qty})")
+            else:
+                self.logger.debug("📊 미체결 상태: %s - 주문량: %s (잔여: %s)", order_id, total_order_qty, remaining_qty)
+
+        elif all_filled_records is not None and not all_filled_records.empty:
+            # ✅ 미체결 주문 목록에 없고 체결 내역 존재 = 완전 체결
+
+            # 🔧 개선: 체결 수량 계산 (레코드별 변환 대신 컬럼 단위로 한 번에 처리)
+            total_filled_qty, order_qty = _aggregate_fill_qty(*_fill_qty_arrays(all_filled_records))
+            last_record = all_filled_records.iloc[-1].to_dict()  # 마지막 레코드는 dict로 한 번만 변환
+
+            # 🚨 핵심 수정: 체결량이 0인 경우 실제 미체결 상태로 처리
+            if total_filled_qty == 0 and order_qty > 0:
+                # 체결 내역은 있지만 체결량이 0인 경우 = 실제로는 아직 미체결
+                '''
+                self.logger.info(f"📊 체결 내역에서 체결량 0 확인: {order_id} - 실제 미체결 상태")
+                self.logger.debug(f"📋 체결 내역 상세:")
+                for idx, record in all_filled_records.iterrows():
+                    self.logger.debug(f"  레코드 {idx+1}: {record.to_dict()}")
+                '''
+
+                # 🆕 체결량이 0이면 미체결 주문으로 재분류하여 반환
+                # (완전 체결 처리하지 않고 미체결로 처리)
+                #self.logger.info(f"🔄 체결량 0이므로 미체결 상태로 분류: {order_id}")
+
+                # 미체결 상태로 반환 (remaining_qty = order_qty)
+                return OrderStatus.from_record(
+                    order_id, last_record,
+                    tot_ccld_qty=0,                # 체결량 0
+                    rmn_qty=order_qty,             # 잔여량 = 전체 주문량
+                    ord_qty=order_qty,             # 주문량
+                    actual_unfilled=True           # 실제 미체결 플래그
                 )
-                
-                # 🔧 API 응답 검증
+
+            if last_record is not None:
+                order_data = OrderStatus.from_record(
+                    order_id, last_record,
+                    tot_ccld_qty=total_filled_qty,                # 총체결수량 (실제 계산된 값)
+                    rmn_qty=max(0, order_qty - total_filled_qty), # 잔여수량
+                    ord_qty=order_qty                             # 주문수량
+                )
+
                 '''
-                if daily_results is not None:
-                    if daily_results.empty:
-                        self.logger.debug(f"📊 체결 내역 조회 결과: 빈 데이터프레임 (당일)")
-                    else:
-                        self.logger.debug(f"📊 체결 내역 조회 결과: {len(daily_results)}건 (당일)")
-                        # 응답 데이터 구조 검증 - 올바른 필드명 사용
-                        required_fields = ['odno', 'tot_ccld_qty', 'ord_qty']
-                        missing_fields = [field for field in required_fields if field not in daily_results.columns]
-                        if missing_fields:
-                            self.logger.warning(f"⚠️ 체결 내역 응답에서 누락된 필드: {missing_fields}")
-                            self.logger.debug(f"📋 실제 필드 목록: {list(daily_results.columns)}")
+                if total_filled_qty == order_qty and total_filled_qty > 0:
+                    self.logger.info(f"✅ 완전 체결 확인: {order_id} - 체결: {total_filled_qty}/{order_qty}")
                 else:
-                    self.logger.warning(f"⚠️ 체결 내역 조회 API 호출 실패")
+                    self.logger.warning(f"⚠️ 체결 내역 불일치: {order_id} - 체결: {total_filled_qty}/{order_qty}")
                 '''
-                    
-            except Exception as api_error:
-                self.logger.error(f"❌ 체결 내역 조회 중 오류: {api_error}")
-                daily_results = None
+            else:
+                self.logger.error(f"❌ 체결 내역 처리 실패: {order_id}")
+
+                # 🆕 체결 내역 처리 실패 시 대체 방법: 계좌 잔고 조회로 확인
+                try:
+                    #self.logger.info(f"🔍 대체 확인 방법 시도: 계좌 잔고 조회로 체결 확인")
+                    balance_result = kis_market_api.get_stock_balance()
+                    if balance_result:
+                        balance_df, account_summary = balance_result
+
+                        # 주문 시점과 현재 잔고를 비교하여 체결 여부 추정
+                        # (이 방법은 완벽하지 않지만 마지막 수단으로 사용)
+                        #self.logger.debug(f"📊 대체 확인: 계좌 잔고 기반 체결 추정 시도")
+
+                        # 기본 구조 반환 (미체결로 간주)
+                        return OrderStatus(odno=order_id, alternative_check=True)  # 대체 확인 플래그
+                except Exception as alt_error:
+                    self.logger.error(f"❌ 대체 확인 방법도 실패: {alt_error}")
+
+                return None
+        else:
+            # ❌ 미체결 주문도 없고 체결 내역도 없음 = 주문 취소 또는 오류
+            #self.logger.warning(f"⚠️ 주문 상태 불명: {order_id} (미체결 목록과 체결 내역 모두에서 찾을 수 없음)")
+
+            # 🆕 주문 상태 불명인 경우 기본 구조 반환 (None 대신)
+            # 이를 통해 OrderManager에서 적절한 처리가 가능하도록 함
+            order_data = OrderStatus(odno=order_id, cncl_yn='Y', status_unknown=True)  # 취소된 것으로 추정
+
+            #self.logger.debug(f"📋 주문 상태 불명으로 기본 구조 반환: {order_id}")
+            return order_data
+
+        #self.logger.debug(f"✅ 주문 상태 조회 완료: {order_id}")
+        return order_data
+
+
+    def get_order_status(self, order_id: str) -> Optional[OrderStatus]:
+        """주문 상태 조회 - 미체결 주문 조회 + 체결 내역 조회 조합 (개선된 버전)"""
+        try:
+            self.logger.debug("🔍 주문 상태 조회 시작: %s", order_id)
+            
+            # 1. 미체결 주문 조회 (정정취소 가능 주문, 주문번호 인덱스)
+            pending_orders = self._pending_orders_index()
+            
+            # 2. 미체결 주문 목록에서 해당 주문 찾기
+            pending_order_data = pending_orders.get(order_id) if pending_orders else None
+            
+            # 🆕 잔여수량 == 주문수량이면 체결이 없으므로 체결 내역 조회 생략 (API 1회 절약)
+            order_data = self._pending_only_status(order_id, pending_order_data)
+            if order_data is not None:
+                return order_data
+            
+            # 3. 체결 내역 조회 (부분 체결 또는 미체결 목록에 없는 경우 - 체결량 확인용)
+            daily_results = self._fetch_daily_fills()
             
             # 4. 해당 주문의 모든 체결 레코드 찾기
             all_filled_records = None
@@ -733,252 +1421,102 @@ class KISAPIManager:
                     self.logger.debug(f"📋 체결 내역에서 발견: {order_id} ({len(all_filled_records)}건)")
                 '''
             
-            # 5. 주문 상태 결정 및 데이터 생성
-            if is_pending and pending_order_data:
-                # 🔄 미체결 주문이 존재 = 부분 체결 또는 미체결
-                order_data = pending_order_data.copy()
-                
-                # 🔧 개선: 안전한 수량 계산
-                try:
-                    total_order_qty = int(float(str(order_data.get('ord_qty', 0))))      # 원주문수량
-                    remaining_qty = int(float(str(order_data.get('rmn_qty', 0))))        # 잔여수량  
-                    
-                    # 🚨 핵심 수정: 미체결 주문의 체결량은 실제 체결 내역에서만 가져와야 함
-                    # API의 미체결 주문 조회에서는 rmn_qty만 신뢰할 수 있음
-                    filled_qty = 0  # 기본값: 미체결
-                    
-                    # 당일 체결 내역에서 해당 주문의 실제 체결량 확인
-                    if daily_results is not None and not daily_results.empty:
-                        today_filled_records = daily_results[daily_results['odno'] == order_id]
-                        if not today_filled_records.empty:
-                            # 당일 체결 내역이 있으면 실제 체결량 계산
-                            for _, record in today_filled_records.iterrows():
-                                try:
-                                    record_filled = int(float(str(record.get('tot_ccld_qty', 0)).replace(',', '')))
-                                    filled_qty += record_filled
-                                except (ValueError, TypeError):
-                                    continue
-                            self.logger.debug(f"📊 당일 체결 내역에서 체결량 확인: {order_id} - {filled_qty}주")
-                        
-                    # 🔧 검증: 체결량 + 잔여량 = 주문량이어야 함
-                    expected_filled = max(0, total_order_qty - remaining_qty)
-                    if filled_qty != expected_filled:
-                        self.logger.warning(f"⚠️ 체결량 불일치 감지: {order_id} - "
-                                          f"체결내역: {filled_qty}주, 계산값: {expected_filled}주")
-                        # 🚨 핵심 수정: 실제 체결 내역만 신뢰 (계산값 사용 금지)
-                        # 실제 체결 내역이 없으면 무조건 체결량 0
-                        self.logger.info(f"📊 실제 체결 내역 기준: {filled_qty}주 (계산값 {expected_filled}주는 무시)")
-                        # filled_qty는 그대로 유지 (실제 체결 내역 기준)
-                        
-                except (ValueError, TypeError) as e:
-                    self.logger.error(f"❌ 미체결 주문 수량 파싱 오류: {order_id} - {e}")
-                    return None
-                
-                # 🔧 개선: 데이터 검증
-                if total_order_qty <= 0:
-                    self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {order_id} - {total_order_qty}")
-                    return None
-                
-                order_data['tot_ccld_qty'] = str(filled_qty)             # 총체결수량
-                order_data['rmn_qty'] = str(remaining_qty)               # 잔여수량
-                order_data['ord_qty'] = str(total_order_qty)             # 주문수량
-                order_data['cncl_yn'] = 'N'                              # 취소여부
-                
-                if filled_qty > 0:
-                    self.logger.info(f"🔄 부분 체결 상태: {order_id} - 체결: {filled_qty}/{total_order_qty} (잔여: {remaining_qty})")
-                else:
-                    self.logger.debug(f"📊 미체결 상태: {order_id} - 주문량: {total_order_qty} (잔여: {remaining_qty})")
-                
-            elif all_filled_records is not None and not all_filled_records.empty:
-                # ✅ 미체결 주문 목록에 없고 체결 내역 존재 = 완전 체결
-                
-                # 🔧 개선: 체결 수량 계산 로직 강화
-                total_filled_qty = 0
-                order_qty = 0
-                last_record = None
-                
-                #self.logger.debug(f"📊 체결 내역 분석 시작: {order_id}")
-                
-                for idx, record in all_filled_records.iterrows():
-                    # 🔧 개선: 다양한 체결량 필드명 확인 및 안전한 변환
-                    # KIS API는 응답 시점에 따라 다른 필드명 사용 가능 (API 문서 기준)
-                    possible_qty_fields = ['tot_ccld_qty', 'ord_qty', 'rmn_qty', 'cnc_cfrm_qty']
-                    ccld_qty_str = '0'
-                    ord_qty_str = '0'
-                    
-                    # 체결량 필드 찾기 (API 문서 기준 우선순위 순으로)
-                    for field in ['tot_ccld_qty', 'ccld_qty', 'cnc_cfrm_qty']:
-                        if field in record and record[field] not in ['', '-', 'None', 'nan', None]:
-                            ccld_qty_str = str(record[field]).strip()
-                            break
-                    
-                    # 주문량 필드 찾기
-                    for field in ['ord_qty', 'ord_qty_org']:
-                        if field in record and record[field] not in ['', '-', 'None', 'nan', None]:
-                            ord_qty_str = str(record[field]).strip()
-                            break
-                    
-                    # 빈 문자열이나 '-' 처리
-                    if ccld_qty_str in ['', '-', 'None', 'nan']:
-                        ccld_qty_str = '0'
-                    if ord_qty_str in ['', '-', 'None', 'nan']:
-                        ord_qty_str = '0'
-                    
-                    try:
-                        # 쉼표 제거 후 변환
-                        ccld_qty_str = ccld_qty_str.replace(',', '')
-                        ord_qty_str = ord_qty_str.replace(',', '')
-                        ccld_qty = int(float(ccld_qty_str))  # float로 먼저 변환 후 int
-                        ord_qty = int(float(ord_qty_str))
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"⚠️ 체결량 변환 실패: ccld_qty={ccld_qty_str}, ord_qty={ord_qty_str}")
-                        self.logger.debug(f"📋 전체 레코드 데이터: {record.to_dict()}")
-                        ccld_qty = 0
-                        ord_qty = 0
-                    
-                    total_filled_qty += ccld_qty
-                    if ord_qty > 0:  # 주문수량이 유효한 경우에만 업데이트
-                        order_qty = ord_qty
-                    last_record = record
-                    
-                    #self.logger.debug(f"  📊 체결 레코드 {idx+1}: 체결량={ccld_qty}, 주문량={ord_qty}")
-                    
-                    # 🔧 추가: 레코드별 상세 정보 로깅 (디버깅용)
-                    '''
-                    if ccld_qty > 0:
-                        self.logger.debug(f"    ✅ 유효한 체결: 시간={record.get('ord_tmd', 'N/A')}, 가격={record.get('avg_prvs', record.get('ccld_unpr', 'N/A'))}")
-                    else:
-                        self.logger.debug(f"    ⚠️ 체결량 0: 가능한 필드값들 = {[record.get(f, 'N/A') for f in possible_qty_fields]}")
-                    '''
-                
-                # 🚨 핵심 수정: 체결량이 0인 경우 실제 미체결 상태로 처리
-                if total_filled_qty == 0 and order_qty > 0:
-                    # 체결 내역은 있지만 체결량이 0인 경우 = 실제로는 아직 미체결
-                    '''
-                    self.logger.info(f"📊 체결 내역에서 체결량 0 확인: {order_id} - 실제 미체결 상태")
-                    self.logger.debug(f"📋 체결 내역 상세:")
-                    for idx, record in all_filled_records.iterrows():
-                        self.logger.debug(f"  레코드 {idx+1}: {record.to_dict()}")
-                    '''
-                    
-                    # 🆕 체결량이 0이면 미체결 주문으로 재분류하여 반환
-                    # (완전 체결 처리하지 않고 미체결로 처리)
-                    #self.logger.info(f"🔄 체결량 0이므로 미체결 상태로 분류: {order_id}")
-                    
-                    # 미체결 상태로 반환 (remaining_qty = order_qty)
-                    return {
-                        'odno': order_id,
-                        'tot_ccld_qty': '0',           # 체결량 0
-                        'rmn_qty': str(order_qty),     # 잔여량 = 전체 주문량
-                        'ord_qty': str(order_qty),     # 주문량
-                        'cncl_yn': 'N',                # 취소 아님
-                        'ord_dvsn': last_record.get('ord_dvsn', '00') if last_record is not None else '00',
-                        'sll_buy_dvsn_cd': last_record.get('sll_buy_dvsn_cd', '01') if last_record is not None else '01',
-                        'pdno': last_record.get('pdno', '') if last_record is not None else '',
-                        'ord_unpr': last_record.get('ord_unpr', '0') if last_record is not None else '0',
-                        'actual_unfilled': True        # 실제 미체결 플래그
-                    }
-                
-                if last_record is not None:
-                    order_data = last_record.to_dict()
-                    order_data['tot_ccld_qty'] = str(total_filled_qty)   # 총체결수량 (실제 계산된 값)
-                    order_data['rmn_qty'] = str(max(0, order_qty - total_filled_qty))  # 잔여수량
-                    order_data['ord_qty'] = str(order_qty)              # 주문수량
-                    order_data['cncl_yn'] = 'N'                         # 취소여부
-                    
-                    '''
-                    if total_filled_qty == order_qty and total_filled_qty > 0:
-                        self.logger.info(f"✅ 완전 체결 확인: {order_id} - 체결: {total_filled_qty}/{order_qty}")
-                    else:
-                        self.logger.warning(f"⚠️ 체결 내역 불일치: {order_id} - 체결: {total_filled_qty}/{order_qty}")
-                    '''
-                else:
-                    self.logger.error(f"❌ 체결 내역 처리 실패: {order_id}")
-                    
-                    # 🆕 체결 내역 처리 실패 시 대체 방법: 계좌 잔고 조회로 확인
-                    try:
-                        #self.logger.info(f"🔍 대체 확인 방법 시도: 계좌 잔고 조회로 체결 확인")
-                        from api.kis_market_api import get_stock_balance
-                        
-                        balance_result = get_stock_balance()
-                        if balance_result:
-                            balance_df, account_summary = balance_result
-                            
-                            # 주문 시점과 현재 잔고를 비교하여 체결 여부 추정
-                            # (이 방법은 완벽하지 않지만 마지막 수단으로 사용)
-                            #self.logger.debug(f"📊 대체 확인: 계좌 잔고 기반 체결 추정 시도")
-                            
-                            # 기본 구조 반환 (미체결로 간주)
-                            return {
-                                'odno': order_id,
-                                'tot_ccld_qty': '0',
-                                'rmn_qty': '0', 
-                                'ord_qty': '0',
-                                'cncl_yn': 'N',
-                                'alternative_check': True  # 대체 확인 플래그
-                            }
-                    except Exception as alt_error:
-                        self.logger.error(f"❌ 대체 확인 방법도 실패: {alt_error}")
-                    
-                    return None
-            else:
-                # ❌ 미체결 주문도 없고 체결 내역도 없음 = 주문 취소 또는 오류
-                #self.logger.warning(f"⚠️ 주문 상태 불명: {order_id} (미체결 목록과 체결 내역 모두에서 찾을 수 없음)")
-                
-                # 🆕 주문 상태 불명인 경우 기본 구조 반환 (None 대신)
-                # 이를 통해 OrderManager에서 적절한 처리가 가능하도록 함
-                order_data = {
-                    'odno': order_id,
-                    'tot_ccld_qty': '0',      # 체결수량 0으로 설정
-                    'rmn_qty': '0',           # 잔여수량 0으로 설정 
-                    'ord_qty': '0',           # 주문수량 불명
-                    'cncl_yn': 'Y',           # 취소된 것으로 추정
-                    'ord_dvsn': '00',         # 기본 주문구분
-                    'sll_buy_dvsn_cd': '01',  # 기본 매도매수구분
-                    'pdno': '',               # 종목코드 불명
-                    'ord_unpr': '0',          # 주문단가 불명
-                    'status_unknown': True    # 🆕 상태 불명 플래그
-                }
-                
-                #self.logger.debug(f"📋 주문 상태 불명으로 기본 구조 반환: {order_id}")
-                return order_data
-            
-            #self.logger.debug(f"✅ 주문 상태 조회 완료: {order_id}")
-            return order_data
+            return self._resolve_order_status(order_id, pending_order_data, all_filled_records)
             
         except Exception as e:
             self.logger.error(f"❌ 주문 상태 조회 실패 {order_id}: {e}")
             return None
     
+    def get_order_statuses(self, order_ids: List[str]) -> Dict[str, Optional[OrderStatus]]:
+        """
+        여러 주문 상태 일괄 조회
+
+        미체결 목록과 당일 체결 내역을 한 번씩만 조회한 뒤 주문별 상태는 로컬에서 판정합니다.
+        """
+        if not order_ids:
+            return {}
+        
+        try:
+            pending_orders = self._pending_orders_index() or {}
+        except Exception as e:
+            self.logger.error(f"❌ 주문 상태 일괄 조회 실패: {e}")
+            return {order_id: None for order_id in order_ids}
+        
+        statuses: Dict[str, Optional[OrderStatus]] = {}
+        need_fills = []
+        for order_id in order_ids:
+            order_data = self._pending_only_status(order_id, pending_orders.get(order_id))
+            if order_data is not None:
+                statuses[order_id] = order_data
+            else:
+                need_fills.append(order_id)
+        
+        if need_fills:
+            # 체결 내역이 필요한 주문이 있을 때만 1회 조회 후 주문번호 -> 행 위치 해시 인덱스 구성
+            daily_results = self._fetch_daily_fills()
+            fill_positions: Dict[str, np.ndarray] = {}
+            if daily_results is not None and not daily_results.empty:
+                fill_positions = daily_results.groupby('odno', sort=False).indices
+            
+            for order_id in need_fills:
+                try:
+                    positions = fill_positions.get(order_id)
+                    filled_records = daily_results.iloc[positions] if positions is not None else None
+                    statuses[order_id] = self._resolve_order_status(
+                        order_id, pending_orders.get(order_id), filled_records
+                    )
+                except Exception as e:
+                    self.logger.error(f"❌ 주문 상태 조회 실패 {order_id}: {e}")
+                    statuses[order_id] = None
+        
+        return {order_id: statuses[order_id] for order_id in order_ids}
+    
     # ===========================================
     # 유틸리티 함수들
     # ===========================================
     
     def get_api_statistics(self) -> Dict[str, Any]:
-        """API 호출 통계"""
-        return {
-            'total_calls': self.call_count,
-            'error_count': self.error_count,
-            'success_rate': (self.call_count - self.error_count) / max(self.call_count, 1) * 100,
-            'is_authenticated': self.is_authenticated,
-            'last_auth_time': self.last_auth_time.isoformat() if self.last_auth_time else None
-        }
+        """API 호출 통계 (호출/오류 수, 인증 상태가 바뀐 경우에만 재계산)"""
+        key = (self.call_count, self.error_count, self.last_auth_time, self.is_authenticated)
+        if key != self._stats_cache_key:
+            self._stats_cache_val = {
+                'total_calls': self.call_count,
+                'error_count': self.error_count,
+                'success_rate': (self.call_count - self.error_count) / max(self.call_count, 1) * 100,
+                'is_authenticated': self.is_authenticated,
+                'last_auth_time': self.last_auth_time.isoformat() if self.last_auth_time else None
+            }
+            self._stats_cache_key = key
+        return dict(self._stats_cache_val)
     
 
     def health_check(self) -> bool:
-        """API 상태 확인"""
+        """API 상태 확인 (인증 상태 우선 확인, 네트워크 확인은 1분에 한 번)"""
+        if not self.is_authenticated:
+            return False
+        
+        now = time.monotonic()
+        if now - self._last_healthcheck_ts < _HEALTHCHECK_TTL:
+            return self._last_healthcheck_ok
+        
         try:
             # 간단한 API 호출로 상태 확인
             result = self.get_current_price("005930")  # 삼성전자
-            return result is not None
+            ok = result is not None
             
         except Exception as e:
             self.logger.error(f"Health check 실패: {e}")
-            return False
+            ok = False
+        
+        self._last_healthcheck_ts = now
+        self._last_healthcheck_ok = ok
+        return ok
     
     def shutdown(self):
         """API 매니저 종료"""
         self.logger.info("KIS API Manager 종료 중...")
+        self._executor.shutdown(wait=False)
+        kis_auth.close_session()
         self.is_initialized = False
         self.is_authenticated = False
         self.logger.info("KIS API Manager 종료 완료") 
\ No newline at end of file
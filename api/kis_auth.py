@@ -2,15 +2,29 @@
 KIS API 인증/토큰 관리 모듈 (공식 문서 기반)
 """
 import os
+import asyncio
 import json
+import hmac
+import hashlib
 import time
 import threading
+import contextvars
+from collections import namedtuple
+from types import SimpleNamespace
 import yaml
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Optional, NamedTuple
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, NamedTuple, Tuple
 from utils.logger import setup_logger
 from utils.korean_time import now_kst
+from utils.rate_limiter import TokenBucket
+from utils.ttl_cache import TTLCache
+from . import kis_cache
 
 # 설정 import (settings.py에서 .env 파일을 읽어서 제공)
 from config.settings import (
@@ -18,8 +32,29 @@ from config.settings import (
     ACCOUNT_NUMBER, HTS_ID
 )
 
+# JSON 직렬화/파싱: orjson이 설치되어 있으면 사용 (stdlib json 대비 빠름)
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:  # orjson 미설치 환경
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        # orjson과 동일한 형식(공백 없음, UTF-8)으로 맞춤 - 해시키 계산 본문과 일치해야 함
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 logger = setup_logger(__name__)
 
+# 주문 해시키 로컬 계산 사용 여부 (첫 주문에서 원격 발급값과 비교 후 활성화)
+_USE_LOCAL_HASHKEY = os.environ.get('USE_LOCAL_HASHKEY', '').strip().lower() in ('1', 'true', 'yes')
+_local_hashkey_verified: Optional[bool] = None  # None: 미검증, True: 일치, False: 불일치
+
 # 토큰 파일 경로
 TOKEN_FILE_PATH = os.path.join(os.path.abspath(os.getcwd()), "token_info.json")
 
@@ -34,62 +69,175 @@ class KISEnv(NamedTuple):
 
 # 전역 변수
 _TRENV: Optional[KISEnv] = None
-_last_auth_time = now_kst()
+_last_auth_time = 0.0  # 마지막 인증 완료 시각 (epoch 초, 아직 인증 전이면 0)
 _autoReAuth = True
 _DEBUG = False
 
+# 토큰 캐시 (expires_at은 time.monotonic() 기준 만료 시각)
+TOKEN_REFRESH_SKEW_SECONDS = 60  # 만료 60초 전부터 재발급 대상으로 간주
+_TOKEN_CACHE = {"token": None, "expires_at": 0.0}
+_next_reauth_at = 0.0  # 재발급 확인이 필요한 monotonic 시각 (expires_at - skew, 토큰 저장 시 1회 계산)
+# 토큰 파일 파싱 결과 캐시 (파일 수정 시각이 같으면 다시 파싱하지 않음)
+_TOKEN_FILE_CACHE = {"mtime": None, "token": None, "valid_date": None, "expiry_epoch": 0}
+_TOKEN_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+_token_lock = threading.Lock()
+
 # API 호출 속도 제어를 위한 전역 변수들 추가
-_api_lock = threading.Lock()  # 🆕 API 호출 동기화를 위한 락
-_last_api_call_time = None
-_min_api_interval = 0.06  # 최소 60ms 간격 (초당 약 16-17회, KIS 제한: 1초당 20건)
+_API_MAX_PER_SEC = 20  # KIS 제한: 1초당 20건
+_api_burst = 4  # 유휴 후 대기 없이 바로 보낼 수 있는 호출 수 (주문 해시키+주문 등)
+# 임의의 1초 구간 최대 호출 수 = 버스트 + 초당 보충량 <= KIS 제한이 되도록 보충 속도 설정
+_api_rate_per_sec = _API_MAX_PER_SEC - _api_burst
+_min_api_interval = 1.0 / _api_rate_per_sec  # 지속 호출 시 평균 간격 (62.5ms)
+# 동기/비동기 호출이 공유하는 토큰 버킷 (토큰이 남아 있으면 즉시 통과, 비었을 때만 대기)
+_rate_limiter = TokenBucket(rate=_api_rate_per_sec, period=1.0, capacity=_api_burst)
 _max_retries = 3  # 최대 재시도 횟수
+_reauth_lock = threading.Lock()  # 동시에 토큰 만료를 감지한 요청들의 중복 재발급 방지
 _retry_delay_base = 1.5  # 기본 재시도 지연 시간(초) - 속도 제한 오류 대응 강화
 
-# API 호출 통계 수집
-_api_stats = {
-    'total_calls': 0,
-    'success_calls': 0,
-    'rate_limit_errors': 0,
-    'other_errors': 0,
-    'total_wait_time': 0.0,  # 총 대기 시간
-    'last_rate_limit_time': None  # 마지막 속도 제한 오류 발생 시간
+# API 호출 통계 수집 - 스레드별 카운터에 락 없이 누적하고 조회 시 합산
+_STAT_COUNTERS = (
+    'total_calls',
+    'success_calls',
+    'rate_limit_errors',
+    'other_errors',
+    'total_wait_time',  # 총 대기 시간
+    'cache_hits',  # 조회 응답 캐시 적중 수 (API 호출 생략)
+)
+_stats_local = threading.local()
+_all_thread_stats: List[Dict[str, float]] = []  # 스레드별 카운터 (스레드 종료 후에도 누적값 유지)
+_all_thread_stats_lock = threading.Lock()  # 스레드 카운터 등록/초기화 시에만 사용
+_last_rate_limit_time: Optional[datetime] = None  # 마지막 속도 제한 오류 발생 시간
+
+# 조회(GET) 응답 캐시 - 여기에 등록된 시세/기준정보 TR만 TR별 TTL(초) 동안 재사용
+# (잔고/체결/주문가능 조회는 주문 직후 최신 값이 필요하므로 캐시하지 않음)
+_GET_RESPONSE_TTL: Dict[str, float] = {
+    "FHKST01010100": 1.0,     # 주식현재가 시세
+    "FHPST01010000": 1.0,     # 주식현재가 시세2
+    "FHKST01010300": 1.0,     # 주식현재가 체결
+    "FHKST11300006": 1.0,     # 관심종목(멀티종목) 시세
+    "FHPUP02100000": 5.0,     # 국내업종 현재지수
+    "FHKST01010400": 60.0,    # 주식현재가 일자별
+    "FHKST03010100": 60.0,    # 국내주식기간별시세
+    "FHKST66430300": 3600.0,  # 재무비율
+    "FHKST66430200": 3600.0,  # 손익계산서
 }
+_response_cache = TTLCache(maxsize=4096, ttl=1.0)
 
-# 기본 헤더
+# 기본 헤더 (고정값 - 세션 기본 헤더로 한 번만 등록하고 요청마다 복사하지 않음)
 _base_headers = {
     "Content-Type": "application/json",
     "Accept": "text/plain",
     "charset": "UTF-8",
-    'User-Agent': 'StockBot/1.0'
+    'User-Agent': 'StockBot/1.0',
+    "Connection": "keep-alive"
 }
+# 인증 헤더 (auth() 성공 시 설정)
+_auth_headers: Dict[str, str] = {}
+
+# 🆕 HTTP 연결 재사용 (호출마다 TCP/TLS 핸드셰이크 방지)
+_HTTP_POOL_SIZE = 32
+
+
+def _make_http_adapter() -> HTTPAdapter:
+    """
+    연결 풀 + 전송 계층 재시도 어댑터 생성
+
+    연결/읽기 오류와 502/503/504는 urllib3가 GET에 한해 재시도합니다. KIS는 토큰 만료·속도 제한을
+    HTTP 200/500 본문의 오류 코드로 알려주므로 500은 제외하고 _url_fetch에서 처리하며,
+    주문 등 POST는 중복 전송을 막기 위해 재시도하지 않습니다.
+    """
+    retry = Retry(total=_max_retries, backoff_factor=_retry_delay_base,
+                  status_forcelist=(502, 503, 504), allowed_methods=frozenset({'GET'}),
+                  respect_retry_after_header=True, raise_on_status=False)
+    return HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE, max_retries=retry)
+
+
+_SESSION = requests.Session()
+_SESSION.mount("https://", _make_http_adapter())
+_SESSION.headers.update(_base_headers)
+
+
+def close_session() -> None:
+    """HTTP 세션 종료 (풀에 남은 연결 정리, 프로그램 종료 시 호출)"""
+    _SESSION.close()
 
 
 def save_token(my_token: str, my_expired: str) -> None:
     """토큰 저장"""
-    valid_date = datetime.strptime(my_expired, '%Y-%m-%d %H:%M:%S')
+    valid_date = datetime.fromisoformat(my_expired)  # 'YYYY-MM-DD HH:MM:SS' (ISO 형식, strptime보다 빠름)
     logger.debug(f'토큰 저장: {valid_date}')
+    _write_token_file(my_token, valid_date)
+
 
+def _write_token_file(my_token: str, valid_date: datetime) -> None:
+    """토큰 파일 기록 (만료 시각을 epoch 초로 함께 저장해 읽을 때 날짜 파싱/비교를 생략)"""
+    expiry_epoch = int(valid_date.timestamp())
     with open(TOKEN_FILE_PATH, 'w', encoding='utf-8') as f:
-        f.write(f'token: {my_token}\n')
-        f.write(f'valid-date: {valid_date}\n')
+        json.dump({"token": my_token,
+                   "valid_date": valid_date.strftime(_TOKEN_DATE_FORMAT),
+                   "expiry_epoch": expiry_epoch}, f)
 
+    _TOKEN_FILE_CACHE.update(mtime=os.stat(TOKEN_FILE_PATH).st_mtime_ns,
+                             token=my_token, valid_date=valid_date, expiry_epoch=expiry_epoch)
+    _cache_token(my_token, expiry_epoch)
 
-def read_token() -> Optional[str]:
-    """토큰 읽기"""
+
+def _cache_token(my_token: str, expiry_epoch: float) -> None:
+    """토큰과 만료 시각을 프로세스 내 캐시에 기록 (monotonic 기준)"""
+    global _next_reauth_at
+    remaining = expiry_epoch - time.time()
+    expires_at = time.monotonic() + max(remaining, 0.0)
+    _TOKEN_CACHE["token"] = my_token
+    _TOKEN_CACHE["expires_at"] = expires_at
+    _next_reauth_at = expires_at - TOKEN_REFRESH_SKEW_SECONDS
+
+
+def _load_token_file() -> Optional[Tuple[str, int]]:
+    """토큰 파일에서 (토큰, 만료 epoch 초) 읽기 - 파일 수정 시각이 같으면 이전 파싱 결과 재사용"""
     try:
-        with open(TOKEN_FILE_PATH, encoding='UTF-8') as f:
-            tkg_tmp = yaml.load(f, Loader=yaml.FullLoader)
+        mtime = os.stat(TOKEN_FILE_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if mtime != _TOKEN_FILE_CACHE["mtime"]:
+        with open(TOKEN_FILE_PATH, 'rb') as f:
+            content = f.read()
+        try:
+            data = _json_loads(content)
+            token = data['token']
+            valid_date = datetime.fromisoformat(data['valid_date'])
+            expiry_epoch = data.get('expiry_epoch')
+        except ValueError:
+            # 이전 YAML 형식 토큰 파일 호환
+            data = yaml.load(content, Loader=yaml.FullLoader)
+            token = data['token']
+            valid_date = data['valid-date']
+            expiry_epoch = None
+
+        if expiry_epoch is None:
+            # 만료 epoch가 없는 이전 형식은 한 번만 변환해서 다시 기록
+            _write_token_file(token, valid_date)
+        else:
+            _TOKEN_FILE_CACHE.update(mtime=mtime, token=token, valid_date=valid_date,
+                                     expiry_epoch=int(expiry_epoch))
+
+    return _TOKEN_FILE_CACHE["token"], _TOKEN_FILE_CACHE["expiry_epoch"]
 
-        # 토큰 만료일시
-        exp_dt = datetime.strftime(tkg_tmp['valid-date'], '%Y-%m-%d %H:%M:%S')
-        # 현재일시
-        now_dt = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
 
-        # 만료일시 > 현재일시 인 경우 기존 토큰 리턴
-        if exp_dt > now_dt:
-            return tkg_tmp['token']
+def read_token() -> Optional[str]:
+    """토큰 읽기 (만료 임박 토큰은 만료로 간주)"""
+    try:
+        loaded = _load_token_file()
+        if loaded is None:
+            return None
+        token, expiry_epoch = loaded
+
+        # 만료 시각 > 현재 시각 인 경우 기존 토큰 리턴
+        if expiry_epoch - time.time() > TOKEN_REFRESH_SKEW_SECONDS:
+            _cache_token(token, expiry_epoch)
+            return token
         else:
-            logger.debug(f'토큰 만료: {tkg_tmp["valid-date"]}')
+            logger.debug(f'토큰 만료: {_TOKEN_FILE_CACHE["valid_date"]}')
             return None
 
     except Exception as e:
@@ -98,10 +246,38 @@ def read_token() -> Optional[str]:
 
 
 def _getBaseHeader() -> Dict:
-    """기본 헤더 반환"""
+    """기본 헤더 반환 (고정 헤더 + 인증 헤더)"""
+    if _autoReAuth:
+        reAuth()
+    return {**_base_headers, **_auth_headers}
+
+
+# TR별 요청 헤더 캐시 ((tr_id, tr_cont, 추가 헤더) -> 완성된 헤더, 인증 헤더 변경 시 초기화)
+_TR_HEADER_CACHE: Dict[tuple, Dict] = {}
+_TR_HEADER_CACHE_MAX = 256
+
+
+def _getTRHeader(tr_id: str, tr_cont: str, appendHeaders: Optional[Dict] = None) -> Dict:
+    """
+    TR 요청 헤더 반환 (인증 헤더 + tr_id/custtype/tr_cont 조합을 미리 만들어 두고 복사본만 반환)
+
+    고정 헤더(_base_headers)는 세션 기본 헤더로 붙으므로 여기에는 포함하지 않습니다.
+    """
     if _autoReAuth:
         reAuth()
-    return _base_headers.copy()
+
+    key = (tr_id, tr_cont, tuple(appendHeaders.items()) if appendHeaders else ())
+    headers = _TR_HEADER_CACHE.get(key)
+    if headers is None:
+        headers = {**_auth_headers, "tr_id": tr_id, "custtype": "P", "tr_cont": tr_cont}  # custtype P: 개인
+        if appendHeaders:
+            headers.update(appendHeaders)
+        if len(_TR_HEADER_CACHE) >= _TR_HEADER_CACHE_MAX:
+            _TR_HEADER_CACHE.clear()
+        _TR_HEADER_CACHE[key] = headers
+
+    # 해시키 등 호출별로 헤더를 수정하므로 복사본 반환
+    return headers.copy()
 
 
 def _setTRENV(cfg: Dict) -> None:
@@ -140,7 +316,6 @@ def changeTREnv(token_key: str, svr: str = 'prod', product: str = '01') -> None:
 
 def _getResultObject(json_data: Dict):
     """결과 객체 생성"""
-    from collections import namedtuple
     _tc_ = namedtuple('res', json_data.keys())
     return _tc_(**json_data)
 
@@ -178,10 +353,11 @@ def auth(svr: str = 'prod', product: str = '01') -> bool:
         url += '/oauth2/tokenP'
 
         try:
-            res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())
+            # 토큰 발급 요청은 reAuth를 거치지 않음 (재발급 중 재귀 호출 방지)
+            res = _SESSION.post(url, data=_json_dumps(p))
 
             if res.status_code == 200:
-                result = _getResultObject(res.json())
+                result = _getResultObject(_json_loads(res.content))
                 my_token = result.access_token
                 my_expired = result.access_token_token_expired
                 save_token(my_token, my_expired)
@@ -205,29 +381,57 @@ def auth(svr: str = 'prod', product: str = '01') -> bool:
 
     # 헤더 업데이트
     if _TRENV:
-        _base_headers["authorization"] = _TRENV.my_token
-        _base_headers["appkey"] = _TRENV.my_app
-        _base_headers["appsecret"] = _TRENV.my_sec
+        _auth_headers["authorization"] = _TRENV.my_token
+        _auth_headers["appkey"] = _TRENV.my_app
+        _auth_headers["appsecret"] = _TRENV.my_sec
+        _TR_HEADER_CACHE.clear()
         logger.info("✅ KIS API 인증 헤더 설정 완료")
     else:
         logger.error("❌ _TRENV가 설정되지 않았습니다")
         return False
 
-    _last_auth_time = now_kst()
+    _last_auth_time = time.time()
 
     if _DEBUG:
-        logger.debug(f'[{_last_auth_time}] 인증 완료!')
+        logger.debug(f'[{now_kst()}] 인증 완료!')
+
+    # 저장된 토큰을 재사용한 경우 아직 연결이 없으므로 첫 API 호출 전에 TLS 연결을 미리 맺어 둠
+    # (새 토큰 발급 시에는 발급 요청이 같은 서버 연결을 이미 풀에 남김)
+    if saved_token is not None:
+        _warm_up_connection(_TRENV.my_url)
 
     return True
 
 
+def _warm_up_connection(base_url: str) -> None:
+    """세션 연결 풀에 keep-alive 연결 하나를 미리 확보 (실패해도 무시)"""
+    try:
+        _SESSION.head(f"{base_url}/", timeout=2)
+    except requests.RequestException as e:
+        logger.debug(f"연결 예열 실패 (무시): {e}")
+
+
 def reAuth(svr: str = 'prod', product: str = '01') -> None:
     """토큰 재발급"""
-    n2 = now_kst()
-    # 23시간 후에 미리 재발급 (24시간 = 86400초, 23시간 = 82800초)
-    if (n2 - _last_auth_time).total_seconds() >= 82800:
-        logger.info("🔄 토큰 자동 재발급 시작 (23시간 경과)")
-        auth(svr, product)
+    # 만료 직전(TOKEN_REFRESH_SKEW_SECONDS)에만 재발급 - 매 호출은 미리 계산한 시각과 float 비교 1회
+    if _TRENV is None or time.monotonic() < _next_reauth_at:
+        return
+
+    with _token_lock:
+        # 대기 중 다른 스레드가 이미 재발급했으면 건너뜀
+        if is_token_expiring():
+            logger.info("🔄 토큰 자동 재발급 시작 (만료 임박)")
+            auth(svr, product)
+
+
+def is_token_expiring(skew: float = TOKEN_REFRESH_SKEW_SECONDS) -> bool:
+    """캐시된 토큰이 없거나 만료(skew초 이내 포함)되었는지 확인"""
+    return _TOKEN_CACHE["token"] is None or time.monotonic() >= _TOKEN_CACHE["expires_at"] - skew
+
+
+def get_token_expires_at() -> float:
+    """캐시된 토큰 만료 시각 반환 (time.monotonic() 기준)"""
+    return _TOKEN_CACHE["expires_at"]
 
 
 def getTREnv() -> Optional[KISEnv]:
@@ -235,19 +439,57 @@ def getTREnv() -> Optional[KISEnv]:
     return _TRENV
 
 
-def set_order_hash_key(headers: Dict, params: Dict) -> None:
-    """주문 해시키 설정"""
-    if not _TRENV:
-        return
+def _compute_local_hashkey(params: Dict) -> str:
+    """주문 본문의 해시키를 로컬에서 계산 (HMAC-SHA256, 앱 시크릿 키 사용)"""
+    body = _json_dumps(params)  # 실제 전송되는 본문과 동일한 직렬화
+    return hmac.new(SECRET_KEY.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
 
+def _fetch_remote_hashkey(headers: Dict, params: Dict) -> Optional[str]:
+    """/uapi/hashkey 호출로 해시키 발급 (실패 시 None)"""
     url = f"{_TRENV.my_url}/uapi/hashkey"
 
     try:
-        res = requests.post(url, data=json.dumps(params), headers=headers)
+        res = _SESSION.post(url, data=_json_dumps(params), headers=headers)
         if res.status_code == 200:
-            headers['hashkey'] = _getResultObject(res.json()).HASH
+            return _getResultObject(_json_loads(res.content)).HASH
     except Exception as e:
         logger.error(f"해시키 발급 오류: {e}")
+    return None
+
+
+def set_order_hash_key(headers: Dict, params: Dict) -> None:
+    """
+    주문 해시키 설정
+
+    USE_LOCAL_HASHKEY 환경변수가 켜져 있으면 첫 주문에서 원격 해시키와 로컬 계산값을 한 번 비교하고,
+    일치하면 이후 주문은 로컬 계산만 사용합니다 (불일치 시 계속 원격 발급).
+    """
+    global _local_hashkey_verified
+
+    if not _TRENV:
+        return
+
+    if _USE_LOCAL_HASHKEY and _local_hashkey_verified is not False:
+        local_hash = _compute_local_hashkey(params)
+        if _local_hashkey_verified:
+            headers['hashkey'] = local_hash
+            return
+
+        remote_hash = _fetch_remote_hashkey(headers, params)
+        if remote_hash is None:
+            return
+        _local_hashkey_verified = hmac.compare_digest(local_hash, remote_hash)
+        if _local_hashkey_verified:
+            logger.info("🔑 로컬 해시키 검증 완료 - 이후 주문은 로컬에서 계산합니다")
+        else:
+            logger.warning("⚠️ 로컬 해시키가 원격 발급값과 다릅니다 - 원격 발급을 계속 사용합니다")
+        headers['hashkey'] = remote_hash
+        return
+
+    remote_hash = _fetch_remote_hashkey(headers, params)
+    if remote_hash is not None:
+        headers['hashkey'] = remote_hash
 
 
 class APIResp:
@@ -258,31 +500,24 @@ class APIResp:
         self._resp = resp
         self._header = self._setHeader()
         self._body = self._setBody()
-        self._err_code = self._body.msg_cd if hasattr(self._body, 'msg_cd') else ''
-        self._err_message = self._body.msg1 if hasattr(self._body, 'msg1') else ''
+        self._err_code = getattr(self._body, 'msg_cd', '')
+        self._err_message = getattr(self._body, 'msg1', '')
+        self.ok = getattr(self._body, 'rt_cd', None) == '0'  # 성공 여부 (생성 시 한 번만 판정)
 
     def getResCode(self) -> int:
         return self._rescode
 
     def _setHeader(self):
-        from collections import namedtuple
-        fld = {}
-        for x in self._resp.headers.keys():
-            if x.islower():
-                fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple('header', fld.keys())
-        return _th_(**fld)
+        # 응답마다 namedtuple 클래스를 생성하지 않고 SimpleNamespace로 속성 접근 제공
+        headers = self._resp.headers
+        return SimpleNamespace(**{x: headers.get(x) for x in headers.keys() if x.islower()})
 
     def _setBody(self):
-        from collections import namedtuple
         try:
-            body_data = self._resp.json()
-            _tb_ = namedtuple('body', body_data.keys())
-            return _tb_(**body_data)
+            return SimpleNamespace(**_json_loads(self._resp.content))
         except:
             # JSON 파싱 실패시 빈 객체 반환
-            _tb_ = namedtuple('body', ['rt_cd', 'msg_cd', 'msg1'])
-            return _tb_(rt_cd='1', msg_cd='ERROR', msg1='JSON 파싱 실패')
+            return SimpleNamespace(rt_cd='1', msg_cd='ERROR', msg1='JSON 파싱 실패')
 
     def getHeader(self):
         return self._header
@@ -294,10 +529,11 @@ class APIResp:
         return self._resp
 
     def isOK(self) -> bool:
-        try:
-            return self.getBody().rt_cd == '0'
-        except:
-            return False
+        return self.ok
+
+    def getOutput(self, name: str = 'output', default: Any = None) -> Any:
+        """본문의 output/output1/output2 필드 반환 (없으면 default)"""
+        return getattr(self._body, name, default)
 
     def getErrorCode(self) -> str:
         return self._err_code
@@ -310,12 +546,54 @@ class APIResp:
         logger.error(f'rt_cd: {self.getBody().rt_cd}, msg_cd: {self.getErrorCode()}, msg1: {self.getErrorMessage()}')
 
 
+class RetriableAPIError(Exception):
+    """재시도 가능한 일시적 API 오류 (HTTP 429/5xx)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after  # 서버가 알려준 재시도 대기 시간(초)
+
+
+_RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_raise_retriable = contextvars.ContextVar('kis_raise_retriable', default=False)
+
+
+@contextmanager
+def raise_retriable_errors():
+    """이 블록 안의 _url_fetch는 일시적 HTTP 오류를 None 대신 RetriableAPIError로 전달"""
+    token = _raise_retriable.set(True)
+    try:
+        yield
+    finally:
+        _raise_retriable.reset(token)
+
+
+def _parse_retry_after(res) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜) 파싱"""
+    value = res.headers.get('Retry-After') if res.headers else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(tz=now_kst().tzinfo)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _raise_if_retriable(res) -> None:
+    """호출자가 요청한 경우(raise_retriable_errors) 일시적 HTTP 오류를 예외로 전달"""
+    if _raise_retriable.get() and res.status_code in _RETRIABLE_STATUS_CODES:
+        raise RetriableAPIError(f"HTTP {res.status_code}", res.status_code, _parse_retry_after(res))
+
+
 def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                appendHeaders: Optional[Dict] = None, postFlag: bool = False,
-               hashFlag: bool = True) -> Optional[APIResp]:
-    """API 호출 공통 함수 (속도 제한 및 재시도 로직 포함)"""
-    global _api_stats
-    
+               hashFlag: bool = True, use_cache: bool = True) -> Optional[APIResp]:
+    """API 호출 공통 함수 (속도 제한 및 재시도 로직 포함, use_cache=False면 응답 캐시를 읽지 않고 새로 조회)"""
     if not _TRENV:
         logger.error("인증되지 않음. auth() 호출 필요")
         return None
@@ -325,21 +603,25 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
     # TR ID 설정
     tr_id = ptr_id
 
-    # 재시도 로직
+    # 캐시 대상 조회 TR이면 TTL 내 동일 요청은 API 호출/속도 제한 대기 없이 캐시 응답 반환
+    cache_key = None
+    cache_ttl = None if postFlag or appendHeaders else _GET_RESPONSE_TTL.get(tr_id)
+    if cache_ttl:
+        cache_key = (tr_id, api_url, tr_cont, tuple(sorted(params.items())))
+        cached = _response_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            _thread_stats()['cache_hits'] += 1
+            return cached
+
+    # 재시도 로직 (전송 오류 재시도는 세션 어댑터가 담당, 여기서는 KIS 오류 코드만 처리)
     for attempt in range(_max_retries + 1):
         try:
             # API 호출 속도 제한 적용
             _wait_for_api_limit()
 
-            # 헤더 설정
-            headers = _getBaseHeader()
-            headers["tr_id"] = tr_id
-            headers["custtype"] = "P"  # 개인
-            headers["tr_cont"] = tr_cont
-
-            # 추가 헤더
-            if appendHeaders:
-                headers.update(appendHeaders)
+            # 헤더 설정 (추가 헤더 포함)
+            token = _TRENV.my_token
+            headers = _getTRHeader(tr_id, tr_cont, appendHeaders)
 
             if _DEBUG:
                 logger.debug(f"API 호출 ({attempt + 1}/{_max_retries + 1}): {url}, TR: {tr_id}")
@@ -348,187 +630,303 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
             if postFlag:
                 if hashFlag:
                     set_order_hash_key(headers, params)
-                res = requests.post(url, headers=headers, data=json.dumps(params))
+                res = _SESSION.post(url, headers=headers, data=_json_dumps(params))
             else:
-                res = requests.get(url, headers=headers, params=params)
+                res = _SESSION.get(url, headers=headers, params=params)
+        except Exception as e:
+            # 주문 등 POST 요청은 전송 여부가 불확실하므로 재전송하지 않음 (중복 주문 방지)
+            logger.error(f"API 호출 오류{' (POST, 재시도 안 함)' if postFlag else ''}: {e}")
+            return None
+
+        # 응답 처리
+        ar = None
+        if res.status_code == 200:
+            ar = APIResp(res)
+            if ar.isOK():
+                _thread_stats()['success_calls'] += 1
+                if _DEBUG:
+                    logger.debug(f"API 응답 성공: {tr_id}")
+                if cache_key is not None:
+                    _response_cache.set(cache_key, ar, ttl=cache_ttl)
+                return ar
+
+        # 재시도 가능한 KIS 오류 코드면 코드별 처리기가 정한 대기 후 재호출
+        handler = _ERROR_HANDLERS.get(_kis_error_code(res, ar))
+        if handler is not None:
+            delay = handler(attempt, token)
+            if delay is not None:
+                if delay > 0:
+                    time.sleep(delay)
+                continue
+
+        if ar is not None:
+            # 다른 비즈니스 오류는 즉시 반환
+            logger.error(f"API 비즈니스 오류: {ar.getErrorCode()} - {ar.getErrorMessage()}")
+            return ar
+
+        # HTTP 오류
+        logger.error(f"API 오류: {res.status_code} - {res.text}")
+        _raise_if_retriable(res)
+        return None
+
+    logger.error(f"API 호출 최대 재시도 횟수 초과: {tr_id}")
+    return None
+
+
+def _kis_error_code(res, ar: Optional[APIResp]) -> str:
+    """재시도 판단용 KIS 오류 코드 (HTTP 200은 응답 코드, 500은 본문에서 토큰 만료/속도 제한 식별)"""
+    if ar is not None:
+        return ar.getErrorCode()
+    if res.status_code == 500:
+        if _is_token_expired_error(res.content):
+            return 'EGW00123'
+        if _is_rate_limit_error(res.content):
+            return 'EGW00201'
+    return ''
+
+
+def _handle_rate_limit(attempt: int, token: str) -> Optional[float]:
+    """속도 제한 오류(EGW00201) 처리 - 재시도 대기 시간 반환 (재시도 횟수 초과 시 None)"""
+    rate_limit_errors = _record_rate_limit_error()
+    if attempt < _max_retries:
+        return _rate_limit_backoff(attempt, rate_limit_errors)
+    logger.error(f"속도 제한 오류 재시도 횟수 초과 (누적 {rate_limit_errors}회)")
+    _thread_stats()['other_errors'] += 1
+    return None
+
+
+def _handle_token_expiry(attempt: int, token: str) -> Optional[float]:
+    """토큰 만료 오류(EGW00123) 처리 - 재발급 성공 시 0(즉시 재시도), 실패 시 None"""
+    logger.warning("🔑 토큰이 만료되었습니다. 자동 재발급을 시도합니다...")
+    if attempt < _max_retries and _reauth_if_stale(token):
+        logger.info("✅ 토큰 재발급 성공. API 호출을 재시도합니다.")
+        return 0.0
+    logger.error("❌ 토큰 재발급 실패")
+    return None
+
+
+def _rate_limit_backoff(attempt: int, rate_limit_errors: int) -> float:
+    """속도 제한 오류 재시도 대기 시간 계산 (지수 백오프, 누적 오류가 많으면 더 길게)"""
+    base_delay = _retry_delay_base
+    if rate_limit_errors > 10:
+        # 속도 제한 오류가 10회 이상 발생하면 더 긴 대기
+        base_delay = _retry_delay_base * 1.5
+
+    wait_time = base_delay * (2 ** attempt)
+    _thread_stats()['total_wait_time'] += wait_time
+    logger.warning(f"속도 제한 오류 발생 (누적 {rate_limit_errors}회). {wait_time:.1f}초 후 재시도 ({attempt + 1}/{_max_retries + 1})")
+    return wait_time
+
+
+# 재시도 가능한 KIS 오류 코드별 처리기 (반환값: 재시도 전 대기 초, None이면 재시도 안 함)
+_ERROR_HANDLERS = {
+    'EGW00201': _handle_rate_limit,
+    'EGW00123': _handle_token_expiry,
+}
+
+
+class _AsyncHTTPResponse:
+    """aiohttp 응답을 APIResp가 기대하는 requests.Response 형태로 감싼 객체"""
+
+    def __init__(self, status: int, headers, content: bytes):
+        self.status_code = status
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return _json_loads(self.content)
+
+
+def create_async_session() -> aiohttp.ClientSession:
+    """
+    비동기 조회용 aiohttp 세션 생성 (keep-alive 연결 풀을 여러 요청이 공유)
+
+    _getTRHeader는 고정 헤더를 포함하지 않으므로 _url_fetch_async에는 이 함수로 만든 세션을 사용해야 합니다.
+    """
+    connector = aiohttp.TCPConnector(limit=_HTTP_POOL_SIZE, keepalive_timeout=30)
+    return aiohttp.ClientSession(connector=connector, headers=_base_headers)
+
+
+def _reauth_if_stale(old_token: str) -> bool:
+    """토큰 만료 응답 처리 - 다른 요청이 이미 재발급했으면 재발급하지 않고 True 반환"""
+    with _reauth_lock:
+        if _TRENV is not None and _TRENV.my_token != old_token:
+            return True
+        return _auto_reauth()
+
+
+async def _url_fetch_async(session: aiohttp.ClientSession, api_url: str, ptr_id: str, tr_cont: str,
+                           params: Dict, appendHeaders: Optional[Dict] = None,
+                           use_cache: bool = True) -> Optional[APIResp]:
+    """
+    API 조회(GET) 비동기 버전 - 여러 종목 시세를 동시에 조회할 때 사용
+
+    _url_fetch와 같은 재시도 규칙(속도 제한 오류 지수 백오프, 토큰 만료 시 재발급 후 재시도,
+    네트워크 예외 재시도)을 이벤트 루프를 막지 않고 적용합니다.
+    """
+    if not _TRENV:
+        logger.error("인증되지 않음. auth() 호출 필요")
+        return None
 
-            # 응답 처리
+    url = f"{_TRENV.my_url}{api_url}"
+    tr_id = ptr_id
+
+    # 동기 호출과 같은 조회 응답 캐시 사용
+    cache_key = None
+    cache_ttl = None if appendHeaders else _GET_RESPONSE_TTL.get(tr_id)
+    if cache_ttl:
+        cache_key = (tr_id, api_url, tr_cont, tuple(sorted(params.items())))
+        cached = _response_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            _thread_stats()['cache_hits'] += 1
+            return cached
+
+    for attempt in range(_max_retries + 1):
+        try:
+            # 속도 제한은 동기 호출과 같은 토큰 버킷을 공유
+            await _wait_for_api_limit_async()
+
+            token = _TRENV.my_token
+            headers = _getTRHeader(tr_id, tr_cont, appendHeaders)
+
+            async with session.get(url, headers=headers, params=params) as resp:
+                content = await resp.read()
+                res = _AsyncHTTPResponse(resp.status, resp.headers, content)
+
+            ar = None
             if res.status_code == 200:
                 ar = APIResp(res)
                 if ar.isOK():
-                    _api_stats['success_calls'] += 1
-                    if _DEBUG:
-                        logger.debug(f"API 응답 성공: {tr_id}")
+                    _thread_stats()['success_calls'] += 1
+                    if cache_key is not None:
+                        _response_cache.set(cache_key, ar, ttl=cache_ttl)
                     return ar
-                else:
-                    # API 응답은 200이지만 비즈니스 오류
-                    if ar.getErrorCode() == 'EGW00201':  # 속도 제한 오류
-                        # 속도 제한 오류 통계 수집
-                        _api_stats['rate_limit_errors'] += 1
-                        _api_stats['last_rate_limit_time'] = now_kst()
-                        
-                        if attempt < _max_retries:
-                            # 동적 재시도 지연: 연속 오류 시 지연 시간 증가
-                            base_delay = _retry_delay_base
-                            if _api_stats['rate_limit_errors'] > 10:
-                                base_delay = _retry_delay_base * 1.5
-                            
-                            wait_time = base_delay * (2 ** attempt)  # 지수 백오프
-                            _api_stats['total_wait_time'] += wait_time
-                            logger.warning(f"속도 제한 오류 발생 (누적 {_api_stats['rate_limit_errors']}회). {wait_time:.1f}초 후 재시도 ({attempt + 1}/{_max_retries + 1})")
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            logger.error(f"API 오류: {res.status_code} - {ar.getErrorMessage()}")
-                            _api_stats['other_errors'] += 1
-                            return ar
-                    # 🆕 토큰 만료 오류 처리
-                    elif ar.getErrorCode() == 'EGW00123':  # 토큰 만료 오류
-                        logger.warning("🔑 토큰이 만료되었습니다. 자동 재발급을 시도합니다...")
-                        try:
-                            # 토큰 재발급 시도
-                            if _auto_reauth():
-                                logger.info("✅ 토큰 재발급 성공. API 호출을 재시도합니다.")
-                                # 헤더 업데이트 (새로운 토큰 적용)
-                                headers = _getBaseHeader()
-                                headers["tr_id"] = tr_id
-                                headers["custtype"] = "P"
-                                headers["tr_cont"] = tr_cont
-                                if appendHeaders:
-                                    headers.update(appendHeaders)
-
-                                # API 재호출
-                                if postFlag:
-                                    if hashFlag:
-                                        set_order_hash_key(headers, params)
-                                    res = requests.post(url, headers=headers, data=json.dumps(params))
-                                else:
-                                    res = requests.get(url, headers=headers, params=params)
-
-                                # 재호출 결과 처리
-                                if res.status_code == 200:
-                                    ar_retry = APIResp(res)
-                                    if ar_retry.isOK():
-                                        logger.info(f"✅ 토큰 재발급 후 API 호출 성공: {tr_id}")
-                                        return ar_retry
-                                    else:
-                                        logger.error(f"❌ 토큰 재발급 후 API 호출 실패: {ar_retry.getErrorMessage()}")
-                                        return ar_retry
-                                else:
-                                    logger.error(f"❌ 토큰 재발급 후 HTTP 오류: {res.status_code}")
-                                    return None
-                            else:
-                                logger.error("❌ 토큰 재발급 실패")
-                                return ar
-                        except Exception as e:
-                            logger.error(f"❌ 토큰 재발급 중 오류 발생: {e}")
-                            return ar
-                    else:
-                        # 다른 비즈니스 오류는 즉시 반환
-                        logger.error(f"API 비즈니스 오류: {ar.getErrorCode()} - {ar.getErrorMessage()}")
-                        return ar
-            else:
-                # HTTP 오류
-                if res.status_code == 500:
-                    # 🆕 500 오류에서 토큰 만료 메시지 확인
-                    try:
-                        response_data = json.loads(res.text)
-                        if (response_data.get('msg_cd') == 'EGW00123' or
-                            '기간이 만료된 token' in response_data.get('msg1', '')):
-                            logger.warning("🔑 HTTP 500 토큰 만료 오류 감지. 자동 재발급을 시도합니다...")
-                            try:
-                                if _auto_reauth():
-                                    logger.info("✅ 토큰 재발급 성공. API 호출을 재시도합니다.")
-                                    continue  # 다음 루프에서 재시도
-                                else:
-                                    logger.error("❌ 토큰 재발급 실패")
-                                    return None
-                            except Exception as e:
-                                logger.error(f"❌ 토큰 재발급 중 오류 발생: {e}")
-                                return None
-                        elif _is_rate_limit_error(res.text):
-                            # 속도 제한 오류 통계 수집
-                            _api_stats['rate_limit_errors'] += 1
-                            _api_stats['last_rate_limit_time'] = now_kst()
-                            
-                            if attempt < _max_retries:
-                                # 동적 재시도 지연: 연속 오류 시 지연 시간 증가
-                                base_delay = _retry_delay_base
-                                if _api_stats['rate_limit_errors'] > 10:
-                                    # 속도 제한 오류가 10회 이상 발생하면 더 긴 대기
-                                    base_delay = _retry_delay_base * 1.5
-                                
-                                wait_time = base_delay * (2 ** attempt)  # 지수 백오프
-                                _api_stats['total_wait_time'] += wait_time
-                                logger.warning(f"HTTP 500 속도 제한 오류 (누적 {_api_stats['rate_limit_errors']}회). {wait_time:.1f}초 후 재시도 ({attempt + 1}/{_max_retries + 1})")
-                                time.sleep(wait_time)
-                                continue
-                            else:
-                                logger.error(f"API 오류: {res.status_code} - {res.text}")
-                                _api_stats['other_errors'] += 1
-                                return None
-                        else:
-                            logger.error(f"API 오류: {res.status_code} - {res.text}")
-                            return None
-                    except json.JSONDecodeError:
-                        logger.error(f"API 오류: {res.status_code} - {res.text}")
-                        return None
-                else:
-                    logger.error(f"API 오류: {res.status_code} - {res.text}")
-                    return None
 
-        except Exception as e:
+            # 동기 호출과 같은 오류 코드별 처리기 사용 (토큰 재발급은 블로킹이므로 스레드에서 실행)
+            handler = _ERROR_HANDLERS.get(_kis_error_code(res, ar))
+            if handler is not None:
+                delay = await asyncio.to_thread(handler, attempt, token)
+                if delay is not None:
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    continue
+
+            if ar is not None:
+                logger.error(f"API 비즈니스 오류: {ar.getErrorCode()} - {ar.getErrorMessage()}")
+                return ar
+
+            logger.error(f"API 오류: {res.status_code} - {res.text}")
+            _thread_stats()['other_errors'] += 1
+            return None
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             if attempt < _max_retries:
                 wait_time = _retry_delay_base * (2 ** attempt)
-                logger.warning(f"API 호출 예외 발생. {wait_time}초 후 재시도 ({attempt + 1}/{_max_retries + 1}): {e}")
-                time.sleep(wait_time)
+                logger.warning(f"API 비동기 호출 예외 발생. {wait_time}초 후 재시도 ({attempt + 1}/{_max_retries + 1}): {e}")
+                await asyncio.sleep(wait_time)
                 continue
-            else:
-                logger.error(f"API 호출 오류: {e}")
-                return None
+            logger.error(f"API 비동기 호출 오류: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"API 비동기 호출 오류: {e}")
+            return None
 
     logger.error(f"API 호출 최대 재시도 횟수 초과: {tr_id}")
     return None
 
 
+def _thread_stats() -> Dict[str, float]:
+    """현재 스레드의 통계 카운터 반환 (처음 호출한 스레드는 카운터를 만들어 등록)"""
+    try:
+        return _stats_local.counts
+    except AttributeError:
+        counts = dict.fromkeys(_STAT_COUNTERS, 0)
+        counts['total_wait_time'] = 0.0
+        with _all_thread_stats_lock:
+            _all_thread_stats.append(counts)
+        _stats_local.counts = counts
+        return counts
+
+
+def _stat_total(name: str):
+    """모든 스레드의 카운터 합계"""
+    with _all_thread_stats_lock:
+        return sum(counts[name] for counts in _all_thread_stats)
+
+
+def _record_rate_limit_error() -> int:
+    """속도 제한 오류 기록 후 누적 횟수 반환"""
+    global _last_rate_limit_time
+    _thread_stats()['rate_limit_errors'] += 1
+    _last_rate_limit_time = now_kst()
+    return _stat_total('rate_limit_errors')
+
+
+def _record_api_wait(wait_time: float) -> None:
+    """속도 제한 대기 통계 기록 (스레드별 카운터라 락 없이 갱신)"""
+    stats = _thread_stats()
+    stats['total_wait_time'] += wait_time
+    stats['total_calls'] += 1
+
+    if _DEBUG and wait_time > 0:
+        logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기")
+
+
 def _wait_for_api_limit():
     """API 호출 속도 제한을 위한 대기 (스레드 안전)"""
-    global _last_api_call_time, _api_stats
-    
-    # 🆕 락을 사용하여 동시 호출 방지
-    with _api_lock:
-        current_time = now_kst().timestamp()
-
-        if _last_api_call_time is not None:
-            elapsed = current_time - _last_api_call_time
-            if elapsed < _min_api_interval:
-                wait_time = _min_api_interval - elapsed
-                _api_stats['total_wait_time'] += wait_time
-                if _DEBUG:
-                    logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 (이전 호출로부터 {elapsed:.3f}초 경과)")
-                time.sleep(wait_time)
+    _record_api_wait(_rate_limiter.acquire())
 
-        _last_api_call_time = now_kst().timestamp()
-        _api_stats['total_calls'] += 1
 
+async def _wait_for_api_limit_async():
+    """API 호출 속도 제한을 위한 대기 (비동기 - 이벤트 루프를 막지 않음)"""
+    _record_api_wait(await _rate_limiter.acquire_async())
 
-def _is_rate_limit_error(response_text: str) -> bool:
-    """응답이 속도 제한 오류인지 확인"""
+
+# KIS 오류 본문 식별용 바이트 패턴 (JSON 파싱 없이 원본 본문에서 바로 검색)
+_RATE_LIMIT_MARKERS = (b'EGW00201', '초당 거래건수를 초과'.encode('utf-8'))
+_TOKEN_EXPIRED_MARKERS = (b'EGW00123', '기간이 만료된 token'.encode('utf-8'))
+
+
+def _body_has_marker(response_body, markers: Tuple[bytes, ...], msg_cd: str, msg_text: str) -> bool:
+    """응답 본문에 오류 코드/메시지가 있는지 확인 (본문 bytes/str 모두 허용)"""
+    if isinstance(response_body, str):
+        response_body = response_body.encode('utf-8')
+    if any(marker in response_body for marker in markers):
+        return True
+    if b'\\u' not in response_body:
+        return False
+
+    # 메시지가 \uXXXX로 이스케이프된 경우에만 파싱해서 확인
     try:
-        response_data = json.loads(response_text)
-        return (response_data.get('msg_cd') == 'EGW00201' or
-                '초당 거래건수를 초과' in response_data.get('msg1', ''))
-    except:
+        data = _json_loads(response_body)
+        return data.get('msg_cd') == msg_cd or msg_text in data.get('msg1', '')
+    except Exception:
         return False
 
 
+def _is_rate_limit_error(response_body) -> bool:
+    """응답이 속도 제한 오류인지 확인"""
+    return _body_has_marker(response_body, _RATE_LIMIT_MARKERS, 'EGW00201', '초당 거래건수를 초과')
+
+
+def _is_token_expired_error(response_body) -> bool:
+    """응답이 토큰 만료 오류인지 확인"""
+    return _body_has_marker(response_body, _TOKEN_EXPIRED_MARKERS, 'EGW00123', '기간이 만료된 token')
+
+
 def set_api_rate_limit(interval_seconds: float = 0.35, max_retries: int = 3, retry_delay: float = 2.0):
     """API 호출 속도 제한 설정을 동적으로 변경"""
     global _min_api_interval, _max_retries, _retry_delay_base
 
     _min_api_interval = interval_seconds
+    _rate_limiter.set_rate(1.0 / interval_seconds)
     _max_retries = max_retries
     _retry_delay_base = retry_delay
+    _SESSION.mount("https://", _make_http_adapter())  # 전송 계층 재시도 설정도 함께 갱신
 
     logger.info(f"API 속도 제한 설정 변경: 간격={interval_seconds}초, 최대재시도={max_retries}회, 재시도지연={retry_delay}초")
 
@@ -537,41 +935,53 @@ def get_api_rate_limit_info():
     """현재 API 속도 제한 설정 정보 반환"""
     return {
         'min_interval': _min_api_interval,
+        'burst': _api_burst,
         'max_retries': _max_retries,
         'retry_delay_base': _retry_delay_base
     }
 
 
 def get_api_statistics():
-    """API 호출 통계 정보 반환"""
-    global _api_stats
-    total_calls = _api_stats['total_calls']
-    success_rate = (_api_stats['success_calls'] / max(total_calls, 1)) * 100
-    rate_limit_rate = (_api_stats['rate_limit_errors'] / max(total_calls, 1)) * 100
+    """API 호출 통계 정보 반환 (스레드별 카운터 합산)"""
+    totals = dict.fromkeys(_STAT_COUNTERS, 0)
+    with _all_thread_stats_lock:
+        for counts in _all_thread_stats:
+            for name in _STAT_COUNTERS:
+                totals[name] += counts[name]
+
+    total_calls = totals['total_calls']
+    success_rate = (totals['success_calls'] / max(total_calls, 1)) * 100
+    rate_limit_rate = (totals['rate_limit_errors'] / max(total_calls, 1)) * 100
     
     return {
         'total_calls': total_calls,
-        'success_calls': _api_stats['success_calls'],
-        'rate_limit_errors': _api_stats['rate_limit_errors'],
-        'other_errors': _api_stats['other_errors'],
+        'success_calls': totals['success_calls'],
+        'rate_limit_errors': totals['rate_limit_errors'],
+        'other_errors': totals['other_errors'],
         'success_rate': round(success_rate, 2),
         'rate_limit_rate': round(rate_limit_rate, 2),
-        'total_wait_time': round(_api_stats['total_wait_time'], 2),
-        'last_rate_limit_time': _api_stats['last_rate_limit_time'].isoformat() if _api_stats['last_rate_limit_time'] else None
+        'total_wait_time': round(totals['total_wait_time'], 2),
+        'cache_hits': totals['cache_hits'],
+        'last_rate_limit_time': _last_rate_limit_time.isoformat() if _last_rate_limit_time else None
     }
 
 
+def clear_response_cache(disk: bool = False) -> int:
+    """조회 응답 캐시 비우기 (disk=True면 kis_cache 디스크 캐시도 삭제, 제거한 메모리 항목 수 반환)"""
+    if disk:
+        kis_cache.clear()
+    return _response_cache.invalidate()
+
+
 def reset_api_statistics():
     """API 통계 초기화"""
-    global _api_stats
-    _api_stats = {
-        'total_calls': 0,
-        'success_calls': 0,
-        'rate_limit_errors': 0,
-        'other_errors': 0,
-        'total_wait_time': 0.0,
-        'last_rate_limit_time': None
-    }
+    global _last_rate_limit_time
+    with _all_thread_stats_lock:
+        for counts in _all_thread_stats:
+            for name in _STAT_COUNTERS:
+                counts[name] = 0
+            counts['total_wait_time'] = 0.0
+    _last_rate_limit_time = None
 
 
 # 🆕 웹소켓 연결을 위한 helper 함수들
@@ -0,0 +1,103 @@
+"""
+KIS API 응답 디스크 캐시 모듈
+재무제표/과거 시세처럼 공시·마감 이후 바뀌지 않는 조회 결과를 TR별 TTL 동안 파일로 보관합니다.
+"""
+import hashlib
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_DAY = 24 * 60 * 60
+
+# TR별 디스크 캐시 TTL(초) - 여기에 없는 TR은 캐시하지 않음
+# (현재가/지수 등 실시간 시세는 프로세스 내 응답 캐시(kis_auth)만 사용)
+TR_CACHE_TTL: Dict[str, float] = {
+    "FHKST66430300": 90 * _DAY,  # 재무비율 (분기 공시 주기)
+    "FHKST66430200": 90 * _DAY,  # 손익계산서 (분기 공시 주기)
+    "FHKST03010100": 1 * _DAY,   # 국내주식기간별시세 (오늘 이전 구간만)
+}
+
+DEFAULT_CACHE_DIR = Path("cache/kis")
+
+
+class FileCache:
+    """
+    TR별 디스크 캐시
+
+    {base_dir}/{tr_id}/{key}.pkl 파일에 {"ts": 저장 시각(epoch 초), "data": 값}을 저장하고,
+    조회 시 ts 기준으로 TTL이 지났으면 만료로 처리합니다.
+    """
+
+    def __init__(self, base_dir: Path = DEFAULT_CACHE_DIR, ttl_seconds: float = 3600.0):
+        self.base_dir = Path(base_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(url: str, tr_id: str, params: Dict[str, Any]) -> str:
+        """요청 키 (url|tr_id|정렬된 파라미터의 md5)"""
+        raw = f"{url}|{tr_id}|{sorted(params.items())}"
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, tr_id: str, key: str) -> Path:
+        return self.base_dir / tr_id / f"{key}.pkl"
+
+    def get(self, tr_id: str, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """만료되지 않은 캐시 값 반환 (없거나 만료/손상 시 None)"""
+        cache_file = self._path(tr_id, key)
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"KIS 응답 캐시 로드 실패 {tr_id}: {e}")
+            return None
+
+        if time.time() - entry["ts"] >= (self.ttl_seconds if ttl is None else ttl):
+            return None
+        return entry["data"]
+
+    def set(self, tr_id: str, key: str, data: Any) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        cache_file = self._path(tr_id, key)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({"ts": time.time(), "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.debug(f"KIS 응답 캐시 저장 실패 {tr_id}: {e}")
+
+    def clear(self, tr_id: Optional[str] = None) -> None:
+        """캐시 삭제 (tr_id가 없으면 전체)"""
+        shutil.rmtree(self.base_dir / tr_id if tr_id else self.base_dir, ignore_errors=True)
+
+
+_default_cache = FileCache()
+
+
+def load(url: str, tr_id: str, params: Dict[str, Any]) -> Optional[Any]:
+    """TR별 TTL로 기본 캐시 조회 (캐시 대상 TR이 아니면 None)"""
+    ttl = TR_CACHE_TTL.get(tr_id)
+    if ttl is None:
+        return None
+    return _default_cache.get(tr_id, FileCache.make_key(url, tr_id, params), ttl)
+
+
+def store(url: str, tr_id: str, params: Dict[str, Any], data: Any) -> None:
+    """기본 캐시에 저장 (캐시 대상 TR만)"""
+    if tr_id in TR_CACHE_TTL:
+        _default_cache.set(tr_id, FileCache.make_key(url, tr_id, params), data)
+
+
+def clear(tr_id: Optional[str] = None) -> None:
+    """기본 캐시 삭제"""
+    _default_cache.clear(tr_id)
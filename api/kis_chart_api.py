@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple, Any
 from utils.logger import setup_logger
 from . import kis_auth as kis
-from utils.korean_time import now_kst
+from utils.korean_time import now_kst, parse_yyyymmdd
 from config.market_hours import MarketHours
 
 logger = setup_logger(__name__)
@@ -229,12 +229,12 @@ def get_historical_minute_data(stock_code: str, target_date: str,
     """
     try:
         # 기본 시도 + 최대 FALLBACK_MAX_DAYS일까지 이전 일로 폴백
-        from datetime import datetime as _dt, timedelta as _td
+        from datetime import timedelta as _td
         attempt_dates = []
         try:
-            base_dt = _dt.strptime(target_date, "%Y%m%d")
+            base_dt = parse_yyyymmdd(target_date)
         except Exception:
-            base_dt = _dt.strptime(now_kst().strftime("%Y%m%d"), "%Y%m%d")
+            base_dt = now_kst().replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
         for back in range(0, FALLBACK_MAX_DAYS + 1):
             d = (base_dt - _td(days=back)).strftime("%Y%m%d")
             attempt_dates.append(d)
@@ -626,8 +626,8 @@ def get_full_trading_day_data(stock_code: str, target_date: str = "",
         if not selected_time:
             selected_time = now_kst().strftime("%H%M%S")
 
-        from datetime import datetime as _dt, timedelta as _td
-        base_dt = _dt.strptime(target_date, "%Y%m%d")
+        from datetime import timedelta as _td
+        base_dt = parse_yyyymmdd(target_date)
         # 최대 FALLBACK_MAX_DAYS일까지 이전 날짜로 폴백 시도
         for back in range(0, FALLBACK_MAX_DAYS + 1):
             attempt_date = (base_dt - _td(days=back)).strftime("%Y%m%d")
@@ -726,8 +726,8 @@ async def get_full_trading_day_data_async(stock_code: str, target_date: str = ""
         if not selected_time:
             selected_time = now_kst().strftime("%H%M%S")
 
-        from datetime import datetime as _dt, timedelta as _td
-        base_dt = _dt.strptime(target_date, "%Y%m%d")
+        from datetime import timedelta as _td
+        base_dt = parse_yyyymmdd(target_date)
 
         # 🆕 동적 시장 시작 시간 가져오기
         if not start_time:
@@ -802,8 +802,6 @@ async def get_full_trading_day_data_async(stock_code: str, target_date: str = ""
 
             async def fetch_segment_data(start_time: str, end_time: str):
                 try:
-                    await asyncio.sleep(0.05)  # API 제한 준수
-
                     # 종목별 적절한 시장 구분 코드 사용
                     div_code = get_div_code_for_stock(stock_code)
 
@@ -4,8 +4,9 @@ KIS 재무비율/재무데이터 조회 모듈
 
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
@@ -14,11 +15,92 @@ import pandas as pd
 from utils.logger import setup_logger
 from utils.korean_time import now_kst
 from . import kis_auth as kis
+from . import kis_cache
 
 logger = setup_logger(__name__)
 
-
-@dataclass
+# 일괄 조회 동시 요청 수 (초당 호출 수는 kis_auth 공유 토큰 버킷이 제한)
+FINANCIAL_BULK_MAX_WORKERS = 8
+
+# API 응답 필드 -> 숫자 항목 이름
+_RATIO_NUMERIC_FIELDS = {
+    "grs": "sales_growth",
+    "bsop_prfi_inrt": "operating_income_growth",
+    "ntin_inrt": "net_income_growth",
+    "roe_val": "roe_value",
+    "eps": "eps",
+    "sps": "sps",
+    "bps": "bps",
+    "rsrv_rate": "reserve_ratio",
+    "lblt_rate": "liability_ratio",
+}
+_INCOME_NUMERIC_FIELDS = {
+    "sale_account": "revenue",
+    "sale_cost": "sale_cost",
+    "sale_totl_prfi": "gross_profit",
+    "depr_cost": "depreciation",
+    "sell_mang": "selling_admin_expense",
+    "bsop_prti": "operating_income",
+    "bsop_non_ernn": "non_operating_income",
+    "bsop_non_expn": "non_operating_expense",
+    "op_prfi": "ordinary_income",
+    "spec_prfi": "special_income",
+    "spec_loss": "special_loss",
+    "thtr_ntin": "net_income",
+}
+
+
+def _text_column(df: pd.DataFrame, field: str) -> pd.Series:
+    """문자열 컬럼 (없거나 빈 값은 '')"""
+    if field not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[field].fillna("").astype(str).str.strip()
+
+
+def _numeric_columns(df: pd.DataFrame, field_map: Dict[str, str]) -> pd.DataFrame:
+    """숫자 필드를 컬럼 단위로 변환 (콤마 제거, 변환 불가/빈 값은 0.0)"""
+    columns = {}
+    for src, dst in field_map.items():
+        if src in df.columns:
+            text = df[src].astype(str).str.replace(",", "", regex=False).str.strip()
+            columns[dst] = pd.to_numeric(text, errors="coerce").fillna(0.0).astype(float)
+        else:
+            columns[dst] = pd.Series(0.0, index=df.index)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _records_to_ratio_df(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """재무비율 응답 목록을 DataFrame으로 변환 (FinancialRatioEntry 필드 순서)"""
+    raw = pd.DataFrame(records)
+    stock_code = _text_column(raw, "stck_cd")
+    stock_code = stock_code.where(stock_code != "", _text_column(raw, "stk_cd"))
+    df = pd.concat([
+        pd.DataFrame({"stock_code": stock_code, "statement_ym": _text_column(raw, "stac_yymm")}),
+        _numeric_columns(raw, _RATIO_NUMERIC_FIELDS),
+    ], axis=1)
+    df["created_at"] = now_kst()
+    return df
+
+
+def _records_to_income_df(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """손익계산서 응답 목록을 DataFrame으로 변환 (IncomeStatementEntry 필드 순서)"""
+    raw = pd.DataFrame(records)
+    df = pd.concat([
+        pd.DataFrame({"statement_ym": _text_column(raw, "stac_yymm")}),
+        _numeric_columns(raw, _INCOME_NUMERIC_FIELDS),
+    ], axis=1)
+    df["created_at"] = now_kst()
+    return df
+
+
+def _compact_dtypes(df: pd.DataFrame, float32_cols) -> pd.DataFrame:
+    """반환용 DataFrame 메모리 축소 (비율 컬럼은 float32, 종목코드/결산연월은 category)"""
+    dtypes = {col: "float32" for col in float32_cols}
+    dtypes.update({col: "category" for col in ("stock_code", "statement_ym") if col in df.columns})
+    return df.astype(dtypes)
+
+
+@dataclass(slots=True)
 class FinancialRatioEntry:
     stock_code: str
     statement_ym: str
@@ -32,36 +114,65 @@ class FinancialRatioEntry:
     reserve_ratio: float
     liability_ratio: float
     created_at: datetime
-    raw: Dict[str, Any]
+    raw: Optional[Dict[str, Any]] = None  # 원본 응답 (keep_raw=True일 때만 보관)
+
+    @staticmethod
+    def from_api_output(data: Dict[str, Any], keep_raw: bool = False) -> "FinancialRatioEntry":
+        return FinancialRatioEntry.from_api_outputs([data], keep_raw)[0]
 
     @staticmethod
-    def from_api_output(data: Dict[str, Any]) -> "FinancialRatioEntry":
-        def to_float(value: Any) -> float:
-            try:
-                return float(str(value).replace(",", "")) if value not in (None, "") else 0.0
-            except (ValueError, TypeError):
-                return 0.0
-
-        return FinancialRatioEntry(
-            stock_code=str(data.get("stck_cd", "") or data.get("stk_cd", "") or "").strip(),
-            statement_ym=str(data.get("stac_yymm", "")).strip(),
-            sales_growth=to_float(data.get("grs")),
-            operating_income_growth=to_float(data.get("bsop_prfi_inrt")),
-            net_income_growth=to_float(data.get("ntin_inrt")),
-            roe_value=to_float(data.get("roe_val")),
-            eps=to_float(data.get("eps")),
-            sps=to_float(data.get("sps")),
-            bps=to_float(data.get("bps")),
-            reserve_ratio=to_float(data.get("rsrv_rate")),
-            liability_ratio=to_float(data.get("lblt_rate")),
-            created_at=now_kst(),
-            raw=data
-        )
+    def from_api_outputs(records: List[Dict[str, Any]], keep_raw: bool = False) -> List["FinancialRatioEntry"]:
+        """응답 목록 전체를 컬럼 단위로 변환한 뒤 항목 생성 (keep_raw=True면 원본 응답도 보관)"""
+        if not records:
+            return []
+        df = _records_to_ratio_df(records).drop(columns="created_at")
+        created_at = now_kst()
+        columns = [df[col].tolist() for col in df.columns]  # numpy 스칼라 대신 파이썬 값
+        if not keep_raw:
+            return [FinancialRatioEntry(*row, created_at=created_at) for row in zip(*columns)]
+        return [FinancialRatioEntry(*row, created_at=created_at, raw=data)
+                for row, data in zip(zip(*columns), records)]
+
+
+# DataFrame 컬럼 (raw 제외) 및 항목 -> 행 튜플 변환기
+_RATIO_COLUMNS = tuple(f.name for f in fields(FinancialRatioEntry) if f.name != "raw")
+_ratio_row = operator.attrgetter(*_RATIO_COLUMNS)
+
+
+def _fetch_output(url: str, tr_id: str, tr_cont: str, params: Dict[str, Any],
+                  cache: bool, name: str, stock_code: str) -> Optional[Any]:
+    """
+    조회 응답 output 반환 (디스크 캐시 우선, 실패 시 None)
+
+    재무 데이터는 분기 공시 전까지 바뀌지 않으므로 kis_cache TTL 동안 파일 캐시를 사용합니다.
+    """
+    use_cache = cache and not tr_cont
+    if use_cache:
+        output = kis_cache.load(url, tr_id, params)
+        if output is not None:
+            logger.debug("💾 %s 캐시 사용: %s", name, stock_code)
+            return output
+
+    res = kis._url_fetch(url, tr_id, tr_cont, params, use_cache=cache)
+
+    if res and res.isOK():
+        output = getattr(res.getBody(), 'output', None)
+        if output and use_cache:
+            kis_cache.store(url, tr_id, params, output)
+        return output
+
+    if res:
+        res.printError(url)
+    else:
+        logger.error(f"❌ {name} 조회 실패 (응답 없음): {stock_code}")
+    return None
 
 
 def get_financial_ratio(stock_code: str,
                         div_cls: str = "0",
-                        tr_cont: str = "") -> List[FinancialRatioEntry]:
+                        tr_cont: str = "",
+                        cache: bool = True,
+                        keep_raw: bool = False) -> List[FinancialRatioEntry]:
     """
     재무비율 조회 (개별 종목)
 
@@ -70,6 +181,8 @@ def get_financial_ratio(stock_code: str,
         rpt_cls: 보고서 구분 (연간/분기 등)
         div_cls: 분기 구분
         tr_cont: 연속조회 키
+        cache: False면 디스크 캐시를 건너뛰고 새로 조회
+        keep_raw: True면 항목에 원본 응답(raw)을 함께 보관 (PER/PBR 등 미변환 필드 사용 시)
     """
     url = '/uapi/domestic-stock/v1/finance/financial-ratio'
     tr_id = "FHKST66430300"  # 문서 기준 재무비율 TR
@@ -80,71 +193,59 @@ def get_financial_ratio(stock_code: str,
         "FID_INPUT_ISCD": stock_code
     }
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    output = _fetch_output(url, tr_id, tr_cont, params, cache, "재무비율", stock_code)
+    if output is None:
+        return []
+    if not output:
+        logger.warning(f"📭 재무비율 데이터 없음: {stock_code}")
+        return []
 
-    if res and res.isOK():
-        body = res.getBody()
-        output = getattr(body, 'output', None)
-        if not output:
-            logger.warning(f"📭 재무비율 데이터 없음: {stock_code}")
-            return []
-
-        records = output if isinstance(output, list) else [output]
-        entries = [FinancialRatioEntry.from_api_output(item) for item in records]
-        logger.debug(f"📊 재무비율 조회 성공: {stock_code} ({len(entries)}건)")
-        return entries
-
-    if res:
-        res.printError(url)
-    else:
-        logger.error(f"❌ 재무비율 조회 실패 (응답 없음): {stock_code}")
-    return []
+    records = output if isinstance(output, list) else [output]
+    entries = FinancialRatioEntry.from_api_outputs(records, keep_raw)
+    logger.debug("📊 재무비율 조회 성공: %s (%d건)", stock_code, len(entries))
+    return entries
 
 
 def get_financial_ratios_bulk(stock_codes: List[str],
                               div_cls: str = "0",
-                              delay_sec: float = 0.1) -> List[FinancialRatioEntry]:
+                              delay_sec: float = 0.1,
+                              max_workers: int = FINANCIAL_BULK_MAX_WORKERS,
+                              cache: bool = True) -> List[FinancialRatioEntry]:
     """
     여러 종목 재무비율 일괄 조회
-    """
-    results: List[FinancialRatioEntry] = []
 
-    for idx, code in enumerate(stock_codes, start=1):
-        entries = get_financial_ratio(code, div_cls)
-        results.extend(entries)
+    종목별 조회를 스레드 풀에서 동시에 실행합니다. 호출 간격은 kis_auth 속도 제한이 관리하므로
+    delay_sec는 더 이상 사용하지 않습니다 (하위 호환용). 결과는 입력 종목 순서를 유지합니다.
+    """
+    if not stock_codes:
+        return []
 
-        if idx < len(stock_codes):
-            time.sleep(max(delay_sec, 0.06))
+    results: List[FinancialRatioEntry] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(stock_codes)),
+                            thread_name_prefix='kis-financial') as executor:
+        for entries in executor.map(lambda code: get_financial_ratio(code, div_cls, cache=cache), stock_codes):
+            results.extend(entries)
 
     return results
 
 
 def financial_ratios_to_dataframe(ratios: List[FinancialRatioEntry]) -> pd.DataFrame:
-    """FinancialRatio 리스트를 DataFrame으로 변환"""
+    """FinancialRatio 리스트를 DataFrame으로 변환 (raw 제외, 필드 순서대로)"""
     if not ratios:
         return pd.DataFrame()
 
-    data = [
-        {
-            "stock_code": r.stock_code,
-            "statement_ym": r.statement_ym,
-            "sales_growth": r.sales_growth,
-            "operating_income_growth": r.operating_income_growth,
-            "net_income_growth": r.net_income_growth,
-            "roe_value": r.roe_value,
-            "eps": r.eps,
-            "sps": r.sps,
-            "bps": r.bps,
-            "reserve_ratio": r.reserve_ratio,
-            "liability_ratio": r.liability_ratio,
-            "created_at": r.created_at
-        }
-        for r in ratios
-    ]
-    return pd.DataFrame(data)
-
-
-@dataclass
+    df = pd.DataFrame.from_records(map(_ratio_row, ratios), columns=_RATIO_COLUMNS)
+    return _compact_dtypes(df, _RATIO_NUMERIC_FIELDS.values())
+
+
+def financial_ratio_records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """재무비율 API 응답 목록을 항목 객체 생성 없이 바로 DataFrame으로 변환"""
+    if not records:
+        return pd.DataFrame()
+    return _compact_dtypes(_records_to_ratio_df(records), _RATIO_NUMERIC_FIELDS.values())
+
+
+@dataclass(slots=True)
 class IncomeStatementEntry:
     """손익계산서 항목"""
     statement_ym: str
@@ -161,38 +262,35 @@ class IncomeStatementEntry:
     special_loss: float
     net_income: float
     created_at: datetime
-    raw: Dict[str, Any]
+    raw: Optional[Dict[str, Any]] = None  # 원본 응답 (keep_raw=True일 때만 보관)
 
     @staticmethod
-    def from_api_output(data: Dict[str, Any]) -> "IncomeStatementEntry":
-        def to_float(value: Any) -> float:
-            try:
-                return float(str(value).replace(",", "")) if value not in (None, "") else 0.0
-            except (ValueError, TypeError):
-                return 0.0
-
-        return IncomeStatementEntry(
-            statement_ym=str(data.get("stac_yymm", "")).strip(),
-            revenue=to_float(data.get("sale_account")),
-            sale_cost=to_float(data.get("sale_cost")),
-            gross_profit=to_float(data.get("sale_totl_prfi")),
-            depreciation=to_float(data.get("depr_cost")),
-            selling_admin_expense=to_float(data.get("sell_mang")),
-            operating_income=to_float(data.get("bsop_prti")),
-            non_operating_income=to_float(data.get("bsop_non_ernn")),
-            non_operating_expense=to_float(data.get("bsop_non_expn")),
-            ordinary_income=to_float(data.get("op_prfi")),
-            special_income=to_float(data.get("spec_prfi")),
-            special_loss=to_float(data.get("spec_loss")),
-            net_income=to_float(data.get("thtr_ntin")),
-            created_at=now_kst(),
-            raw=data
-        )
+    def from_api_output(data: Dict[str, Any], keep_raw: bool = False) -> "IncomeStatementEntry":
+        return IncomeStatementEntry.from_api_outputs([data], keep_raw)[0]
+
+    @staticmethod
+    def from_api_outputs(records: List[Dict[str, Any]], keep_raw: bool = False) -> List["IncomeStatementEntry"]:
+        """응답 목록 전체를 컬럼 단위로 변환한 뒤 항목 생성 (keep_raw=True면 원본 응답도 보관)"""
+        if not records:
+            return []
+        df = _records_to_income_df(records).drop(columns="created_at")
+        created_at = now_kst()
+        columns = [df[col].tolist() for col in df.columns]  # numpy 스칼라 대신 파이썬 값
+        if not keep_raw:
+            return [IncomeStatementEntry(*row, created_at=created_at) for row in zip(*columns)]
+        return [IncomeStatementEntry(*row, created_at=created_at, raw=data)
+                for row, data in zip(zip(*columns), records)]
+
+
+_INCOME_COLUMNS = tuple(f.name for f in fields(IncomeStatementEntry) if f.name != "raw")
+_income_row = operator.attrgetter(*_INCOME_COLUMNS)
 
 
 def get_income_statement(stock_code: str,
                          div_cls: str = "0",
-                         tr_cont: str = "") -> Optional[List[IncomeStatementEntry]]:
+                         tr_cont: str = "",
+                         cache: bool = True,
+                         keep_raw: bool = False) -> Optional[List[IncomeStatementEntry]]:
     """
     손익계산서 조회 (다중 연도/분기 반환)
 
@@ -201,6 +299,8 @@ def get_income_statement(stock_code: str,
         rpt_cls: 보고서 구분 (예: '0' 최근, '1' 1년전)
         div_cls: 분기/연간 구분
         tr_cont: 연속조회 키
+        cache: False면 디스크 캐시를 건너뛰고 새로 조회
+        keep_raw: True면 항목에 원본 응답(raw)을 함께 보관
     """
     url = '/uapi/domestic-stock/v1/finance/income-statement'
     tr_id = "FHKST66430200"  # 손익계산서 TR
@@ -211,55 +311,33 @@ def get_income_statement(stock_code: str,
         "FID_INPUT_ISCD": stock_code
     }
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
-
-    if res and res.isOK():
-        body = res.getBody()
-        output = getattr(body, 'output', None)
-        if not output:
+    output = _fetch_output(url, tr_id, tr_cont, params, cache, "손익계산서", stock_code)
+    if not output:
+        if output is not None:
             logger.warning(f"📭 손익계산서 데이터 없음: {stock_code}")
-            return None
+        return None
 
-        if isinstance(output, list):
-            entries = [IncomeStatementEntry.from_api_output(item) for item in output]
-        else:
-            entries = [IncomeStatementEntry.from_api_output(output)]
+    entries = IncomeStatementEntry.from_api_outputs(output if isinstance(output, list) else [output], keep_raw)
 
-        logger.debug(f"📑 손익계산서 조회 성공: {stock_code} ({len(entries)}건)")
-        return entries
-
-    if res:
-        res.printError(url)
-    else:
-        logger.error(f"❌ 손익계산서 조회 실패 (응답 없음): {stock_code}")
-    return None
+    logger.debug("📑 손익계산서 조회 성공: %s (%d건)", stock_code, len(entries))
+    return entries
 
 
 def income_statement_to_dataframe(entries: List[IncomeStatementEntry]) -> pd.DataFrame:
-    """손익계산서 결과를 DataFrame으로 변환"""
+    """손익계산서 결과를 DataFrame으로 변환 (raw 제외, 필드 순서대로)"""
     if not entries:
         return pd.DataFrame()
 
-    data = [
-        {
-            "statement_ym": e.statement_ym,
-            "revenue": e.revenue,
-            "sale_cost": e.sale_cost,
-            "gross_profit": e.gross_profit,
-            "depreciation": e.depreciation,
-            "selling_admin_expense": e.selling_admin_expense,
-            "operating_income": e.operating_income,
-            "non_operating_income": e.non_operating_income,
-            "non_operating_expense": e.non_operating_expense,
-            "ordinary_income": e.ordinary_income,
-            "special_income": e.special_income,
-            "special_loss": e.special_loss,
-            "net_income": e.net_income,
-            "created_at": e.created_at
-        }
-        for e in entries
-    ]
-    return pd.DataFrame(data)
+    # 손익 금액은 자릿수가 커서 float64 유지 (결산연월만 category)
+    df = pd.DataFrame.from_records(map(_income_row, entries), columns=_INCOME_COLUMNS)
+    return _compact_dtypes(df, ())
+
+
+def income_statement_records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """손익계산서 API 응답 목록을 항목 객체 생성 없이 바로 DataFrame으로 변환"""
+    if not records:
+        return pd.DataFrame()
+    return _compact_dtypes(_records_to_income_df(records), ())
 
 
 if __name__ == "__main__":
@@ -1,39 +1,166 @@
 """
 KIS API 시세 조회 관련 함수 (공식 문서 기반)
 """
-import time
+import copy
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from utils.logger import setup_logger
+from utils.async_utils import run_sync
+from utils.ttl_cache import TTLCache
 from . import kis_auth as kis
-from utils.korean_time import now_kst
+from . import kis_cache
+from utils.korean_time import now_kst, parse_yyyymmdd
 
 logger = setup_logger(__name__)
 
+# 동기/비동기 함수가 함께 쓰는 조회 URL 및 TR ID
+_URL_INQUIRE_PRICE = '/uapi/domestic-stock/v1/quotations/inquire-price'
+_TR_INQUIRE_PRICE = "FHKST01010100"  # 주식현재가 시세
+_URL_MULTI_PRICE = '/uapi/domestic-stock/v1/quotations/intstock-multprice'
+_TR_MULTI_PRICE = "FHKST11300006"  # 관심종목(멀티종목) 시세조회
+_URL_DAILY_CHART = '/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice'
+_TR_DAILY_CHART = "FHKST03010100"  # 국내주식기간별시세
+
+
+# TR별 응답 output 구조: (필드명 목록, 형태) - dict: 단건(목록이면 첫 항목), list: 항상 목록
+_TR_OUTPUT_SCHEMA: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "FHPST01710000": (("output",), "list"),              # 거래량순위
+    "FHPUP02100000": (("output",), "dict"),              # 국내업종 현재지수
+    "FHPTJ04400000": (("output1", "output2"), "list"),   # 외국인/기관 매매종목가집계
+}
+
+
+def _normalize_output(value: Any, shape: str) -> Any:
+    """output 값을 스키마 형태로 정규화 (dict: dict 또는 None, list: 목록)"""
+    if shape == "dict":
+        if isinstance(value, list):
+            value = value[0] if value else None
+        return value if isinstance(value, dict) else None
+    if not value:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _extract_outputs(res, tr_id: str) -> Dict[str, Any]:
+    """_TR_OUTPUT_SCHEMA에 따라 응답의 output 필드를 한 번에 추출"""
+    keys, shape = _TR_OUTPUT_SCHEMA[tr_id]
+    return {key: _normalize_output(res.getOutput(key), shape) for key in keys}
+
+
+def _output_to_dataframe(output: Any) -> pd.DataFrame:
+    """단건 output(dict)은 1행, 목록(list)은 그대로 DataFrame으로 변환"""
+    if isinstance(output, dict):
+        return pd.DataFrame([output])
+    return pd.DataFrame(output or [])
+
+
 def get_inquire_price(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
-                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """주식현재가 시세"""
-    url = '/uapi/domestic-stock/v1/quotations/inquire-price'
-    tr_id = "FHKST01010100"  # 주식현재가 시세
+                      FK100: str = "", NK100: str = "", as_dataframe: bool = True,
+                      cache: bool = True) -> Optional[Union[pd.DataFrame, Dict[str, Any]]]:
+    """주식현재가 시세 (as_dataframe=False면 output을 dict로 반환, cache=False면 응답 캐시 무시)"""
+    url = _URL_INQUIRE_PRICE
+    tr_id = _TR_INQUIRE_PRICE
 
     params = {
         "FID_COND_MRKT_DIV_CODE": div_code,     # J:주식/ETF/ETN, W:ELW
         "FID_INPUT_ISCD": itm_no                # 종목번호(6자리)
     }
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    res = kis._url_fetch(url, tr_id, tr_cont, params, use_cache=cache)
 
-    if res and res.isOK():
-        body = res.getBody()
-        current_data = pd.DataFrame(getattr(body, 'output', []), index=[0])
-        return current_data
+    if res and res.ok:
+        output = res.getOutput() or {}
+        if not as_dataframe:
+            return dict(output)
+        return _output_to_dataframe(output)
     else:
         logger.error("주식현재가 조회 실패")
         return None
 
 
+async def get_inquire_price_async(session, div_code: str = "J", itm_no: str = "", tr_cont: str = "",
+                                  as_dataframe: bool = True,
+                                  cache: bool = True) -> Optional[Union[pd.DataFrame, Dict[str, Any]]]:
+    """주식현재가 시세 (비동기 - 공유 aiohttp 세션 사용, as_dataframe=False면 dict 반환)"""
+    url = _URL_INQUIRE_PRICE
+    tr_id = _TR_INQUIRE_PRICE
+
+    params = {
+        "FID_COND_MRKT_DIV_CODE": div_code,     # J:주식/ETF/ETN, W:ELW
+        "FID_INPUT_ISCD": itm_no                # 종목번호(6자리)
+    }
+
+    res = await kis._url_fetch_async(session, url, tr_id, tr_cont, params, use_cache=cache)
+
+    if res and res.ok:
+        output = res.getOutput() or {}
+        if not as_dataframe:
+            return dict(output)
+        return _output_to_dataframe(output)
+    else:
+        logger.error(f"주식현재가 조회 실패: {itm_no}")
+        return None
+
+
+MULTI_PRICE_MAX_CODES = 30  # 관심종목(멀티종목) 시세조회 1회 최대 종목 수
+
+
+def _build_multi_price_params(codes: List[str], div_code: str = "J") -> Dict[str, str]:
+    """관심종목 시세조회 파라미터 생성 (FID_..._1 ~ FID_..._N)"""
+    if len(codes) > MULTI_PRICE_MAX_CODES:
+        raise ValueError(f"멀티종목 시세조회는 최대 {MULTI_PRICE_MAX_CODES}종목까지 가능합니다: {len(codes)}")
+
+    params = {}
+    for i, code in enumerate(codes, start=1):
+        params[f"FID_COND_MRKT_DIV_CODE_{i}"] = div_code   # J:주식/ETF/ETN
+        params[f"FID_INPUT_ISCD_{i}"] = code               # 종목번호(6자리)
+    return params
+
+
+def _multi_price_to_dataframe(res) -> Optional[pd.DataFrame]:
+    """관심종목 시세조회 응답을 DataFrame으로 변환"""
+    if res and res.ok:
+        output = res.getOutput() or []
+        if not isinstance(output, list):
+            output = [output]
+        return pd.DataFrame(output)
+
+    logger.error("멀티종목 시세조회 실패")
+    return None
+
+
+def get_multi_price(codes: List[str], div_code: str = "J", tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """
+    관심종목(멀티종목) 시세조회 - 최대 30종목 현재가를 1회 호출로 조회
+
+    Returns:
+        pd.DataFrame: inter_shrn_iscd(종목코드), inter2_prpr(현재가), inter2_prdy_vrss(전일대비),
+                      prdy_ctrt(전일대비율), acml_vol(누적거래량) 등
+    """
+    url = _URL_MULTI_PRICE
+    tr_id = _TR_MULTI_PRICE
+
+    params = _build_multi_price_params(codes, div_code)
+    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    return _multi_price_to_dataframe(res)
+
+
+async def get_multi_price_async(session, codes: List[str], div_code: str = "J",
+                                tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """관심종목(멀티종목) 시세조회 (비동기 - 공유 aiohttp 세션 사용)"""
+    url = _URL_MULTI_PRICE
+    tr_id = _TR_MULTI_PRICE
+
+    params = _build_multi_price_params(codes, div_code)
+    res = await kis._url_fetch_async(session, url, tr_id, tr_cont, params)
+    return _multi_price_to_dataframe(res)
+
+
 def get_inquire_ccnl(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
     """주식현재가 체결 (최근 30건)"""
@@ -85,10 +212,15 @@ def get_inquire_daily_price(div_code: str = "J", itm_no: str = "", period_code:
 def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
                                      inqr_strt_dt: Optional[str] = None, inqr_end_dt: Optional[str] = None,
                                      period_code: str = "D", adj_prc: str = "1", tr_cont: str = "",
-                                     FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """국내주식기간별시세(일/주/월/년)"""
-    url = '/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice'
-    tr_id = "FHKST03010100"  # 국내주식기간별시세
+                                     FK100: str = "", NK100: str = "",
+                                     cache: bool = True) -> Optional[pd.DataFrame]:
+    """
+    국내주식기간별시세(일/주/월/년)
+
+    오늘 이전에 끝나는 일봉 목록(output_dv != "1")은 kis_cache 디스크 캐시를 사용합니다 (cache=False면 새로 조회).
+    """
+    url = _URL_DAILY_CHART
+    tr_id = _TR_DAILY_CHART
 
     if inqr_strt_dt is None:
         inqr_strt_dt = (now_kst() - timedelta(days=50)).strftime("%Y%m%d")
@@ -104,30 +236,215 @@ def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J",
         "FID_ORG_ADJ_PRC": adj_prc              # 0:수정주가, 1:원주가
     }
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    # output1(현재가 요약)은 실시간 값이므로 캐시하지 않음
+    use_cache = cache and output_dv != "1" and not tr_cont and _is_closed_daily_range(period_code, inqr_end_dt)
+    if use_cache:
+        cached = kis_cache.load(url, tr_id, params)
+        if cached is not None:
+            return pd.DataFrame(cached)
+
+    res = kis._url_fetch(url, tr_id, tr_cont, params, use_cache=cache)
 
     if res and res.isOK():
         body = res.getBody()
         if output_dv == "1":
-            current_data = pd.DataFrame(getattr(body, 'output1', []), index=[0])
+            current_data = _output_to_dataframe(getattr(body, 'output1', None))
         else:
-            current_data = pd.DataFrame(getattr(body, 'output2', []))
+            output2 = getattr(body, 'output2', [])
+            if use_cache and output2:
+                kis_cache.store(url, tr_id, params, output2)
+            current_data = pd.DataFrame(output2)
         return current_data
     else:
         logger.error("국내주식기간별시세 조회 실패")
         return None
 
 
+# 기간별시세 연속조회: 1회 최대 100건, 구간당 100건을 넘지 않는 캘린더 일수 (일봉 140일 = 평일 100일)
+_CHART_PAGE_SIZE = 100
+_CHART_WINDOW_DAYS = {'D': 140, 'W': 700, 'M': 3000, 'Y': 36500}
+_CHART_MAX_CONCURRENCY = 5
+# 평일 대비 거래일 비율 (연간 평일 약 261일 중 KRX 휴장일 제외 약 248일)
+_TRADING_DAY_RATIO = 0.95
+
+
+def _is_closed_daily_range(period_code: str, inqr_end_dt: str) -> bool:
+    """오늘 이전에 끝나는 일봉 구간인지 (진행 중인 봉이 없어 디스크 캐시 가능)"""
+    return period_code == 'D' and inqr_end_dt < now_kst().strftime("%Y%m%d")
+
+
+def _split_chart_windows(inqr_strt_dt: str, end_date: datetime, period_code: str,
+                         needed_count: int) -> List[Tuple[str, str]]:
+    """남은 조회 구간을 최신 구간부터 (시작일, 종료일) 목록으로 분할"""
+    window_days = _CHART_WINDOW_DAYS.get(period_code, _CHART_WINDOW_DAYS['D'])
+    start_date = parse_yyyymmdd(inqr_strt_dt)
+    if period_code == 'D':
+        return _split_daily_windows(start_date, end_date, window_days, needed_count)
+
+    # 휴장일로 구간당 100건이 안 될 수 있으므로 1구간 여유
+    max_windows = -(-needed_count // _CHART_PAGE_SIZE) + 1
+
+    windows = []
+    while end_date >= start_date and len(windows) < max_windows:
+        window_start = max(start_date, end_date - timedelta(days=window_days - 1))
+        windows.append((window_start.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")))
+        end_date = window_start - timedelta(days=1)
+    return windows
+
+
+def _split_daily_windows(start_date: datetime, end_date: datetime, window_days: int,
+                         needed_count: int) -> List[Tuple[str, str]]:
+    """
+    일봉 구간 분할 - 평일 수로 예상 건수를 계산해 필요한 구간만 생성
+
+    휴장일 여유(_TRADING_DAY_RATIO)를 포함한 평일 수를 채우면 멈추고, 마지막 구간은 남은 평일만큼으로
+    줄여 구간 하나를 통째로 더 조회하지 않습니다.
+    """
+    target_weekdays = -(-needed_count * 100 // int(_TRADING_DAY_RATIO * 100))
+    covered = 0
+    windows = []
+    while end_date >= start_date and covered < target_weekdays:
+        window_start = max(start_date, end_date - timedelta(days=window_days - 1))
+        end_day = end_date.date()
+        weekdays = int(np.busday_count(window_start.date(), end_day + timedelta(days=1)))
+        remaining = target_weekdays - covered
+        if weekdays > remaining:
+            # 종료일(휴일이면 직전 평일)부터 남은 평일 수만큼만 거슬러 올라감
+            first_day = np.busday_offset(end_day, -(remaining - 1), roll='backward').astype(object)
+            window_start = max(start_date, datetime.combine(first_day, datetime.min.time()))
+            weekdays = remaining
+        windows.append((window_start.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")))
+        covered += weekdays
+        end_date = window_start - timedelta(days=1)
+    return windows
+
+
+async def _fetch_daily_chart_window(session, semaphore: asyncio.Semaphore, div_code: str, itm_no: str,
+                                    inqr_strt_dt: str, inqr_end_dt: str, period_code: str,
+                                    adj_prc: str, cache: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """기간별시세 1구간 조회 (output2 목록, 실패 시 None, 지난 일봉 구간은 디스크 캐시 사용)"""
+    url = _URL_DAILY_CHART
+    tr_id = _TR_DAILY_CHART
+
+    params = {
+        "FID_COND_MRKT_DIV_CODE": div_code,
+        "FID_INPUT_ISCD": itm_no,
+        "FID_INPUT_DATE_1": inqr_strt_dt,
+        "FID_INPUT_DATE_2": inqr_end_dt,
+        "FID_PERIOD_DIV_CODE": period_code,
+        "FID_ORG_ADJ_PRC": adj_prc
+    }
+
+    use_cache = cache and _is_closed_daily_range(period_code, inqr_end_dt)
+    if use_cache:
+        cached = kis_cache.load(url, tr_id, params)
+        if cached is not None:
+            return cached
+
+    async with semaphore:
+        res = await kis._url_fetch_async(session, url, tr_id, "", params)
+
+    if res is None or not res.ok:
+        return None
+
+    output2 = res.getOutput('output2') or []
+    items = [item for item in output2 if item.get('stck_bsop_date')]
+    if use_cache and items:
+        kis_cache.store(url, tr_id, params, items)
+    return items
+
+
+async def get_inquire_daily_itemchartprice_extended_async(div_code: str = "J", itm_no: str = "",
+                                                          inqr_strt_dt: Optional[str] = None,
+                                                          inqr_end_dt: Optional[str] = None,
+                                                          period_code: str = "D", adj_prc: str = "1",
+                                                          max_count: int = 300,
+                                                          cache: bool = True) -> Optional[pd.DataFrame]:
+    """
+    국내주식기간별시세 연속조회 (비동기)
+    
+    첫 구간을 조회해 가장 오래된 날짜를 확인한 뒤, 나머지 기간을 100건 이하 구간으로
+    나누어 동시에 조회합니다. (호출 간격은 kis_auth 속도 제한에서 관리)
+    """
+    if inqr_strt_dt is None:
+        inqr_strt_dt = (now_kst() - timedelta(days=500)).strftime("%Y%m%d")
+    if inqr_end_dt is None:
+        inqr_end_dt = now_kst().strftime("%Y%m%d")
+
+    semaphore = asyncio.Semaphore(_CHART_MAX_CONCURRENCY)
+
+    async with kis.create_async_session() as session:
+        first_page = await _fetch_daily_chart_window(session, semaphore, div_code, itm_no,
+                                                     inqr_strt_dt, inqr_end_dt, period_code, adj_prc, cache)
+        if first_page is None:
+            logger.error(f"국내주식기간별시세 조회 실패: {itm_no}")
+            return None
+
+        pages = [first_page]
+        call_count = 1
+
+        # 100건을 꽉 채워 받았으면 그 이전 기간이 남아 있음
+        if len(first_page) >= _CHART_PAGE_SIZE and len(first_page) < max_count:
+            oldest = min(item['stck_bsop_date'] for item in first_page)
+            windows = _split_chart_windows(
+                inqr_strt_dt,
+                parse_yyyymmdd(oldest) - timedelta(days=1),
+                period_code,
+                max_count - len(first_page)
+            )
+            results = await asyncio.gather(
+                *[_fetch_daily_chart_window(session, semaphore, div_code, itm_no,
+                                            start, end, period_code, adj_prc, cache)
+                  for start, end in windows],
+                return_exceptions=True
+            )
+            call_count += len(windows)
+
+            # 최신 구간부터 연속된 구간만 사용 (중간 구간 실패 시 이후 데이터는 버려 공백 방지)
+            for (start, end), result in zip(windows, results):
+                if result is None or isinstance(result, BaseException):
+                    logger.warning(f"⚠️ {itm_no} 기간별시세 구간 조회 실패 ({start}~{end}), 이전 구간 생략")
+                    break
+                pages.append(result)
+
+    # 구간·응답 모두 최신순이므로 날짜 집합으로 중복만 걸러 낸 뒤 한 번 뒤집어 오래된 것부터 정렬
+    seen_dates = set()
+    all_data = []
+    for page in pages:
+        for item in page:
+            item_date = item['stck_bsop_date']
+            if item_date not in seen_dates:
+                seen_dates.add(item_date)
+                all_data.append(item)
+    if not all_data:
+        return None
+
+    all_data.reverse()
+    df = pd.DataFrame(all_data)
+
+    # 응답 순서가 예상과 다를 때만 정렬
+    if not df['stck_bsop_date'].is_monotonic_increasing:
+        df = df.sort_values('stck_bsop_date', ignore_index=True)
+
+    # max_count 이상이면 최신 데이터 유지
+    if len(df) > max_count:
+        df = df.tail(max_count).reset_index(drop=True)
+
+    logger.debug("✅ %s 일봉 연속조회 완료: %d건 (%d회 호출)", itm_no, len(df), call_count)
+    return df
+
+
 def get_inquire_daily_itemchartprice_extended(div_code: str = "J", itm_no: str = "",
                                               inqr_strt_dt: Optional[str] = None, 
                                               inqr_end_dt: Optional[str] = None,
                                               period_code: str = "D", adj_prc: str = "1",
-                                              max_count: int = 300) -> Optional[pd.DataFrame]:
+                                              max_count: int = 300,
+                                              cache: bool = True) -> Optional[pd.DataFrame]:
     """
     국내주식기간별시세 연속조회 (최대 max_count건까지 수집)
     
-    KIS API는 한 번에 최대 100건만 반환하므로, 연속조회를 통해 더 많은 데이터를 수집합니다.
-    연속조회 시 이전 응답의 마지막 날짜 -1일을 다음 조회의 종료일자로 설정합니다.
+    KIS API는 한 번에 최대 100건만 반환하므로, 기간을 100건 이하 구간으로 나누어 조회합니다.
+    첫 구간 응답의 마지막 날짜 -1일부터 나머지 구간을 동시에 조회합니다.
     
     Args:
         div_code: 시장 구분 코드 (J:주식/ETF/ETN)
@@ -137,124 +454,19 @@ def get_inquire_daily_itemchartprice_extended(div_code: str = "J", itm_no: str =
         period_code: 기간 구분 (D:일봉, W:주봉, M:월봉, Y:년봉)
         adj_prc: 수정주가 여부 (0:수정주가, 1:원주가)
         max_count: 최대 수집 건수 (기본 300건)
+        cache: False면 지난 구간 디스크 캐시를 건너뛰고 새로 조회
         
     Returns:
         pd.DataFrame: 일봉 데이터 (최대 max_count건)
     """
-    url = '/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice'
-    tr_id = "FHKST03010100"
-    
-    if inqr_strt_dt is None:
-        inqr_strt_dt = (now_kst() - timedelta(days=500)).strftime("%Y%m%d")
-    if inqr_end_dt is None:
-        inqr_end_dt = now_kst().strftime("%Y%m%d")
-    
-    all_data = []
-    call_count = 0
-    max_calls = (max_count // 100) + 2  # 최대 호출 횟수 (여유분 추가)
-    current_end_dt = inqr_end_dt  # 현재 조회 종료일자
-    
-    while call_count < max_calls:
-        params = {
-            "FID_COND_MRKT_DIV_CODE": div_code,
-            "FID_INPUT_ISCD": itm_no,
-            "FID_INPUT_DATE_1": inqr_strt_dt,
-            "FID_INPUT_DATE_2": current_end_dt,
-            "FID_PERIOD_DIV_CODE": period_code,
-            "FID_ORG_ADJ_PRC": adj_prc
-        }
-        
-        res = kis._url_fetch(url, tr_id, "", params)
-        
-        if res is None or not res.isOK():
-            if call_count == 0:
-                logger.error(f"국내주식기간별시세 조회 실패: {itm_no}")
-                return None
-            break
-        
-        body = res.getBody()
-        output2 = getattr(body, 'output2', [])
-        
-        if not output2:
-            break
-        
-        # 데이터 추가 (중복 방지를 위해 날짜 체크)
-        for item in output2:
-            item_date = item.get('stck_bsop_date', '')
-            # 중복 체크: 이미 있는 날짜는 추가하지 않음
-            if not any(d.get('stck_bsop_date') == item_date for d in all_data):
-                all_data.append(item)
-        
-        call_count += 1
-        
-        # 충분한 데이터를 수집했으면 종료
-        if len(all_data) >= max_count:
-            break
-        
-        # 연속조회 여부 확인 - 응답 헤더에서 tr_cont 값 확인
-        try:
-            header = res.getHeader()
-            next_tr_cont = getattr(header, 'tr_cont', '')
-            logger.debug(f"🔄 {itm_no} 연속조회 헤더 tr_cont: '{next_tr_cont}'")
-        except Exception as header_e:
-            logger.debug(f"⚠️ 헤더 파싱 오류: {header_e}")
-            next_tr_cont = ''
-        
-        # 데이터가 100건 미만이면 더 이상 데이터 없음
-        if len(output2) < 100:
-            logger.debug(f"📊 {itm_no} 데이터 {len(output2)}건 < 100건, 연속조회 종료")
-            break
-        
-        # M: 다음 데이터 있음, D/E/F: 마지막 데이터
-        # 헤더 값이 없거나 공백이면 날짜 기반 연속조회 진행
-        if next_tr_cont in ['D', 'E']:
-            logger.debug(f"📊 {itm_no} 마지막 페이지 (tr_cont={next_tr_cont})")
-            break
-        
-        # 연속조회를 위해 마지막 날짜 -1일을 다음 종료일자로 설정
-        if output2:
-            # output2는 최신 날짜부터 정렬되어 있으므로 마지막 항목이 가장 오래된 날짜
-            last_item = output2[-1]
-            last_date_str = last_item.get('stck_bsop_date', '')
-            if last_date_str:
-                try:
-                    last_date = datetime.strptime(last_date_str, "%Y%m%d")
-                    # 하루 전 날짜를 다음 조회의 종료일자로 설정
-                    next_end_date = last_date - timedelta(days=1)
-                    current_end_dt = next_end_date.strftime("%Y%m%d")
-                    
-                    # 시작일자보다 종료일자가 이전이면 종료
-                    if current_end_dt < inqr_strt_dt:
-                        break
-                except:
-                    break
-            else:
-                break
-        else:
-            break
-        
-        time.sleep(0.1)  # API 호출 간격
-    
-    if not all_data:
-        return None
-    
-    df = pd.DataFrame(all_data)
-    
-    # 날짜 기준 정렬 (오래된 것부터)
-    if 'stck_bsop_date' in df.columns:
-        df = df.sort_values('stck_bsop_date').reset_index(drop=True)
-    
-    # max_count 이상이면 최신 데이터 유지
-    if len(df) > max_count:
-        df = df.tail(max_count).reset_index(drop=True)
-    
-    logger.debug(f"✅ {itm_no} 일봉 연속조회 완료: {len(df)}건 ({call_count}회 호출)")
-    return df
+    return run_sync(get_inquire_daily_itemchartprice_extended_async(
+        div_code, itm_no, inqr_strt_dt, inqr_end_dt, period_code, adj_prc, max_count, cache
+    ))
 
 
 def get_inquire_daily_price_2(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
-                               FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """주식현재가 시세2"""
+                               FK100: str = "", NK100: str = "", cache: bool = True) -> Optional[pd.DataFrame]:
+    """주식현재가 시세2 (cache=False면 응답 캐시 무시)"""
     url = '/uapi/domestic-stock/v1/quotations/inquire-price-2'
     tr_id = "FHPST01010000"  # 주식현재가 시세2
 
@@ -263,12 +475,10 @@ def get_inquire_daily_price_2(div_code: str = "J", itm_no: str = "", tr_cont: st
         "FID_INPUT_ISCD": itm_no                # 종목번호(6자리)
     }
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    res = kis._url_fetch(url, tr_id, tr_cont, params, use_cache=cache)
 
-    if res and res.isOK():
-        body = res.getBody()
-        current_data = pd.DataFrame(getattr(body, 'output', []), index=[0])
-        return current_data
+    if res and res.ok:
+        return _output_to_dataframe(res.getOutput())
     else:
         logger.error("주식현재가 시세2 조회 실패")
         return None
@@ -326,9 +536,8 @@ def get_volume_rank(fid_cond_mrkt_div_code: str = "J",
     try:
         res = kis._url_fetch(url, tr_id, tr_cont, params)
 
-        if res and res.isOK():
-            body = res.getBody()
-            output_data = getattr(body, 'output', None) or getattr(body, 'Output', [])
+        if res and res.ok:
+            output_data = _extract_outputs(res, tr_id)['output']
             if output_data:
                 current_data = pd.DataFrame(output_data)
                 logger.info(f"거래량순위 조회 성공: {len(current_data)}건")
@@ -352,13 +561,14 @@ if __name__ == "__main__":
 # 🎯 시장상황 분석을 위한 API 함수들
 # =============================================================================
 
-def get_index_data(index_code: str = "0001") -> Optional[Dict[str, Any]]:
+def get_index_data(index_code: str = "0001", cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     국내업종 현재지수 API (TR: FHPUP02100000)
     코스피/코스닥 지수 정보를 조회합니다.
 
     Args:
         index_code: 업종코드 ("0001": 코스피, "1001": 코스닥)
+        cache: False면 응답 캐시(5초)를 무시하고 새로 조회
 
     Returns:
         Dict: 지수 정보 (지수값, 전일대비율, 거래량 등)
@@ -372,28 +582,17 @@ def get_index_data(index_code: str = "0001") -> Optional[Dict[str, Any]]:
     }
 
     try:
-        logger.debug(f"📊 지수 정보 조회: {index_code}")
-        res = kis._url_fetch(url, tr_id, "", params)
+        logger.debug("📊 지수 정보 조회: %s", index_code)
+        res = kis._url_fetch(url, tr_id, "", params, use_cache=cache)
 
-        if res and res.isOK():
-            body = res.getBody()
-            output_data = getattr(body, 'output', None)
-
-            if output_data:
-                if isinstance(output_data, list) and len(output_data) > 0:
-                    result = output_data[0]
-                    if isinstance(result, dict):
-                        logger.debug(f"✅ {index_code} 지수 조회 성공")
-                        return result
-                elif isinstance(output_data, dict):
-                    logger.debug(f"✅ {index_code} 지수 조회 성공")
-                    return output_data
-
-                logger.warning(f"⚠️ {index_code} 지수 데이터 형식 오류")
-                return None
-            else:
-                logger.warning(f"⚠️ {index_code} 지수 데이터 없음")
+        if res and res.ok:
+            result = _extract_outputs(res, tr_id)['output']
+            if result is None:
+                logger.warning(f"⚠️ {index_code} 지수 데이터 없음 (또는 형식 오류)")
                 return None
+
+            logger.debug("✅ %s 지수 조회 성공", index_code)
+            return result
         else:
             logger.error(f"❌ {index_code} 지수 조회 실패")
             return None
@@ -424,29 +623,20 @@ def get_investor_flow_data() -> Optional[Dict[str, Any]]:
     }
 
     try:
-        logger.debug(f"💰 투자자별 매매 현황 조회: {current_date}")
+        logger.debug("💰 투자자별 매매 현황 조회: %s", current_date)
         res = kis._url_fetch(url, tr_id, "", params)
 
-        if res and res.isOK():
-            body = res.getBody()
-            output1_data = getattr(body, 'output1', None)  # 투자자별 총계
-            output2_data = getattr(body, 'output2', None)  # 종목별 상세
-
+        if res and res.ok:
+            outputs = _extract_outputs(res, tr_id)
             result = {}
 
             # output1: 투자자별 총계 (외국인, 기관 등)
-            if output1_data:
-                if isinstance(output1_data, list):
-                    result['investor_summary'] = output1_data
-                else:
-                    result['investor_summary'] = [output1_data]
+            if outputs['output1']:
+                result['investor_summary'] = outputs['output1']
 
             # output2: 종목별 상세 (필요시 사용)
-            if output2_data:
-                if isinstance(output2_data, list):
-                    result['stock_details'] = output2_data
-                else:
-                    result['stock_details'] = [output2_data]
+            if outputs['output2']:
+                result['stock_details'] = outputs['output2']
 
             logger.debug("✅ 투자자별 매매 현황 조회 성공")
             return result
@@ -471,14 +661,14 @@ def get_market_overview() -> Optional[Dict[str, Any]]:
     try:
         logger.debug("📊 종합 시장 개요 조회 시작")
 
-        # 코스피 지수 조회
-        kospi_data = get_index_data("0001")
-
-        # 코스닥 지수 조회
-        kosdaq_data = get_index_data("1001")
-
-        # 투자자별 매매 현황 조회
-        investor_data = get_investor_flow_data()
+        # 코스피/코스닥 지수, 투자자별 매매 현황은 서로 독립적이므로 동시에 조회
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='kis-overview') as executor:
+            kospi_future = executor.submit(get_index_data, "0001")
+            kosdaq_future = executor.submit(get_index_data, "1001")
+            investor_future = executor.submit(get_investor_flow_data)
+            kospi_data = kospi_future.result()
+            kosdaq_data = kosdaq_future.result()
+            investor_data = investor_future.result()
 
         result = {
             'kospi': kospi_data,
@@ -499,6 +689,34 @@ def get_market_overview() -> Optional[Dict[str, Any]]:
 # 🎯 잔고 및 포지션 조회 API
 # =============================================================================
 
+# 잔고(output1) 숫자 컬럼 (True: 정수) - 보유 종목 항목 순서와 같음
+_BALANCE_NUMERIC_COLUMNS = {
+    'hldg_qty': True,        # 보유수량
+    'pchs_avg_pric': False,  # 매입평균가
+    'prpr': False,           # 현재가
+    'evlu_amt': True,        # 평가금액
+    'evlu_pfls_amt': True,   # 평가손익
+    'evlu_pfls_rt': False,   # 평가손익률
+}
+_HOLDING_KEYS = ('stock_code', 'stock_name', 'quantity', 'avg_price', 'current_price',
+                 'eval_amount', 'profit_loss', 'profit_loss_rate')
+
+# 계좌요약(output2)에서 정수로 꺼내는 항목
+_ACCOUNT_SUMMARY_KEYS = ['dnca_tot_amt',        # 예수금총금액
+                         'nxdy_excc_amt',       # 🎯 익일정산금액 (실제 매수가능금액!)
+                         'prvs_rcdl_excc_amt',  # 가수도정산금액 (D+2 예수금)
+                         'tot_evlu_amt',        # 총평가액
+                         'evlu_pfls_smtl_amt',  # 평가손익합계
+                         'pchs_amt_smtl_amt',   # 매입금액합계
+                         'evlu_amt_smtl_amt']   # 평가금액합계
+
+
+def _to_number_column(series: pd.Series, as_int: bool = False) -> pd.Series:
+    """콤마를 제거해 숫자로 변환 (빈 값/변환 불가는 0)"""
+    values = pd.to_numeric(series.astype(str).str.replace(',', '', regex=False), errors='coerce').fillna(0)
+    return values.astype('int64') if as_int else values.astype(float)
+
+
 def get_stock_balance(output_dv: str = "01", tr_cont: str = "",
                      FK100: str = "", NK100: str = "") -> Optional[Tuple[pd.DataFrame, Dict]]:
     """
@@ -512,6 +730,7 @@ def get_stock_balance(output_dv: str = "01", tr_cont: str = "",
 
     Returns:
         Tuple[pd.DataFrame, Dict]: (보유종목 데이터, 계좌요약 정보)
+        보유종목 데이터의 _BALANCE_NUMERIC_COLUMNS는 숫자로 변환되어 있음
         계좌요약에는 dnca_tot_amt(매수가능금액) 포함
     """
     url = '/uapi/domestic-stock/v1/trading/inquire-balance'
@@ -554,34 +773,27 @@ def get_stock_balance(output_dv: str = "01", tr_cont: str = "",
             if output2_data:
                 summary = output2_data[0] if isinstance(output2_data, list) else output2_data
 
-                def safe_int_convert(value: Any, default: int = 0) -> int:
-                    """안전한 정수 변환"""
-                    if value is None or value == '':
-                        return default
-                    try:
-                        return int(str(value).replace(',', ''))
-                    except (ValueError, TypeError):
-                        return default
-
                 # 💰 매수가능금액 등 주요 정보 추출 (API 문서 기준)
+                amounts = _to_number_column(
+                    pd.Series([summary.get(key, '0') for key in _ACCOUNT_SUMMARY_KEYS]), as_int=True
+                ).tolist()
                 account_summary = {
-                    'dnca_tot_amt': safe_int_convert(summary.get('dnca_tot_amt', '0')),           # 예수금총금액
-                    'nxdy_excc_amt': safe_int_convert(summary.get('nxdy_excc_amt', '0')),        # 🎯 익일정산금액 (실제 매수가능금액!)
-                    'prvs_rcdl_excc_amt': safe_int_convert(summary.get('prvs_rcdl_excc_amt', '0')), # 가수도정산금액 (D+2 예수금)
-                    'tot_evlu_amt': safe_int_convert(summary.get('tot_evlu_amt', '0')),          # 총평가액
-                    'evlu_pfls_smtl_amt': safe_int_convert(summary.get('evlu_pfls_smtl_amt', '0')), # 평가손익합계
-                    'pchs_amt_smtl_amt': safe_int_convert(summary.get('pchs_amt_smtl_amt', '0')),   # 매입금액합계
-                    'evlu_amt_smtl_amt': safe_int_convert(summary.get('evlu_amt_smtl_amt', '0')),   # 평가금액합계
+                    **dict(zip(_ACCOUNT_SUMMARY_KEYS, amounts)),
                     'raw_summary': summary  # 원본 데이터 보관
                 }
 
-                logger.debug(f"✅ 계좌요약: 💰매수가능={account_summary['nxdy_excc_amt']:,}원, "
-                           f"총평가액={account_summary['tot_evlu_amt']:,}원, "
-                           f"평가손익={account_summary['evlu_pfls_smtl_amt']:+,}원")
+                if logger.isEnabledFor(logging.DEBUG):  # 천 단위 서식은 디버그일 때만 계산
+                    logger.debug(f"✅ 계좌요약: 💰매수가능={account_summary['nxdy_excc_amt']:,}원, "
+                               f"총평가액={account_summary['tot_evlu_amt']:,}원, "
+                               f"평가손익={account_summary['evlu_pfls_smtl_amt']:+,}원")
 
             if output1_data:
                 balance_df = pd.DataFrame(output1_data)
-                logger.debug(f"✅ 주식잔고조회 성공: {len(balance_df)}개 종목")
+                # 숫자 컬럼은 여기서 한 번만 변환 (계좌 요약 등 하위 처리에서 재변환하지 않음)
+                for column, as_int in _BALANCE_NUMERIC_COLUMNS.items():
+                    if column in balance_df.columns:
+                        balance_df[column] = _to_number_column(balance_df[column], as_int)
+                logger.debug("✅ 주식잔고조회 성공: %d개 종목", len(balance_df))
                 return balance_df, account_summary
             else:
                 logger.info("📊 보유 종목 없음")
@@ -595,13 +807,38 @@ def get_stock_balance(output_dv: str = "01", tr_cont: str = "",
         return None
 
 
-def get_account_balance() -> Optional[Dict]:
+# 계좌 요약 캐시 (매매 루프에서 몇 초 안에 반복되는 조회는 같은 결과 재사용, 주문/체결 시 무효화)
+_ACCOUNT_BALANCE_TTL = 2.0
+_account_balance_cache = TTLCache(maxsize=1, ttl=_ACCOUNT_BALANCE_TTL)
+
+
+def invalidate_account_balance_cache() -> None:
+    """계좌 요약 캐시 무효화 (주문/체결로 잔고가 바뀐 경우)"""
+    _account_balance_cache.invalidate()
+
+
+def get_account_balance(force_refresh: bool = False) -> Optional[Dict]:
     """
     계좌잔고조회 - 요약 정보 (매수가능금액 포함)
 
+    _ACCOUNT_BALANCE_TTL초 안의 반복 호출은 캐시된 결과의 복사본을 반환합니다 (force_refresh=True면 새로 조회).
+
     Returns:
         계좌 요약 정보 (dnca_tot_amt 매수가능금액 포함)
     """
+    if not force_refresh:
+        cached = _account_balance_cache.get('balance')
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+    base_info = _load_account_balance()
+    if base_info is not None:
+        _account_balance_cache.set('balance', copy.deepcopy(base_info))
+    return base_info
+
+
+def _load_account_balance() -> Optional[Dict]:
+    """계좌잔고조회 후 요약 정보 생성"""
     try:
         result = get_stock_balance()
         if result is None:
@@ -626,53 +863,17 @@ def get_account_balance() -> Optional[Dict]:
             logger.info(f"💰 매수가능금액: {base_info['available_amount']:,}원 (보유종목 없음)")
             return base_info
 
-        # 보유 종목 요약 생성
-        stocks = []
-        total_value = 0
-        total_profit_loss = 0
-
-        def safe_int_balance(value: Any, default: int = 0) -> int:
-            """안전한 정수 변환"""
-            if value is None or value == '':
-                return default
-            try:
-                return int(str(value).replace(',', ''))
-            except (ValueError, TypeError):
-                return default
-
-        def safe_float_balance(value: Any, default: float = 0.0) -> float:
-            """안전한 실수 변환"""
-            if value is None or value == '':
-                return default
-            try:
-                return float(str(value).replace(',', ''))
-            except (ValueError, TypeError):
-                return default
-
-        for _, row in balance_data.iterrows():
-            stock_code = row.get('pdno', '')  # 종목코드
-            stock_name = row.get('prdt_name', '')  # 종목명
-            quantity = safe_int_balance(row.get('hldg_qty', '0'))  # 보유수량
-            avg_price = safe_float_balance(row.get('pchs_avg_pric', '0'))  # 매입평균가
-            current_price = safe_float_balance(row.get('prpr', '0'))  # 현재가
-            eval_amt = safe_int_balance(row.get('evlu_amt', '0'))  # 평가금액
-            profit_loss = safe_int_balance(row.get('evlu_pfls_amt', '0'))  # 평가손익
-            profit_loss_rate = safe_float_balance(row.get('evlu_pfls_rt', '0'))  # 평가손익률
-
-            if quantity > 0:  # 실제 보유 종목만
-                stock_info = {
-                    'stock_code': stock_code,
-                    'stock_name': stock_name,
-                    'quantity': quantity,
-                    'avg_price': avg_price,
-                    'current_price': current_price,
-                    'eval_amount': eval_amt,
-                    'profit_loss': profit_loss,
-                    'profit_loss_rate': profit_loss_rate
-                }
-                stocks.append(stock_info)
-                total_value += eval_amt
-                total_profit_loss += profit_loss
+        # 보유 종목 요약 생성 (get_stock_balance에서 변환된 숫자 컬럼을 numpy 배열로 받아 실제 보유 종목만 추림)
+        labels = balance_data.reindex(columns=['pdno', 'prdt_name']).fillna('')   # 종목코드, 종목명
+        numbers = balance_data.reindex(columns=list(_BALANCE_NUMERIC_COLUMNS), fill_value=0)
+        columns = [labels['pdno'].to_numpy(), labels['prdt_name'].to_numpy()]
+        columns += [numbers[column].to_numpy() for column in _BALANCE_NUMERIC_COLUMNS]
+        held = columns[2] > 0
+        columns = [col[held].tolist() for col in columns]  # numpy 스칼라 대신 파이썬 값
+
+        stocks = [dict(zip(_HOLDING_KEYS, values)) for values in zip(*columns)]
+        total_value = sum(columns[5])
+        total_profit_loss = sum(columns[6])
 
         # 🎯 base_info 업데이트
         base_info.update({
@@ -684,9 +885,10 @@ def get_account_balance() -> Optional[Dict]:
             'inquiry_time': now_kst().strftime('%Y-%m-%d %H:%M:%S')
         })
 
-        logger.debug(f"💰 계좌요약: {len(stocks)}개 종목, 총 {total_value:,}원, "
-                   f"손익 {total_profit_loss:+,}원 ({base_info['total_profit_loss_rate']:+.2f}%), "
-                   f"💰매수가능={base_info['available_amount']:,}원")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"💰 계좌요약: {len(stocks)}개 종목, 총 {total_value:,}원, "
+                       f"손익 {total_profit_loss:+,}원 ({base_info['total_profit_loss_rate']:+.2f}%), "
+                       f"💰매수가능={base_info['available_amount']:,}원")
 
         return base_info
 
@@ -695,15 +897,15 @@ def get_account_balance() -> Optional[Dict]:
         return None
 
 
-def get_existing_holdings() -> List[Dict]:
+def get_existing_holdings(force_refresh: bool = False) -> List[Dict]:
     """
-    기존 보유 종목 조회 (CandleTradeManager용)
+    기존 보유 종목 조회 (CandleTradeManager용, 계좌 요약 캐시 사용)
 
     Returns:
         보유 종목 리스트
     """
     try:
-        account_balance = get_account_balance()
+        account_balance = get_account_balance(force_refresh)
 
         if not account_balance or account_balance['total_stocks'] == 0:
             return []
@@ -719,12 +921,25 @@ def get_existing_holdings() -> List[Dict]:
 # 🎯 종목 정보 조회 API
 # =============================================================================
 
-def get_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
+# 시가총액 캐시 (스크리닝 중 같은 종목 반복 조회는 5분간 재사용, 조회 실패는 캐시하지 않음)
+_MARKET_CAP_TTL = 300.0
+_market_cap_cache = TTLCache(maxsize=4096, ttl=_MARKET_CAP_TTL)
+
+
+def clear_market_cap_cache() -> None:
+    """시가총액 캐시 삭제"""
+    _market_cap_cache.invalidate()
+
+
+def get_stock_market_cap(stock_code: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
     """
     종목의 시가총액 조회 (get_inquire_price의 hts_avls 필드 사용)
+
+    _MARKET_CAP_TTL초 안의 같은 종목 재조회는 캐시된 결과의 복사본을 반환합니다 (force_refresh=True면 새로 조회).
     
     Args:
         stock_code: 종목코드 (6자리)
+        force_refresh: 캐시를 무시하고 새로 조회
         
     Returns:
         Dict: 시가총액 정보
@@ -736,6 +951,19 @@ def get_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
             'market_cap_billion': 시가총액 (억원)
         }
     """
+    if not force_refresh:
+        cached = _market_cap_cache.get(stock_code)
+        if cached is not None:
+            return dict(cached)
+
+    result = _load_stock_market_cap(stock_code)
+    if result is not None:
+        _market_cap_cache.set(stock_code, dict(result))
+    return result
+
+
+def _load_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
+    """현재가 조회 후 시가총액 정보 생성"""
     def safe_int(value: Any, default: int = 0) -> int:
         """안전한 정수 변환"""
         if value is None or value == '':
@@ -753,21 +981,21 @@ def get_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
     
     try:
         # 1. 현재가 조회
-        current_price_data = get_inquire_price(itm_no=stock_code)
-        if current_price_data is None or current_price_data.empty:
+        current_price_data = get_inquire_price(itm_no=stock_code, as_dataframe=False)
+        if not current_price_data:
             logger.error(f"❌ {stock_code} 현재가 조회 실패")
             return None
             
-        current_price_raw = current_price_data.iloc[0].get('stck_prpr', '0')
+        current_price_raw = current_price_data.get('stck_prpr', '0')
         current_price = safe_int(current_price_raw)
-        stock_name = safe_str(current_price_data.iloc[0].get('prdt_name', ''))
+        stock_name = safe_str(current_price_data.get('prdt_name', ''))
         
         if current_price == 0:
             logger.error(f"❌ {stock_code} 현재가 정보 없음 (값: {current_price_raw})")
             return None
         
         # 2. 시가총액 조회 (hts_avls 필드 사용)
-        market_cap_raw = current_price_data.iloc[0].get('hts_avls', '0')
+        market_cap_raw = current_price_data.get('hts_avls', '0')
         market_cap_billion = safe_int(market_cap_raw)  # hts_avls는 이미 억원 단위
         
         if market_cap_billion == 0:
@@ -786,8 +1014,9 @@ def get_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
             'query_time': now_kst().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        logger.debug(f"✅ {stock_code}({stock_name}) 시가총액: {market_cap_billion:,.0f}억원 "
-                   f"(현재가 {current_price:,}원)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"✅ {stock_code}({stock_name}) 시가총액: {market_cap_billion:,.0f}억원 "
+                       f"(현재가 {current_price:,}원)")
         
         return result
         
@@ -796,6 +1025,41 @@ def get_stock_market_cap(stock_code: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+_URL_PSEARCH_RESULT = '/uapi/domestic-stock/v1/quotations/psearch-result'
+_TR_PSEARCH_RESULT = "HHKST03900400"  # 종목조건검색조회
+
+
+def _psearch_params(user_id: str, seq: str) -> Dict[str, str]:
+    """종목조건검색조회 파라미터"""
+    return {
+        "user_id": user_id,    # 사용자 HTS ID
+        "seq": seq             # 사용자조건 키값 (0부터 시작)
+    }
+
+
+def _psearch_to_dataframe(res, seq: str) -> Optional[pd.DataFrame]:
+    """종목조건검색조회 응답을 DataFrame으로 변환 (검색 결과 0건 오류는 빈 DataFrame)"""
+    if res and res.isOK():
+        body = res.getBody()
+        output_data = getattr(body, 'output2', None)  # output2 배열 사용
+
+        if output_data:
+            result_df = pd.DataFrame(output_data)
+            #logger.debug(f"✅ 종목조건검색조회 성공: {len(result_df)}건 (seq={seq})")
+            return result_df
+        else:
+            logger.warning(f"⚠️ 종목조건검색조회: 조건에 맞는 종목 없음 (seq={seq})")
+            return pd.DataFrame()
+
+    error_msg = res.getErrorMessage() if res else "Unknown error"
+    if "종목코드 오류입니다" in error_msg or "MCA05918" in error_msg:
+        logger.info(f"ℹ️ 종목조건검색조회: 검색 결과 0건 (seq={seq})")
+        return pd.DataFrame()
+
+    logger.error(f"❌ 종목조건검색조회 실패 (seq={seq}): {error_msg}")
+    return None
+
+
 def get_psearch_result(user_id: str, seq: str, tr_cont: str = "") -> Optional[pd.DataFrame]:
     """
     종목조건검색조회 API (TR: HHKST03900400)
@@ -818,39 +1082,43 @@ def get_psearch_result(user_id: str, seq: str, tr_cont: str = "") -> Optional[pd
         - trade_amt: 거래대금
         - 등 추가 정보들...
     """
-    url = '/uapi/domestic-stock/v1/quotations/psearch-result'
-    tr_id = "HHKST03900400"  # 종목조건검색조회
-    
-    params = {
-        "user_id": user_id,    # 사용자 HTS ID
-        "seq": seq             # 사용자조건 키값 (0부터 시작)
-    }
-    
     try:
-        logger.debug(f"🔍 종목조건검색조회: user_id={user_id}, seq={seq}")
-        res = kis._url_fetch(url, tr_id, tr_cont, params)
-        
-        if res and res.isOK():
-            body = res.getBody()
-            output_data = getattr(body, 'output2', None)  # output2 배열 사용
-            
-            if output_data:
-                result_df = pd.DataFrame(output_data)
-                #logger.debug(f"✅ 종목조건검색조회 성공: {len(result_df)}건 (seq={seq})")
-                return result_df
-            else:
-                logger.warning(f"⚠️ 종목조건검색조회: 조건에 맞는 종목 없음 (seq={seq})")
-                return pd.DataFrame()
-                
-        else:
-            error_msg = res.getErrorMessage() if res else "Unknown error"
-            if "종목코드 오류입니다" in error_msg or "MCA05918" in error_msg:
-                logger.info(f"ℹ️ 종목조건검색조회: 검색 결과 0건 (seq={seq})")
-                return pd.DataFrame()
-            else:
-                logger.error(f"❌ 종목조건검색조회 실패 (seq={seq}): {error_msg}")
-                return None
-                
+        logger.debug("🔍 종목조건검색조회: user_id=%s, seq=%s", user_id, seq)
+        res = kis._url_fetch(_URL_PSEARCH_RESULT, _TR_PSEARCH_RESULT, tr_cont, _psearch_params(user_id, seq))
+        return _psearch_to_dataframe(res, seq)
+
+    except Exception as e:
+        logger.error(f"❌ 종목조건검색조회 오류 (seq={seq}): {e}")
+        return None
+
+
+async def get_psearch_result_async(session, user_id: str, seq: str, tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """종목조건검색조회 (비동기 - 공유 aiohttp 세션 사용, 결과 형식은 get_psearch_result와 같음)"""
+    try:
+        logger.debug("🔍 종목조건검색조회: user_id=%s, seq=%s", user_id, seq)
+        res = await kis._url_fetch_async(session, _URL_PSEARCH_RESULT, _TR_PSEARCH_RESULT, tr_cont,
+                                         _psearch_params(user_id, seq))
+        return _psearch_to_dataframe(res, seq)
+
     except Exception as e:
         logger.error(f"❌ 종목조건검색조회 오류 (seq={seq}): {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+async def get_psearch_results_async(user_id: str, seqs: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+    """여러 조건검색 결과를 동시에 조회 (seq → 결과 DataFrame, 실패한 조건은 None)"""
+    async with kis.create_async_session() as session:
+        results = await asyncio.gather(
+            *[get_psearch_result_async(session, user_id, seq) for seq in seqs]
+        )
+    return dict(zip(seqs, results))
+
+
+def get_psearch_results(user_id: str, seqs: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    여러 조건검색 결과 일괄 조회 (조건별 요청을 동시에 보냄, 호출 간격은 kis_auth 속도 제한에서 관리)
+
+    Returns:
+        Dict[str, Optional[pd.DataFrame]]: seq → get_psearch_result와 같은 형식의 결과
+    """
+    return run_sync(get_psearch_results_async(user_id, seqs))
@@ -1,10 +1,9 @@
 """
 KIS API 주문 관련 함수 (공식 문서 기반)
 """
-import time
 import pandas as pd
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union, Any
 from utils.logger import setup_logger
 from . import kis_auth as kis
 from utils.korean_time import now_kst
@@ -61,7 +60,8 @@ def _validate_tick_size(price: int) -> bool:
 
 
 def get_order_cash(ord_dv: str = "", itm_no: str = "", qty: int = 0, unpr: int = 0,
-                   tr_cont: str = "", ord_dvsn: str = "00") -> Optional[pd.DataFrame]:
+                   tr_cont: str = "", ord_dvsn: str = "00",
+                   as_dataframe: bool = True) -> Optional[Union[pd.DataFrame, Dict[str, Any]]]:
     """주식주문(현금) - 매수/매도
     
     Args:
@@ -71,6 +71,7 @@ def get_order_cash(ord_dv: str = "", itm_no: str = "", qty: int = 0, unpr: int =
         unpr: 주문단가 (시장가일 때는 0 가능)
         tr_cont: 페이징 제어 값(일반 주문 시 대부분 빈 문자열)
         ord_dvsn: 주문구분 ("00": 지정가, "01": 시장가)
+        as_dataframe: False면 응답 output을 DataFrame 변환 없이 dict로 반환
     """
     '''
         EXCG_ID_DVSN_CD	거래소ID구분코드	String	N	3	한국거래소 : KRX
@@ -125,7 +126,10 @@ def get_order_cash(ord_dv: str = "", itm_no: str = "", qty: int = 0, unpr: int =
     res = kis._url_fetch(url, tr_id, tr_cont, params, postFlag=True)
 
     if res and res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        output = res.getBody().output
+        if not as_dataframe:
+            return dict(output)
+        current_data = pd.DataFrame(output, index=[0])
         return current_data
     else:
         if res:
@@ -135,8 +139,9 @@ def get_order_cash(ord_dv: str = "", itm_no: str = "", qty: int = 0, unpr: int =
 
 def get_order_rvsecncl(ord_orgno: str = "", orgn_odno: str = "", ord_dvsn: str = "",
                        rvse_cncl_dvsn_cd: str = "", ord_qty: int = 0, ord_unpr: int = 0,
-                       qty_all_ord_yn: str = "", tr_cont: str = "") -> Optional[pd.DataFrame]:
-    """주식주문(정정취소) - 신 TR ID 사용"""
+                       qty_all_ord_yn: str = "", tr_cont: str = "",
+                       as_dataframe: bool = True) -> Optional[Union[pd.DataFrame, Dict[str, Any]]]:
+    """주식주문(정정취소) - 신 TR ID 사용 (as_dataframe=False면 output을 dict로 반환)"""
     url = '/uapi/domestic-stock/v1/trading/order-rvsecncl'
     tr_id = "TTTC0013U"  # 🆕 신 TR ID (구: TTTC0803U)
 
@@ -183,7 +188,10 @@ def get_order_rvsecncl(ord_orgno: str = "", orgn_odno: str = "", ord_dvsn: str =
     res = kis._url_fetch(url, tr_id, tr_cont, params, postFlag=True)
 
     if res and res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        output = res.getBody().output
+        if not as_dataframe:
+            return dict(output)
+        current_data = pd.DataFrame(output, index=[0])
         return current_data
     else:
         if res:
@@ -229,8 +237,7 @@ def get_inquire_psbl_rvsecncl_lst(tr_cont: str = "", FK100: str = "", NK100: str
         logger.debug("정정취소가능주문조회 완료")
         return dataframe
     elif tr_cont in ("F", "M"):  # 다음 페이지 존재
-        logger.debug("다음 페이지 조회 중...")
-        time.sleep(0.1)  # 시스템 안정성을 위한 지연
+        logger.debug("다음 페이지 조회 중...")  # 호출 간격은 kis_auth 토큰 버킷이 관리
         return get_inquire_psbl_rvsecncl_lst("N", FK100, NK100, dataframe)
 
     return dataframe
@@ -339,8 +346,7 @@ def get_inquire_daily_ccld_lst(dv: str = "01", inqr_strt_dt: str = "", inqr_end_
         logger.debug("주식일별주문체결조회 완료")
         return dataframe
     elif tr_cont in ("F", "M"):  # 다음 페이지 존재
-        logger.debug("다음 페이지 조회 중...")
-        time.sleep(0.1)
+        logger.debug("다음 페이지 조회 중...")  # 호출 간격은 kis_auth 토큰 버킷이 관리
         return get_inquire_daily_ccld_lst(dv, inqr_strt_dt, inqr_end_dt, ccld_dvsn, "N", FK100, NK100, dataframe)
 
     return dataframe
\ No newline at end of file
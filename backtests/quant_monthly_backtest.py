@@ -3,24 +3,35 @@
 - 매월 말 상위 포트폴리오 50개를 동일비중 보유
 - 다음 달 말 수익률로 리밸런싱
 - 벤치마크: KOSPI (지수 데이터 조회 함수가 있다면 비교, 없으면 포트 수익률만 계산)
-주의: 실제 실행 시 API 호출 비용이 큽니다. 필요 시 캐시/DB 기반으로 교체하세요.
+주의: 첫 실행 시 API 호출 비용이 큽니다. 지난 날짜 기준 일봉은 cache/backtest_ohlcv에 저장해 재실행 시 재사용합니다.
 """
 from __future__ import annotations
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
 from typing import List, Dict, Optional
 import pandas as pd
 
 from utils.logger import setup_logger
-from utils.korean_time import now_kst
+from utils.korean_time import now_kst, parse_yyyymmdd
+from api import kis_market_api
 from api.kis_api_manager import KISAPIManager
+from api.kis_cache import FileCache
 from db.database_manager import DatabaseManager
 from core.quant.quant_screening_service import QuantScreeningService
 
 
 logger = setup_logger(__name__)
 
+# 기준일 이전 일봉 캐시 (지난 봉은 바뀌지 않으므로 90일 보관)
+_OHLCV_CACHE = FileCache(Path("cache/backtest_ohlcv"), ttl_seconds=90 * 24 * 60 * 60)
+
+# 종목별 가격 조회 동시 실행 수 (초당 호출 수는 kis_auth 공유 토큰 버킷이 제한)
+_PRICE_FETCH_WORKERS = 8
+
 
 @dataclass
 class PortfolioPosition:
@@ -30,11 +41,51 @@ class PortfolioPosition:
 
 
 def month_ends_between(start: str, end: str) -> List[str]:
-    dates = pd.date_range(start=start, end=end, freq="B")
-    df = pd.DataFrame({"d": dates})
-    df["ym"] = df["d"].dt.to_period("M")
-    last_days = df.groupby("ym")["d"].max().dt.strftime("%Y%m%d").tolist()
-    return last_days
+    """구간 내 월별 마지막 영업일 (마지막 달이 진행 중이면 end 이전 마지막 영업일)"""
+    idx = pd.date_range(start=start, end=end, freq="BME")
+    last_bday = pd.offsets.BDay().rollback(pd.Timestamp(end))
+    if last_bday >= pd.Timestamp(start) and (idx.empty or idx[-1] != last_bday):
+        idx = idx.append(pd.DatetimeIndex([last_bday]))
+    return idx.strftime("%Y%m%d").tolist()
+
+
+def _cached_ohlcv(code: str, freq: str, count: int, asof_dt: str) -> Optional[pd.DataFrame]:
+    """
+    asof_dt(YYYYMMDD)까지의 최근 count 캘린더일 일봉 (날짜 오름차순)
+
+    오늘 이전 기준일 결과는 (code, freq, count, asof_dt) 키로 디스크에 캐시합니다.
+    """
+    key = f"{code}_{freq}_{count}_{asof_dt}"
+    cached = _OHLCV_CACHE.get(freq, key)
+    if cached is not None:
+        return cached
+
+    start_dt = (parse_yyyymmdd(asof_dt) - timedelta(days=count)).strftime("%Y%m%d")
+    df = kis_market_api.get_inquire_daily_itemchartprice(
+        output_dv="2", div_code="J", itm_no=code,
+        inqr_strt_dt=start_dt, inqr_end_dt=asof_dt, period_code=freq
+    )
+    if df is None or df.empty or "stck_bsop_date" not in df.columns:
+        return None
+
+    df = df.sort_values("stck_bsop_date", ignore_index=True)
+    if asof_dt < now_kst().strftime("%Y%m%d"):
+        _OHLCV_CACHE.set(freq, key, df)
+    return df
+
+
+def _last_closes(codes: List[str], count: int, asof_dt: str) -> List[Optional[float]]:
+    """종목별 asof_dt 기준 마지막 종가를 스레드 풀에서 동시에 조회 (입력 순서 유지, 없으면 None)"""
+    def fetch_last(code: str) -> Optional[float]:
+        df = _cached_ohlcv(code, "D", count, asof_dt)
+        if df is None or df.empty:
+            return None
+        return float(df["stck_clpr"].astype(float).iloc[-1])
+
+    if not codes:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_PRICE_FETCH_WORKERS, len(codes))) as executor:
+        return list(executor.map(fetch_last, codes))
 
 
 def run_monthly_backtest(start_date: str, end_date: str, top_n: int = 50) -> Dict[str, float]:
@@ -53,12 +104,10 @@ def run_monthly_backtest(start_date: str, end_date: str, top_n: int = 50) -> Dic
         if i > 0 and portfolio:
             # 다음 달 말 가격으로 수익 계산
             total = 0.0
-            for pos in portfolio:
-                df = api.get_ohlcv_data(pos.stock_code, "D", 35)  # 최근 한달
-                if df is None or df.empty:
+            prices = _last_closes([pos.stock_code for pos in portfolio], 35, dt)  # 해당 월 말 기준 최근 한달
+            for pos, price in zip(portfolio, prices):
+                if price is None:
                     price = pos.entry_price
-                else:
-                    price = float(df["stck_clpr"].astype(float).iloc[-1])
                 total += (price / pos.entry_price) * pos.weight
             capital *= total
             equity_curve.append({"date": dt, "capital": capital})
@@ -72,13 +121,9 @@ def run_monthly_backtest(start_date: str, end_date: str, top_n: int = 50) -> Dic
 
         weight = 1.0 / len(rows)
         new_portfolio: List[PortfolioPosition] = []
-        for row in rows:
-            code = row["stock_code"]
-            df = api.get_ohlcv_data(code, "D", 5)
-            if df is None or df.empty:
-                continue
-            entry = float(df["stck_clpr"].astype(float).iloc[-1])
-            if entry <= 0:
+        codes = [row["stock_code"] for row in rows]
+        for code, entry in zip(codes, _last_closes(codes, 5, dt)):
+            if entry is None or entry <= 0:
                 continue
             new_portfolio.append(PortfolioPosition(code, weight, entry))
         portfolio = new_portfolio
@@ -2,12 +2,13 @@
 """
 최근 며칠간 데이터 수집 상태 확인 스크립트
 """
+import os
 import sqlite3
 import pickle
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import sys
 
 # 프로젝트 루트를 sys.path에 추가
@@ -19,39 +20,36 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+MINUTE_CACHE_DIR = project_root / "cache" / "minute_data"
+DAILY_CACHE_DIR = project_root / "cache" / "daily"
+
 
 def get_recent_candidate_stocks(db_path: str, days: int = 7) -> Dict[str, List[Dict[str, str]]]:
     """최근 며칠간의 후보 종목 조회"""
     try:
         today = now_kst().date()
+        start_date = today - timedelta(days=days - 1)
         results = {}
-        
+
+        # 기간 전체를 한 번에 조회한 뒤 날짜별로 묶음 (날짜마다 쿼리하지 않음)
         with sqlite3.connect(db_path) as conn:
-            for i in range(days):
-                target_date = today - timedelta(days=i)
-                target_date_str = target_date.strftime('%Y-%m-%d')
-                
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT DISTINCT stock_code, stock_name, selection_date, score
-                    FROM candidate_stocks
-                    WHERE DATE(selection_date) = ?
-                    ORDER BY score DESC
-                ''', (target_date_str,))
-                
-                rows = cursor.fetchall()
-                candidates = []
-                for row in rows:
-                    candidates.append({
-                        'stock_code': row[0].zfill(6),
-                        'stock_name': row[1],
-                        'selection_date': row[2],
-                        'score': row[3]
-                    })
-                
-                if candidates:
-                    results[target_date_str] = candidates
-        
+            df = pd.read_sql_query('''
+                SELECT DISTINCT stock_code, stock_name, selection_date, score,
+                       DATE(selection_date) AS d
+                FROM candidate_stocks
+                WHERE DATE(selection_date) BETWEEN ? AND ?
+                ORDER BY d DESC, score DESC
+            ''', conn, params=(start_date.isoformat(), today.isoformat()))
+
+        if df.empty:
+            return results
+
+        df['stock_code'] = df['stock_code'].astype(str).str.zfill(6)
+        for target_date_str, group in df.groupby('d', sort=False):
+            results[target_date_str] = group[
+                ['stock_code', 'stock_name', 'selection_date', 'score']
+            ].to_dict('records')
+
         return results
             
     except Exception as e:
@@ -59,14 +57,33 @@ def get_recent_candidate_stocks(db_path: str, days: int = 7) -> Dict[str, List[D
         return {}
 
 
-def check_minute_data(stock_code: str, date_str: str) -> Tuple[bool, int, str]:
-    """분봉 데이터 확인"""
+def list_cache_files(cache_dir: Path) -> Set[str]:
+    """캐시 디렉토리 파일명 목록 (디렉토리를 한 번만 읽어 종목별 exists() 호출을 대체)"""
     try:
-        minute_cache_dir = project_root / "cache" / "minute_data"
-        cache_file = minute_cache_dir / f"{stock_code}_{date_str}.pkl"
+        with os.scandir(cache_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def check_minute_data(stock_code: str, date_str: str,
+                      existing_files: Optional[Set[str]] = None,
+                      count_rows: bool = True) -> Tuple[bool, int, str]:
+    """
+    분봉 데이터 확인
+
+    existing_files: list_cache_files()로 미리 읽은 파일명 목록 (없으면 파일마다 확인)
+    count_rows: False면 파일 존재 여부만 확인하고 로드하지 않음
+    """
+    try:
+        file_name = f"{stock_code}_{date_str}.pkl"
+        cache_file = MINUTE_CACHE_DIR / file_name
         
-        if not cache_file.exists():
+        exists = file_name in existing_files if existing_files is not None else cache_file.exists()
+        if not exists:
             return False, 0, "파일 없음"
+        if not count_rows:
+            return True, 0, "파일 있음"
         
         with open(cache_file, 'rb') as f:
             df = pickle.load(f)
@@ -88,13 +105,15 @@ def check_minute_data(stock_code: str, date_str: str) -> Tuple[bool, int, str]:
         return False, 0, f"오류: {e}"
 
 
-def check_daily_data(stock_code: str, date_str: str) -> Tuple[bool, int, str]:
-    """일봉 데이터 확인"""
+def check_daily_data(stock_code: str, date_str: str,
+                     existing_files: Optional[Set[str]] = None) -> Tuple[bool, int, str]:
+    """일봉 데이터 확인 (existing_files: list_cache_files()로 미리 읽은 파일명 목록)"""
     try:
-        daily_cache_dir = project_root / "cache" / "daily"
-        cache_file = daily_cache_dir / f"{stock_code}_{date_str}_daily.pkl"
+        file_name = f"{stock_code}_{date_str}_daily.pkl"
+        cache_file = DAILY_CACHE_DIR / file_name
         
-        if not cache_file.exists():
+        exists = file_name in existing_files if existing_files is not None else cache_file.exists()
+        if not exists:
             return False, 0, "파일 없음"
         
         with open(cache_file, 'rb') as f:
@@ -139,7 +158,14 @@ def check_recent_data_collection(days: int = 7):
     
     print(f"\n[확인 기간] 최근 {days}일")
     print(f"[발견된 날짜] {len(date_candidates)}일\n")
-    
+
+    # 날짜별 (분봉 OK, 일봉 OK) 수 - 전체 요약에서 재사용
+    date_summary: Dict[str, Tuple[int, int]] = {}
+
+    # 캐시 디렉토리는 한 번만 읽음
+    minute_files = list_cache_files(MINUTE_CACHE_DIR)
+    daily_files = list_cache_files(DAILY_CACHE_DIR)
+
     # 날짜별로 확인
     for date_str in sorted(date_candidates.keys(), reverse=True):
         candidates = date_candidates[date_str]
@@ -159,12 +185,12 @@ def check_recent_data_collection(days: int = 7):
             stock_name = candidate['stock_name']
             
             # 분봉 데이터 확인
-            minute_exists, minute_count, minute_info = check_minute_data(stock_code, date_ymd)
+            minute_exists, minute_count, minute_info = check_minute_data(stock_code, date_ymd, minute_files)
             if minute_exists and minute_count > 0:
                 minute_ok += 1
             
             # 일봉 데이터 확인
-            daily_exists, daily_count, daily_info = check_daily_data(stock_code, date_ymd)
+            daily_exists, daily_count, daily_info = check_daily_data(stock_code, date_ymd, daily_files)
             if daily_exists:
                 daily_ok += 1
             
@@ -188,6 +214,8 @@ def check_recent_data_collection(days: int = 7):
             print(f"    분봉: {minute_status} {result['minute_info']}")
             print(f"    일봉: {daily_status} {result['daily_info']}")
         
+        date_summary[date_str] = (minute_ok, daily_ok)
+
         # 요약
         print(f"\n  [요약] 분봉: {minute_ok}/{len(candidates)}개 ({minute_ok/len(candidates)*100:.1f}%), 일봉: {daily_ok}/{len(candidates)}개 ({daily_ok/len(candidates)*100:.1f}%)")
         
@@ -216,22 +244,7 @@ def check_recent_data_collection(days: int = 7):
     # 날짜별 통계
     for date_str in sorted(date_candidates.keys(), reverse=True):
         candidates = date_candidates[date_str]
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        date_ymd = date_obj.strftime('%Y%m%d')
-        
-        minute_ok = 0
-        daily_ok = 0
-        
-        for candidate in candidates:
-            stock_code = candidate['stock_code']
-            minute_exists, minute_count, _ = check_minute_data(stock_code, date_ymd)
-            daily_exists, _, _ = check_daily_data(stock_code, date_ymd)
-            
-            if minute_exists and minute_count > 0:
-                minute_ok += 1
-            if daily_exists:
-                daily_ok += 1
-        
+        minute_ok, daily_ok = date_summary[date_str]
         print(f"  {date_str}: 분봉 {minute_ok}/{len(candidates)}, 일봉 {daily_ok}/{len(candidates)}")
     
     print("=" * 80)
@@ -229,7 +229,7 @@ class MLDataCollector:
             self.logger.info(f"📊 [{stock_code}] 재무 데이터 수집 시작")
             
             # 재무비율 데이터 조회
-            financial_ratios = get_financial_ratio(stock_code, div_cls="0")  # 연간/분기 데이터
+            financial_ratios = get_financial_ratio(stock_code, div_cls="0", keep_raw=True)  # 연간/분기 데이터 (PER/PBR 등은 raw에서 추출)
             income_statements = get_income_statement(stock_code, div_cls="0")  # 연간/분기 데이터
             
             if not financial_ratios and not income_statements:
@@ -379,15 +379,16 @@ class OrderManager:
             
             self.logger.debug(f"🔍 오탐지 복구 체크: 최근 완료된 {len(recent_completed)}건 확인")
             
+            # API에서 실제 상태 일괄 재확인 (미체결/체결 내역 조회 1회씩)
+            loop = asyncio.get_event_loop()
+            statuses = await loop.run_in_executor(
+                self.executor,
+                self.api_manager.get_order_statuses,
+                [order.order_id for order in recent_completed]
+            )
+            
             for order in recent_completed:
-                # API에서 실제 상태 재확인
-                loop = asyncio.get_event_loop()
-                status_data = await loop.run_in_executor(
-                    self.executor,
-                    self.api_manager.get_order_status,
-                    order.order_id
-                )
-                
+                status_data = statuses.get(order.order_id)
                 if status_data:
                     # 실제로는 미체결인지 확인
                     try:
@@ -541,6 +542,8 @@ class OrderManager:
                     
                     order.status = OrderStatus.FILLED
                     self._move_to_completed(order_id)
+                    self.api_manager.invalidate_tradable_amount_cache()
+                    self.api_manager.invalidate_account_balance_cache()
                     self.logger.info(f"✅ 주문 완전 체결 확정: {order_id} ({order.stock_code}) - {filled_qty}주")
                     
                     # 🆕 TradingStockManager에 즉시 알림 (콜백)
@@ -264,10 +264,11 @@ class QuantRebalancingService:
     def _estimate_total_portfolio_value(self, holdings: List[Dict[str, Any]]) -> float:
         """총 포트폴리오 가치 추정"""
         try:
-            # 보유 종목 가치
+            # 보유 종목 가치 (멀티종목 시세로 일괄 조회)
+            prices = self.api_manager.get_current_prices([h['stock_code'] for h in holdings])
             holdings_value = 0.0
             for holding in holdings:
-                current_price_data = self.api_manager.get_current_price(holding['stock_code'])
+                current_price_data = prices.get(holding['stock_code'])
                 if current_price_data:
                     holdings_value += current_price_data.current_price * holding['quantity']
             
@@ -535,16 +535,18 @@ class DayTradingBot:
             
             self.logger.info(f"🔄 리밸런싱 실행: 매도 {len(sell_list)}개, 매수 {len(buy_list)}개")
             
-            # 1단계: 매도 주문 (시장가 전량)
+            # 1단계: 매도 주문 (시장가 전량) - 현재가는 멀티종목 시세로 한 번에 조회
             sell_results = []
+            sell_prices = await self.api_manager.get_current_prices_async(
+                [item['stock_code'] for item in sell_list])
             for sell_item in sell_list:
                 stock_code = sell_item['stock_code']
                 quantity = sell_item['quantity']
                 stock_name = sell_item.get('stock_name', stock_code)
                 
                 try:
-                    # 현재가 조회 (시장가 매도용)
-                    current_price_data = self.api_manager.get_current_price(stock_code)
+                    # 현재가 (시장가 매도용)
+                    current_price_data = sell_prices.get(stock_code)
                     if not current_price_data:
                         self.logger.error(f"❌ {stock_code} 현재가 조회 실패")
                         continue
@@ -594,16 +596,18 @@ class DayTradingBot:
                 self.logger.info(f"⏳ 매도 주문 체결 확인 중... (최대 5분)")
                 await self._wait_for_sell_orders_completion(sell_results, max_wait_seconds=300)
             
-            # 2단계: 매수 주문 (동등 비중, 시장가)
+            # 2단계: 매수 주문 (동등 비중, 시장가) - 매도 체결 대기 후 현재가 일괄 조회
             buy_results = []
+            buy_prices = await self.api_manager.get_current_prices_async(
+                [item['stock_code'] for item in buy_list])
             for buy_item in buy_list:
                 stock_code = buy_item['stock_code']
                 target_amount = buy_item['target_amount']
                 stock_name = buy_item.get('stock_name', stock_code)
                 
                 try:
-                    # 현재가 조회
-                    current_price_data = self.api_manager.get_current_price(stock_code)
+                    # 현재가
+                    current_price_data = buy_prices.get(stock_code)
                     if not current_price_data:
                         self.logger.error(f"❌ {stock_code} 현재가 조회 실패")
                         continue
@@ -1129,13 +1133,11 @@ class DayTradingBot:
             while (now_kst() - start_time).total_seconds() < max_wait_seconds:
                 all_filled = True
                 
+                # 대기 중인 주문 상태를 한 번에 조회 (미체결/체결 내역 조회를 주문마다 반복하지 않음)
+                statuses = self.api_manager.get_order_statuses([r['order_id'] for r in pending_orders])
+                
                 for result in pending_orders:
-                    order_id = result.get('order_id')
-                    if not order_id:
-                        continue
-                    
-                    # 주문 상태 확인
-                    status_data = self.api_manager.get_order_status(order_id)
+                    status_data = statuses.get(result['order_id'])
                     if status_data:
                         filled_qty = int(str(status_data.get('tot_ccld_qty', 0)).replace(',', '').strip() or 0)
                         remaining_qty = int(str(status_data.get('rmn_qty', 0)).replace(',', '').strip() or 0)
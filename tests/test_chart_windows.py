@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from api.kis_market_api import _split_chart_windows
+
+
+def test_daily_windows_stop_at_needed_weekdays():
+    # 50건이면 평일 53일(휴장일 여유 포함)만 한 구간으로 조회
+    assert _split_chart_windows("20230101", datetime(2024, 6, 14), 'D', 50) == [("20240403", "20240614")]
+
+    # 200건이면 꽉 찬 구간 2개 + 남은 평일만큼 줄인 마지막 구간
+    windows = _split_chart_windows("20230101", datetime(2024, 6, 14), 'D', 200)
+    assert windows == [("20240127", "20240614"), ("20230909", "20240126"), ("20230825", "20230908")]
+
+
+def test_daily_windows_respect_start_date():
+    assert _split_chart_windows("20240601", datetime(2024, 6, 14), 'D', 200) == [("20240601", "20240614")]
@@ -0,0 +1,23 @@
+from api.kis_cache import FileCache
+
+
+def test_file_cache_roundtrip_and_expiry(tmp_path):
+    cache = FileCache(base_dir=tmp_path, ttl_seconds=60)
+    key = FileCache.make_key('/finance/ratio', 'FHKST66430300',
+                             {'FID_INPUT_ISCD': '005930', 'FID_DIV_CLS_CODE': '0'})
+
+    assert cache.get('FHKST66430300', key) is None
+
+    cache.set('FHKST66430300', key, [{'stac_yymm': '202406'}])
+    assert cache.get('FHKST66430300', key) == [{'stac_yymm': '202406'}]
+    assert (tmp_path / 'FHKST66430300' / f'{key}.pkl').exists()
+
+    # 파라미터 순서가 달라도 같은 키
+    assert key == FileCache.make_key('/finance/ratio', 'FHKST66430300',
+                                     {'FID_DIV_CLS_CODE': '0', 'FID_INPUT_ISCD': '005930'})
+
+    # TTL 경과 시 만료
+    assert cache.get('FHKST66430300', key, ttl=0) is None
+
+    cache.clear('FHKST66430300')
+    assert cache.get('FHKST66430300', key) is None
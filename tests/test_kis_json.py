@@ -0,0 +1,21 @@
+import json
+
+from api.kis_auth import _json_dumps, _json_loads
+
+
+# 기간별시세 응답 형태 (숫자도 문자열, 한글 메시지 포함)
+_PAYLOAD = (
+    '{"rt_cd":"0","msg_cd":"MCA00000","msg1":"정상처리 되었습니다.",'
+    '"output1":{"hts_kor_isnm":"삼성전자","stck_prpr":"71200"},'
+    '"output2":[{"stck_bsop_date":"20240614","stck_clpr":"71200","acml_vol":"12345678"},'
+    '{"stck_bsop_date":"20240613","stck_clpr":"-0.5","acml_vol":""}]}'
+).encode('utf-8')
+
+
+def test_json_loads_matches_stdlib():
+    assert _json_loads(_PAYLOAD) == json.loads(_PAYLOAD)
+
+
+def test_json_dumps_round_trip_is_compact_utf8():
+    data = json.loads(_PAYLOAD)
+    assert _json_dumps(data) == _PAYLOAD
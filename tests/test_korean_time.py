@@ -0,0 +1,15 @@
+from datetime import datetime
+
+import pytest
+
+from utils.korean_time import parse_yyyymmdd
+
+
+def test_parse_yyyymmdd_matches_strptime():
+    assert parse_yyyymmdd("20240115") == datetime.strptime("20240115", "%Y%m%d")
+
+
+@pytest.mark.parametrize("value", ["20240115xyz", "2024011", "2024-1-1", "20241345"])
+def test_parse_yyyymmdd_rejects_malformed(value):
+    with pytest.raises(ValueError):
+        parse_yyyymmdd(value)
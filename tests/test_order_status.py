@@ -0,0 +1,51 @@
+from api.kis_api_manager import OrderStatus
+
+
+def test_order_status_supports_dict_access():
+    record = {'ord_dvsn': '01', 'pdno': '005930', 'ord_tmd': '090001', 'ord_qty': '99'}
+    status = OrderStatus.from_record('0001', record, tot_ccld_qty=3, rmn_qty=7, ord_qty=10)
+
+    # 상태 필드는 속성 값, 그 외 필드는 원본 레코드에서 조회
+    assert status['tot_ccld_qty'] == status.tot_ccld_qty == 3
+    assert status.get('ord_qty') == 10
+    assert status.get('ord_tmd') == '090001'
+    assert status.get('missing', 'N/A') == 'N/A'
+    assert 'ord_tmd' in status
+    assert status.get('actual_unfilled') is False
+
+    data = status.to_dict()
+    assert data['odno'] == '0001'
+    assert data['ord_qty'] == 10
+    assert data['pdno'] == '005930'
+
+    # KIS 형식으로 보낼 때만 수량을 문자열로 변환
+    assert status.to_kis_dict()['rmn_qty'] == '7'
+
+
+def test_get_order_statuses_fetches_fills_once():
+    import pandas as pd
+    from api.kis_api_manager import KISAPIManager
+
+    manager = KISAPIManager()
+    fetch_count = []
+    manager._pending_orders_index = lambda: {
+        'A': {'odno': 'A', 'ord_qty': '10', 'rmn_qty': '10'},   # 전량 미체결
+        'B': {'odno': 'B', 'ord_qty': '10', 'rmn_qty': '4'},    # 부분 체결
+    }
+
+    def fake_daily_fills():
+        fetch_count.append(1)
+        return pd.DataFrame({'odno': ['B', 'C', 'C'],
+                             'tot_ccld_qty': ['6', '3', '7'],
+                             'ord_qty': ['10', '10', '10']})
+
+    manager._fetch_daily_fills = fake_daily_fills
+
+    statuses = manager.get_order_statuses(['A', 'B', 'C', 'D'])
+    manager.shutdown()
+
+    assert len(fetch_count) == 1
+    assert (statuses['A'].tot_ccld_qty, statuses['A'].rmn_qty) == (0, 10)
+    assert (statuses['B'].tot_ccld_qty, statuses['B'].rmn_qty) == (6, 4)
+    assert (statuses['C'].tot_ccld_qty, statuses['C'].rmn_qty) == (10, 0)
+    assert statuses['D'].status_unknown
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.rate_limiter import TokenBucket
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=20, period=1.0, capacity=2)
+
+    # 용량만큼은 즉시 통과
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+
+    # 이후에는 보충 속도(초당 20개)에 맞춰 대기
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert waited > 0
+    assert time.monotonic() - start >= waited * 0.9
+
+
+def test_token_bucket_async_respects_rate():
+    bucket = TokenBucket(rate=50, period=1.0, capacity=1)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*[bucket.acquire_async() for _ in range(6)])
+        return time.monotonic() - start
+
+    # 첫 토큰 즉시 + 나머지 5개는 20ms 간격
+    elapsed = asyncio.run(run())
+    assert elapsed >= 0.09
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
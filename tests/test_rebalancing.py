@@ -8,6 +8,9 @@ class DummyAPI:
     def get_current_price(self, code: str):
         return types.SimpleNamespace(current_price=10_000)
 
+    def get_current_prices(self, codes):
+        return {code: self.get_current_price(code) for code in codes}
+
 
 class DummyOrderManager:
     def place_sell_order(self, stock_code: str, quantity: int, price_type: str = "market"):
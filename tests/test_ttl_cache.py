@@ -0,0 +1,49 @@
+from utils.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=30, timer=timer)
+
+    cache.set(("005930", 70000), 10)
+    assert cache.get(("005930", 70000)) == 10
+
+    timer.now = 30.0
+    assert cache.get(("005930", 70000)) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_lru_and_invalidates():
+    cache = TTLCache(maxsize=2, ttl=30)
+
+    cache.set(("A", 1), 1)
+    cache.set(("B", 1), 2)
+    cache.get(("A", 1))        # A를 최근 사용으로 갱신
+    cache.set(("C", 1), 3)     # 가장 오래된 B 제거
+
+    assert ("B", 1) not in cache
+    assert ("A", 1) in cache
+
+    assert cache.invalidate(lambda key: key[0] == "A") == 1
+    assert ("A", 1) not in cache
+    assert cache.invalidate() == 1
+
+
+def test_ttl_cache_per_entry_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=1, timer=timer)
+
+    cache.set("price", 1)
+    cache.set("master", 2, ttl=60)
+
+    timer.now = 5.0
+    assert cache.get("price") is None
+    assert cache.get("master") == 2
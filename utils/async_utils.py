@@ -0,0 +1,26 @@
+"""
+비동기 실행 유틸리티
+동기 코드에서 코루틴을 안전하게 실행하기 위한 헬퍼
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    동기 코드에서 코루틴 실행
+
+    실행 중인 이벤트 루프가 없으면 asyncio.run()으로 실행하고,
+    이미 이벤트 루프 스레드 안에서 호출된 경우(main 루프에서 동기 API 호출 등)에는
+    별도 스레드에서 새 루프를 만들어 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-sync") as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -72,4 +72,11 @@ else:
 
     def get_market_status() -> str:
         """시장 상태 반환 (KRX 기준, 특수일 자동 반영)"""
-        return MarketHours.get_market_status('KRX')
\ No newline at end of file
+        return MarketHours.get_market_status('KRX')
+
+
+def parse_yyyymmdd(date_str: str) -> datetime:
+    """'YYYYMMDD' 문자열을 datetime으로 변환 (strptime보다 빠름, 잘못된 값은 ValueError)"""
+    if len(date_str) != 8 or not (date_str.isascii() and date_str.isdigit()):
+        raise ValueError(f"YYYYMMDD 형식이 아닌 날짜: {date_str!r}")
+    return datetime(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
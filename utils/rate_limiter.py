@@ -0,0 +1,73 @@
+"""
+API 호출 속도 제한 유틸리티
+동기 스레드와 asyncio 코루틴이 함께 사용할 수 있는 토큰 버킷
+"""
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    period초마다 rate개의 토큰이 채워지며, 최대 capacity개까지 누적됩니다.
+    호출 시 토큰을 먼저 예약(잔량이 음수가 될 수 있음)하고 필요한 만큼만 대기하므로
+    락은 예약 계산 동안만 잡고, 실제 대기는 락 밖에서 수행합니다.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, capacity: Optional[float] = None):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate와 period는 0보다 커야 합니다")
+
+        self._lock = threading.Lock()
+        self._fill_rate = rate / period  # 초당 토큰 보충량
+        self._capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+
+    @property
+    def rate_per_second(self) -> float:
+        return self._fill_rate
+
+    def set_rate(self, rate: float, period: float = 1.0, capacity: Optional[float] = None) -> None:
+        """속도 제한 변경"""
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate와 period는 0보다 커야 합니다")
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._fill_rate = rate / period
+            if capacity is not None:
+                self._capacity = float(capacity)
+            self._tokens = min(self._tokens, self._capacity)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._fill_rate)
+            self._last_refill = now
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._fill_rate
+
+    def acquire(self) -> float:
+        """토큰 획득 (동기 - 필요 시 현재 스레드 대기). 대기한 시간(초) 반환"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """토큰 획득 (비동기 - 이벤트 루프를 막지 않고 대기). 대기한 시간(초) 반환"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
@@ -0,0 +1,69 @@
+"""
+TTL 캐시 유틸리티
+항목별 만료 시간을 갖는 스레드 안전한 메모리 캐시 (cachetools.TTLCache 대체)
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    항목별 TTL을 갖는 LRU 캐시
+
+    저장 후 ttl초가 지나면 만료되며, maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    시각은 time.monotonic() 기준입니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0,
+                 timer: Callable[[], float] = time.monotonic):
+        if maxsize <= 0 or ttl <= 0:
+            raise ValueError("maxsize와 ttl은 0보다 커야 합니다")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (만료 시각, 값)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값 반환 (없으면 default)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (TTL 갱신, ttl을 주면 이 항목에만 해당 만료 시간 적용)"""
+        with self._lock:
+            self._data[key] = (self._timer() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """항목 무효화 (predicate가 없으면 전체). 제거한 항목 수 반환"""
+        with self._lock:
+            if predicate is None:
+                count = len(self._data)
+                self._data.clear()
+                return count
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)